@@ -0,0 +1,208 @@
+"""
+Shared helpers for the asabaal-utils benchmark scripts.
+
+Benchmarks synthesize their own media with FFmpeg's lavfi sources, so they
+can run anywhere FFmpeg is installed without any test footage. Every case is
+run in a fresh worker process, which makes the reported peak memory belong to
+that case alone.
+"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+# Try to import psutil, but don't fail if not available
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+def synthesize_media(
+    output_file: str,
+    duration: float,
+    muted: Sequence[Tuple[float, float]] = (),
+    video_filter: str = "testsrc=size=320x240:rate=25",
+    frequency: float = 440.0,
+) -> None:
+    """
+    Create a test clip with a tone that is muted during the given intervals.
+
+    Args:
+        output_file: Path of the clip to create.
+        duration: Duration of the clip in seconds.
+        muted: (start, end) intervals in seconds where the audio is pure silence.
+        video_filter: lavfi video source, or None for an audio-only clip.
+        frequency: Frequency of the tone in Hz.
+    """
+    audio_filter = f"sine=frequency={frequency}:sample_rate=48000:duration={duration}"
+    if muted:
+        gates = "+".join(f"between(t,{start:.6f},{end:.6f})" for start, end in muted)
+        audio_filter += f",volume=enable='{gates}':volume=0"
+
+    cmd = ["ffmpeg", "-v", "error", "-y"]
+    if video_filter:
+        cmd += ["-f", "lavfi", "-i", f"{video_filter}:duration={duration}"]
+    cmd += ["-f", "lavfi", "-i", audio_filter]
+    if video_filter:
+        cmd += ["-c:v", "libx264", "-preset", "veryfast", "-g", "50", "-pix_fmt", "yuv420p"]
+    cmd += ["-c:a", "aac", "-shortest", output_file]
+
+    subprocess.run(cmd, check=True)
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Get the peak resident set size of this process in MB."""
+    if not RESOURCE_AVAILABLE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class _ProcessTreeSampler:
+    """Samples the combined RSS of this process and its subprocesses."""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> "_ProcessTreeSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        process = psutil.Process()
+        while not self._stop.is_set():
+            total = 0
+            for member in [process] + process.children(recursive=True):
+                try:
+                    total += member.memory_info().rss
+                except psutil.Error:
+                    continue
+            self.peak_bytes = max(self.peak_bytes, total)
+            self._stop.wait(self.interval)
+
+
+def _measure(function: Callable[..., Dict[str, Any]], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a benchmark case inside a worker process and attach timing and memory."""
+    sampler = _ProcessTreeSampler() if PSUTIL_AVAILABLE else None
+    start_time = time.perf_counter()
+    try:
+        if sampler:
+            with sampler:
+                result = function(**kwargs) or {}
+        else:
+            result = function(**kwargs) or {}
+        result["status"] = "success"
+    except Exception as e:
+        result = {"status": "failed", "error": f"{type(e).__name__}: {e}"}
+    result["wall_time"] = time.perf_counter() - start_time
+    result["peak_rss_mb"] = _peak_rss_mb()
+    result["peak_tree_rss_mb"] = sampler.peak_bytes / (1024 * 1024) if sampler else None
+    return result
+
+
+def run_isolated(function: Callable[..., Dict[str, Any]], **kwargs) -> Dict[str, Any]:
+    """
+    Run a benchmark case in a fresh process.
+
+    Args:
+        function: Module-level function performing the timed work. It may return
+            a dictionary of extra measurements.
+        **kwargs: Keyword arguments for the function.
+
+    Returns:
+        The function's measurements plus status, wall_time, peak_rss_mb (Python
+        process) and peak_tree_rss_mb (sampled total of the process and its
+        subprocesses such as FFmpeg; None without psutil).
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(_measure, function, kwargs).result()
+
+
+def environment_info() -> Dict[str, Any]:
+    """Describe the machine and tool versions a benchmark ran with."""
+    try:
+        ffmpeg_version = subprocess.run(
+            ["ffmpeg", "-version"], capture_output=True, text=True, check=True
+        ).stdout.splitlines()[0]
+    except (OSError, subprocess.CalledProcessError, IndexError):
+        ffmpeg_version = None
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "ffmpeg": ffmpeg_version,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def find_regressions(
+    results: List[Dict[str, Any]],
+    baseline_file: str,
+    key_fields: Sequence[str],
+    tolerance: float,
+    higher_is_worse: Dict[str, float],
+) -> List[str]:
+    """
+    Compare benchmark results with a previous report.
+
+    Args:
+        results: Results of the current run.
+        baseline_file: Path to a JSON report written by an earlier run.
+        key_fields: Fields identifying the same case in both reports.
+        tolerance: Allowed relative increase of timing and memory metrics.
+        higher_is_worse: Metric names mapped to an absolute slack added on top
+            of the relative tolerance (useful for metrics that can be zero).
+
+    Returns:
+        Human-readable descriptions of every regression found.
+    """
+    with open(baseline_file, "r") as f:
+        baseline = json.load(f)
+
+    def case_key(entry: Dict[str, Any]) -> Tuple:
+        return tuple(entry.get(field) for field in key_fields)
+
+    previous = {case_key(entry): entry for entry in baseline.get("results", [])}
+    regressions = []
+
+    for entry in results:
+        reference = previous.get(case_key(entry))
+        if reference is None or reference.get("status") != "success":
+            continue
+        if entry.get("status") != "success":
+            regressions.append(f"{case_key(entry)}: failed ({entry.get('error')})")
+            continue
+
+        for metric, slack in higher_is_worse.items():
+            old, new = reference.get(metric), entry.get(metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + tolerance) + slack:
+                regressions.append(f"{case_key(entry)}: {metric} {old:.3f} -> {new:.3f}")
+
+    return regressions
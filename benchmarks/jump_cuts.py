@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Benchmark jump cut detection.
+
+Synthesizes clips made of shots from different lavfi sources, joined by hard
+cuts and crossfades at known times, with moving content inside the shots. Runs
+the jump cut detector on each clip across sample rates, analysis widths and
+worker counts, and reports wall time, analyzed frames per second, peak memory,
+precision and recall as JSON.
+
+Hard cuts are the expected detections. Detections inside a crossfade are
+neither counted as hits nor as false positives, since a gradual transition
+may or may not be reported as a cut. Anything else is a false positive, so
+motion inside shots that the detector mistakes for a cut lowers precision.
+
+Usage:
+    python benchmarks/jump_cuts.py --sample-rates 5 10 --analysis-widths 160 320
+    python benchmarks/jump_cuts.py --workers 1 4 --baseline previous.json --output current.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Sequence, Tuple
+
+from common import environment_info, find_regressions, run_isolated
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+)
+logger = logging.getLogger(__name__)
+
+# lavfi sources cycled through for the shots; most of them move
+SHOT_SOURCES = (
+    "testsrc2=size={size}:rate=25",
+    "mandelbrot=size={size}:rate=25",
+    "smptehdbars=size={size}:rate=25",
+    "life=size={size}:rate=25:mold=10:ratio=0.5:death_color=#3040C0:life_color=#F0C020",
+    "rgbtestsrc=size={size}:rate=25",
+    "cellauto=size={size}:rate=25:rule=110",
+)
+
+
+def shot_layout(
+    duration: float,
+    shot_length: float,
+    fade_every: int,
+    fade_length: float,
+) -> Tuple[List[float], List[Tuple[str, float, float]]]:
+    """
+    Place the transitions of a synthesized clip.
+
+    Args:
+        duration: Approximate clip duration in seconds.
+        shot_length: Length of each shot in seconds.
+        fade_every: Make every n-th transition a crossfade (0 for hard cuts only).
+        fade_length: Length of each crossfade in seconds.
+
+    Returns:
+        Tuple of (shot lengths, transitions), where each transition is
+        (kind, start, end) in output time and kind is "cut" or "fade".
+    """
+    count = max(2, int(round(duration / shot_length)))
+    transitions = []
+    time_offset = 0.0
+    for i in range(1, count):
+        time_offset += shot_length
+        if fade_every and i % fade_every == 0:
+            # The fade overlaps the end of the previous shot
+            time_offset -= fade_length
+            transitions.append(("fade", time_offset, time_offset + fade_length))
+        else:
+            transitions.append(("cut", time_offset, time_offset))
+    return [shot_length] * count, transitions
+
+
+def synthesize_shots(
+    output_file: str,
+    shot_lengths: Sequence[float],
+    transitions: Sequence[Tuple[str, float, float]],
+    size: str = "640x360",
+) -> None:
+    """
+    Render shots from different lavfi sources joined by cuts and crossfades.
+
+    Args:
+        output_file: Path of the clip to create.
+        shot_lengths: Length of each shot in seconds.
+        transitions: Transitions from shot_layout.
+        size: Frame size as WIDTHxHEIGHT.
+    """
+    cmd = ["ffmpeg", "-v", "error", "-y"]
+    filters = []
+    for i, length in enumerate(shot_lengths):
+        source = SHOT_SOURCES[i % len(SHOT_SOURCES)].format(size=size)
+        cmd += ["-f", "lavfi", "-t", str(length), "-i", source]
+        # xfade needs inputs with the same format, frame rate and timebase
+        filters.append(f"[{i}:v]format=yuv420p,settb=AVTB,fps=25[s{i}]")
+
+    label = "[s0]"
+    for i, (kind, start, end) in enumerate(transitions, start=1):
+        output = f"[j{i}]"
+        if kind == "fade":
+            filters.append(f"{label}[s{i}]xfade=transition=fade:duration={end - start}:offset={start}{output}")
+        else:
+            filters.append(f"{label}[s{i}]concat=n=2:v=1:a=0,settb=AVTB,fps=25{output}")
+        label = output
+
+    cmd += [
+        "-filter_complex", ";".join(filters), "-map", label,
+        "-c:v", "libx264", "-preset", "veryfast", "-g", "50", "-pix_fmt", "yuv420p",
+        output_file,
+    ]
+    subprocess.run(cmd, check=True)
+
+
+def score_detections(
+    detected: List[float],
+    transitions: Sequence[Tuple[str, float, float]],
+    tolerance: float,
+) -> Dict[str, Any]:
+    """
+    Match detected cut times against the synthesized transitions.
+
+    Args:
+        detected: Detected jump cut timestamps.
+        transitions: Transitions from shot_layout.
+        tolerance: Maximum distance in seconds between a hit and its cut.
+
+    Returns:
+        Precision, recall, false positive and missed cut counts, and the mean
+        timing error of the hits.
+    """
+    cuts = [start for kind, start, _ in transitions if kind == "cut"]
+    fades = [(start, end) for kind, start, end in transitions if kind == "fade"]
+    unmatched = set(range(len(cuts)))
+    errors = []
+    false_positives = 0
+
+    for timestamp in sorted(detected):
+        nearest = min(unmatched, key=lambda i: abs(cuts[i] - timestamp), default=None)
+        if nearest is not None and abs(cuts[nearest] - timestamp) <= tolerance:
+            unmatched.remove(nearest)
+            errors.append(abs(cuts[nearest] - timestamp))
+        elif not any(start - tolerance <= timestamp <= end + tolerance for start, end in fades):
+            false_positives += 1
+
+    hits = len(errors)
+    return {
+        "expected_cuts": len(cuts),
+        "detected_cuts": len(detected),
+        "missed_cuts": len(unmatched),
+        "false_positives": false_positives,
+        "precision": hits / (hits + false_positives) if hits + false_positives else 1.0,
+        "recall": hits / len(cuts) if cuts else 1.0,
+        "timing_error_mean": sum(errors) / hits if hits else None,
+    }
+
+
+def run_case(input_file: str, settings: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Detect jump cuts in a clip (runs in a fresh worker process).
+
+    Args:
+        input_file: Synthesized input clip.
+        settings: Keyword arguments for JumpCutDetector.
+
+    Returns:
+        Dictionary with the detected timestamps, the detection time and the
+        number of analyzed frames per second of detection time.
+    """
+    from asabaal_utils.video_processing.jump_cut_detector import JumpCutDetector
+    from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+    duration = ffmpeg_parse_infos(input_file)["duration"]
+    detector = JumpCutDetector(save_frames=False, **settings)
+
+    with tempfile.TemporaryDirectory(prefix="jump_cut_benchmark_") as output_dir:
+        start_time = time.perf_counter()
+        jump_cuts = detector.detect_jump_cuts(input_file, output_dir=output_dir)
+        detection_time = time.perf_counter() - start_time
+
+    return {
+        "detected": [cut.timestamp for cut in jump_cuts],
+        "detection_time": detection_time,
+        "analyzed_fps": duration * settings["frame_sample_rate"] / detection_time,
+        "realtime_factor": duration / detection_time,
+    }
+
+
+def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run every configuration on every clip duration."""
+    results = []
+
+    with tempfile.TemporaryDirectory(prefix="jump_cut_benchmark_") as temp_dir:
+        for duration in args.durations:
+            shot_lengths, transitions = shot_layout(
+                duration, args.shot_length, args.fade_every, args.fade_length
+            )
+            input_file = os.path.join(temp_dir, f"input_{duration:g}.mp4")
+            logger.info(f"Synthesizing {duration:g}s clip with {len(transitions)} transitions")
+            synthesize_shots(input_file, shot_lengths, transitions, args.size)
+
+            for sample_rate in args.sample_rates:
+                for analysis_width in args.analysis_widths:
+                    for workers in args.workers:
+                        settings = {
+                            "frame_sample_rate": sample_rate,
+                            "analysis_width": analysis_width or None,
+                            "workers": workers,
+                            "sensitivity": args.sensitivity,
+                            "smoothing_window": args.smoothing_window,
+                            "use_ffmpeg_reader": args.ffmpeg_reader,
+                        }
+                        logger.info(
+                            f"Running {duration:g}s at {sample_rate:g} fps, width {analysis_width or 'full'}, "
+                            f"{workers} worker(s)"
+                        )
+
+                        for repeat in range(args.repeat):
+                            result = run_isolated(run_case, input_file=input_file, settings=settings)
+                            result.update({
+                                "duration": duration,
+                                "sample_rate": sample_rate,
+                                "analysis_width": analysis_width,
+                                "workers": workers,
+                                "repeat": repeat,
+                            })
+                            if result["status"] == "success":
+                                tolerance = args.tolerance_seconds + 1.0 / sample_rate
+                                result.update(score_detections(result["detected"], transitions, tolerance))
+                            else:
+                                logger.error(f"Detection failed: {result['error']}")
+                            results.append(result)
+
+    return {
+        "benchmark": "jump_cuts",
+        "environment": environment_info(),
+        "settings": {
+            "shot_length": args.shot_length,
+            "fade_every": args.fade_every,
+            "fade_length": args.fade_length,
+            "size": args.size,
+            "sensitivity": args.sensitivity,
+            "smoothing_window": args.smoothing_window,
+            "ffmpeg_reader": args.ffmpeg_reader,
+            "tolerance_seconds": args.tolerance_seconds,
+        },
+        "results": results,
+    }
+
+
+def main() -> int:
+    """Parse arguments, run the benchmark and write the report."""
+    parser = argparse.ArgumentParser(description="Benchmark jump cut detection")
+    parser.add_argument("--durations", type=float, nargs="+", default=[60.0],
+                        help="Clip durations in seconds (default: 60)")
+    parser.add_argument("--sample-rates", type=float, nargs="+", default=[5.0, 10.0],
+                        help="Frames per second to analyze (default: 5 10)")
+    parser.add_argument("--analysis-widths", type=int, nargs="+", default=[160, 320],
+                        help="Analysis widths in pixels, 0 for full resolution (default: 160 320)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1],
+                        help="Worker process counts (default: 1)")
+    parser.add_argument("--shot-length", type=float, default=4.0,
+                        help="Length of each synthesized shot in seconds (default: 4.0)")
+    parser.add_argument("--fade-every", type=int, default=3,
+                        help="Make every n-th transition a crossfade, 0 for hard cuts only (default: 3)")
+    parser.add_argument("--fade-length", type=float, default=1.0,
+                        help="Length of each crossfade in seconds (default: 1.0)")
+    parser.add_argument("--size", default="640x360",
+                        help="Frame size of the synthesized clips (default: 640x360)")
+    parser.add_argument("--sensitivity", type=float, default=0.5)
+    parser.add_argument("--smoothing-window", type=int, default=3,
+                        help="Median smoothing window of the detector in samples (default: 3)")
+    parser.add_argument("--ffmpeg-reader", action="store_true",
+                        help="Decode sampled frames through a single FFmpeg pipe")
+    parser.add_argument("--tolerance-seconds", type=float, default=0.1,
+                        help="Allowed timing error of a hit on top of one sample interval (default: 0.1)")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="Number of runs per case (default: 1)")
+    parser.add_argument("--output", default=None,
+                        help="Path to write the JSON report (default: print to stdout)")
+    parser.add_argument("--baseline", default=None,
+                        help="Earlier JSON report to compare against; exits with 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed relative slowdown or memory growth against the baseline (default: 0.2)")
+    args = parser.parse_args()
+
+    report = run_benchmark(args)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Benchmark report saved to {args.output}")
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        regressions = find_regressions(
+            report["results"], args.baseline,
+            key_fields=("duration", "sample_rate", "analysis_width", "workers", "repeat"),
+            tolerance=args.tolerance,
+            higher_is_worse={
+                "detection_time": 0.0,
+                "peak_rss_mb": 0.0,
+                "peak_tree_rss_mb": 0.0,
+                "missed_cuts": 0.0,
+                "false_positives": 0.0,
+            },
+        )
+        for regression in regressions:
+            logger.error(f"Regression: {regression}")
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
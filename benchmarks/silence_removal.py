@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Benchmark the silence removal implementations.
+
+Synthesizes clips with a known silence layout, runs the MoviePy and FFmpeg
+silence removal pipelines on each, and reports wall time, realtime factor,
+peak memory, output duration error and silence boundary error as JSON.
+
+Usage:
+    python benchmarks/silence_removal.py --durations 30 120 --densities 2 10
+    python benchmarks/silence_removal.py --baseline previous.json --output current.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+from typing import Any, Dict, List, Tuple
+
+from common import environment_info, find_regressions, run_isolated, synthesize_media
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+)
+logger = logging.getLogger(__name__)
+
+# Implementations that can be benchmarked
+IMPLEMENTATIONS = ("moviepy", "ffmpeg-segments", "ffmpeg-filter", "ffmpeg-keyframe_copy")
+
+
+def silence_layout(duration: float, density: float, silence_length: float) -> List[Tuple[float, float]]:
+    """
+    Place evenly spaced silences in a clip.
+
+    Args:
+        duration: Clip duration in seconds.
+        density: Number of silences per minute.
+        silence_length: Length of each silence in seconds.
+
+    Returns:
+        List of (start, end) silence intervals.
+    """
+    count = int(duration / 60.0 * density)
+    if count == 0:
+        return []
+    spacing = duration / (count + 1)
+    if spacing <= silence_length:
+        raise ValueError(f"{count} silences of {silence_length}s do not fit in {duration}s")
+    return [(spacing * (i + 1), spacing * (i + 1) + silence_length) for i in range(count)]
+
+
+def boundary_errors(
+    detected: List[Tuple[float, float]],
+    expected: List[Tuple[float, float]],
+) -> Dict[str, Any]:
+    """
+    Compare detected silences with the synthesized ones.
+
+    Args:
+        detected: Detected (start, end) silence intervals.
+        expected: Synthesized (start, end) silence intervals.
+
+    Returns:
+        Mean and maximum distance from each expected boundary to the nearest
+        detected boundary, plus the numbers of expected and detected silences.
+    """
+    detected_bounds = [t for interval in detected for t in interval]
+    errors = [
+        min(abs(t - d) for d in detected_bounds) if detected_bounds else float("inf")
+        for interval in expected for t in interval
+    ]
+    return {
+        "expected_silences": len(expected),
+        "detected_silences": len(detected),
+        "boundary_error_mean": sum(errors) / len(errors) if errors else 0.0,
+        "boundary_error_max": max(errors) if errors else 0.0,
+    }
+
+
+def run_case(
+    implementation: str,
+    input_file: str,
+    output_file: str,
+    settings: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Remove silence with one implementation (runs in a fresh worker process).
+
+    Args:
+        implementation: One of IMPLEMENTATIONS.
+        input_file: Synthesized input clip.
+        output_file: Path for the output clip.
+        settings: Silence detection settings.
+
+    Returns:
+        Dictionary with the output duration.
+    """
+    from asabaal_utils.video_processing.silence_detector import (
+        _remove_silence_ffmpeg, _remove_silence_impl
+    )
+
+    if implementation == "moviepy":
+        _, output_duration, _ = _remove_silence_impl(input_file, output_file, **settings)
+    else:
+        render_mode = implementation.split("-", 1)[1]
+        _, output_duration, _ = _remove_silence_ffmpeg(
+            input_file, output_file, render_mode=render_mode, **settings
+        )
+
+    return {"output_duration": output_duration}
+
+
+def detect_silences(implementation: str, input_file: str, settings: Dict[str, Any]) -> List[Tuple[float, float]]:
+    """
+    Detect silences the way an implementation does, outside of the timed run.
+
+    Args:
+        implementation: One of IMPLEMENTATIONS.
+        input_file: Synthesized input clip.
+        settings: Silence detection settings.
+
+    Returns:
+        Detected (start, end) silence intervals.
+    """
+    from asabaal_utils.video_processing.silence_detector import SilenceDetector, _detect_silence_ffmpeg
+
+    if implementation == "moviepy":
+        detector = SilenceDetector(
+            threshold_db=settings["threshold_db"],
+            min_silence_duration=settings["min_silence_duration"],
+            min_sound_duration=settings["min_sound_duration"],
+        )
+        segments = detector.detect_silence_segments(input_file)
+        return [(s.start, s.end) for s in segments if s.is_silence]
+
+    _, _, silent_segments = _detect_silence_ffmpeg(
+        input_file, settings["threshold_db"], settings["min_silence_duration"]
+    )
+    return silent_segments
+
+
+def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run every implementation on every duration and density."""
+    settings = {
+        "threshold_db": args.threshold_db,
+        "min_silence_duration": args.min_silence,
+        "min_sound_duration": args.min_sound,
+        "padding": args.padding,
+    }
+    results = []
+
+    with tempfile.TemporaryDirectory(prefix="silence_benchmark_") as temp_dir:
+        for duration in args.durations:
+            for density in args.densities:
+                layout = silence_layout(duration, density, args.silence_length)
+                input_file = os.path.join(temp_dir, f"input_{duration:g}_{density:g}.mp4")
+                logger.info(f"Synthesizing {duration:g}s clip with {len(layout)} silences")
+                synthesize_media(input_file, duration, layout)
+
+                # Each silence loses its length minus the padding kept on both sides
+                expected_output = duration - sum(
+                    max(0.0, end - start - 2 * args.padding) for start, end in layout
+                )
+
+                for implementation in args.implementations:
+                    output_file = os.path.join(temp_dir, f"output_{implementation}.mp4")
+                    logger.info(f"Running {implementation} on {duration:g}s at {density:g} silences/min")
+
+                    for repeat in range(args.repeat):
+                        result = run_isolated(
+                            run_case,
+                            implementation=implementation,
+                            input_file=input_file,
+                            output_file=output_file,
+                            settings=settings,
+                        )
+                        result.update({
+                            "implementation": implementation,
+                            "duration": duration,
+                            "silence_density": density,
+                            "repeat": repeat,
+                            "realtime_factor": duration / result["wall_time"],
+                            "expected_output_duration": expected_output,
+                        })
+                        if result["status"] == "success":
+                            result["output_duration_error"] = abs(result["output_duration"] - expected_output)
+                            result.update(boundary_errors(
+                                detect_silences(implementation, input_file, settings), layout
+                            ))
+                        else:
+                            logger.error(f"{implementation} failed: {result['error']}")
+                        results.append(result)
+
+                        if os.path.exists(output_file):
+                            os.unlink(output_file)
+
+    return {
+        "benchmark": "silence_removal",
+        "environment": environment_info(),
+        "settings": dict(settings, silence_length=args.silence_length),
+        "results": results,
+    }
+
+
+def main() -> int:
+    """Parse arguments, run the benchmark and write the report."""
+    parser = argparse.ArgumentParser(description="Benchmark silence removal implementations")
+    parser.add_argument("--durations", type=float, nargs="+", default=[30.0, 120.0],
+                        help="Clip durations in seconds (default: 30 120)")
+    parser.add_argument("--densities", type=float, nargs="+", default=[2.0, 10.0],
+                        help="Silences per minute (default: 2 10)")
+    parser.add_argument("--silence-length", type=float, default=1.5,
+                        help="Length of each synthesized silence in seconds (default: 1.5)")
+    parser.add_argument("--implementations", nargs="+", choices=IMPLEMENTATIONS,
+                        default=["moviepy", "ffmpeg-segments", "ffmpeg-filter"],
+                        help="Implementations to benchmark")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="Number of runs per case (default: 1)")
+    parser.add_argument("--threshold-db", type=float, default=-40.0)
+    parser.add_argument("--min-silence", type=float, default=0.5)
+    parser.add_argument("--min-sound", type=float, default=0.3)
+    parser.add_argument("--padding", type=float, default=0.1)
+    parser.add_argument("--output", default=None,
+                        help="Path to write the JSON report (default: print to stdout)")
+    parser.add_argument("--baseline", default=None,
+                        help="Earlier JSON report to compare against; exits with 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed relative slowdown or memory growth against the baseline (default: 0.2)")
+    args = parser.parse_args()
+
+    report = run_benchmark(args)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Benchmark report saved to {args.output}")
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        regressions = find_regressions(
+            report["results"], args.baseline,
+            key_fields=("implementation", "duration", "silence_density", "repeat"),
+            tolerance=args.tolerance,
+            higher_is_worse={
+                "wall_time": 0.0,
+                "peak_rss_mb": 0.0,
+                "peak_tree_rss_mb": 0.0,
+                "output_duration_error": 0.05,
+                "boundary_error_max": 0.05,
+            },
+        )
+        for regression in regressions:
+            logger.error(f"Regression: {regression}")
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,7 +11,7 @@ This module provides utilities for processing video files, including:
 - Content-aware video summarization
 """
 
-from .silence_detector import SilenceDetector, remove_silence
+from .silence_detector import SilenceDetector, remove_silence, remove_silence_batch
 from .transcript_analyzer import analyze_transcript
 from .thumbnail_generator import ThumbnailGenerator, generate_thumbnails
 from .color_analyzer import ColorAnalyzer, analyze_video_colors
@@ -21,6 +21,7 @@ from .video_summarizer import VideoSummarizer, create_video_summary, SummaryStyl
 __all__ = [
     'SilenceDetector',
     'remove_silence',
+    'remove_silence_batch',
     'analyze_transcript',
     'ThumbnailGenerator',
     'generate_thumbnails',
@@ -11,7 +11,7 @@ import sys
 from pathlib import Path
 
 from .clip_extractor import extract_clips_from_json
-from .silence_detector import remove_silence
+from .silence_detector import remove_silence, remove_silence_batch
 from .transcript_analyzer import analyze_transcript
 from .thumbnail_generator import generate_thumbnails
 from .color_analyzer import analyze_video_colors
@@ -47,6 +47,22 @@ def remove_silence_cli():
                         help="Size of audio chunks for analysis in seconds (default: 0.05)")
     parser.add_argument("--aggressive", action="store_true",
                         help="Use aggressive silence rejection algorithms")
+    parser.add_argument("--refine-boundaries", action="store_true",
+                        help="Refine silence boundaries below the chunk size around each transition "
+                             "(MoviePy implementation only)")
+    parser.add_argument("--refine-resolution", type=float, default=0.001,
+                        help="Window size in seconds for boundary refinement (default: 0.001)")
+    parser.add_argument("--follow", action="store_true",
+                        help="Detect silence while the input is still being recorded and render once it "
+                             "stops growing (uses the MoviePy implementation)")
+    parser.add_argument("--follow-timeout", type=float, default=10.0,
+                        help="Seconds without new data after which a followed recording is finished (default: 10.0)")
+    parser.add_argument("--cache", action="store_true",
+                        help="Cache silence maps on disk so re-runs with different padding or "
+                             "minimum sound duration skip audio analysis")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Directory for cached silence maps "
+                             "(default: silence_maps under $ASABAAL_CACHE_DIR or ~/.cache/asabaal_utils)")
     parser.add_argument("--log-level", default="INFO",
                         choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
                         help="Set the logging level")
@@ -67,6 +83,16 @@ def remove_silence_cli():
                         help="Disable memory-adaptive processing entirely")
     memory_group.add_argument("--disable-ffmpeg", action="store_true",
                         help="Disable direct FFmpeg implementation and use MoviePy instead")
+    memory_group.add_argument("--stream-audio", action="store_true",
+                        help="Decode audio in bounded blocks for silence detection (MoviePy implementation only)")
+    memory_group.add_argument("--render-mode", choices=["segments", "filter", "keyframe_copy"],
+                        default="segments",
+                        help="How the FFmpeg implementation renders kept segments: one process per segment, "
+                             "a single re-encoding filter graph, or a single keyframe-aligned stream copy "
+                             "(default: segments)")
+    memory_group.add_argument("--segment-workers", type=int, default=None,
+                        help="Maximum number of concurrent FFmpeg segment extractions in segments render mode "
+                             "(default: number of CPUs)")
     
     args = parser.parse_args()
     
@@ -77,8 +103,8 @@ def remove_silence_cli():
         # Determine whether to use memory adaptation
         use_memory_adaptation = not args.disable_memory_adaptation
         
-        # Determine whether to use FFmpeg implementation
-        use_ffmpeg = not args.disable_ffmpeg
+        # Determine whether to use FFmpeg implementation (following a recording needs MoviePy)
+        use_ffmpeg = not (args.disable_ffmpeg or args.follow)
 
         # Prepare memory management options
         memory_options = {}
@@ -102,6 +128,15 @@ def remove_silence_cli():
             aggressive_silence_rejection=args.aggressive,
             use_memory_adaptation=use_memory_adaptation,
             use_ffmpeg=use_ffmpeg,
+            streaming=args.stream_audio,
+            render_mode=args.render_mode,
+            segment_workers=args.segment_workers,
+            use_cache=args.cache or args.cache_dir is not None,
+            cache_dir=args.cache_dir,
+            follow=args.follow,
+            follow_timeout=args.follow_timeout,
+            refine_boundaries=args.refine_boundaries,
+            refine_resolution=args.refine_resolution,
             **memory_options,
         )
         
@@ -140,6 +175,98 @@ def remove_silence_cli():
         return 1
 
 
+def remove_silence_batch_cli():
+    """CLI entry point for batch silence removal."""
+    parser = argparse.ArgumentParser(description="Remove silence from many video files in parallel")
+    parser.add_argument("source",
+                        help="Directory of videos, glob pattern (quote it), or manifest file "
+                             "(.json list or one input per line with an optional tab-separated output)")
+    parser.add_argument("output_dir", help="Directory for output videos")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="Number of files processed in parallel (default: number of CPUs)")
+    parser.add_argument("--suffix", default="_nosilence",
+                        help="Suffix added to input file names for outputs (default: _nosilence)")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="Process files even if their output is newer than the input")
+    parser.add_argument("--report", default=None,
+                        help="Path to the JSON report (default: <output_dir>/silence_report.json)")
+    parser.add_argument("--threshold-db", type=float, default=-40.0,
+                        help="Threshold in dB below which audio is considered silence (default: -40.0)")
+    parser.add_argument("--min-silence", type=float, default=0.5,
+                        help="Minimum duration of silence to remove in seconds (default: 0.5)")
+    parser.add_argument("--min-sound", type=float, default=0.3,
+                        help="Minimum duration of sound to keep in seconds (default: 0.3)")
+    parser.add_argument("--padding", type=float, default=0.1,
+                        help="Padding around non-silent segments in seconds (default: 0.1)")
+    parser.add_argument("--chunk-size", type=float, default=0.05,
+                        help="Size of audio chunks for analysis in seconds (default: 0.05)")
+    parser.add_argument("--aggressive", action="store_true",
+                        help="Use aggressive silence rejection algorithms")
+    parser.add_argument("--render-mode", choices=["segments", "filter", "keyframe_copy"],
+                        default="segments",
+                        help="How the FFmpeg implementation renders kept segments (default: segments)")
+    parser.add_argument("--disable-ffmpeg", action="store_true",
+                        help="Disable direct FFmpeg implementation and use MoviePy instead")
+    parser.add_argument("--disable-memory-adaptation", action="store_true",
+                        help="Disable memory-adaptive processing entirely")
+    parser.add_argument("--cache", action="store_true",
+                        help="Cache silence maps on disk so re-runs with different padding skip audio analysis")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Directory for cached silence maps "
+                             "(default: silence_maps under $ASABAAL_CACHE_DIR or ~/.cache/asabaal_utils)")
+    parser.add_argument("--log-level", default="INFO",
+                        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+                        help="Set the logging level")
+    
+    args = parser.parse_args()
+    
+    # Set log level
+    logging.getLogger().setLevel(getattr(logging, args.log_level))
+    
+    try:
+        os.makedirs(args.output_dir, exist_ok=True)
+        report_file = args.report or os.path.join(args.output_dir, "silence_report.json")
+        
+        report = remove_silence_batch(
+            source=args.source,
+            output_dir=args.output_dir,
+            jobs=args.jobs,
+            suffix=args.suffix,
+            overwrite=args.overwrite,
+            report_file=report_file,
+            threshold_db=args.threshold_db,
+            min_silence_duration=args.min_silence,
+            min_sound_duration=args.min_sound,
+            padding=args.padding,
+            chunk_size=args.chunk_size,
+            aggressive_silence_rejection=args.aggressive,
+            use_memory_adaptation=not args.disable_memory_adaptation,
+            use_ffmpeg=not args.disable_ffmpeg,
+            render_mode=args.render_mode,
+            use_cache=args.cache or args.cache_dir is not None,
+            cache_dir=args.cache_dir,
+        )
+        
+        summary = report["summary"]
+        print(f"\nBatch silence removal complete:")
+        print(f"- Files processed: {summary['processed']} of {summary['total_files']} "
+              f"({summary['skipped']} up to date, {summary['failed']} failed)")
+        print(f"- Original duration: {summary['original_duration']:.2f}s")
+        print(f"- Output duration: {summary['output_duration']:.2f}s")
+        print(f"- Time saved: {summary['time_saved']:.2f}s")
+        print(f"- Wall time: {summary['wall_time']:.2f}s")
+        print(f"- Report: {os.path.abspath(report_file)}")
+        
+        for entry in report["files"]:
+            if entry["status"] == "failed":
+                print(f"- Failed: {entry['input_file']}: {entry['error']}")
+        
+        return 1 if summary["failed"] else 0
+    except Exception as e:
+        logger.error(f"Error processing batch: {e}", exc_info=True)
+        return 1
+
+
 def analyze_transcript_cli():
     """CLI entry point for transcript analysis."""
     parser = argparse.ArgumentParser(description="Analyze video transcripts for optimal clip splits")
@@ -393,6 +520,8 @@ def generate_thumbnails_cli():
                         help="Output image format (default: jpg)")
     parser.add_argument("--quality", type=int, default=90,
                         help="JPEG quality (1-100, default: 90)")
+    parser.add_argument("--ffmpeg-reader", action="store_true",
+                        help="Decode sampled frames through a single FFmpeg pipe instead of seeking per frame")
     parser.add_argument("--metadata-file", 
                         help="Path to save thumbnail metadata as JSON (default: <output_dir>/thumbnails.json)")
     parser.add_argument("--log-level", default="INFO",
@@ -425,7 +554,8 @@ def generate_thumbnails_cli():
             skip_end_percent=args.skip_end,
             output_format=args.format,
             output_quality=args.quality,
-            metadata_file=args.metadata_file
+            metadata_file=args.metadata_file,
+            use_ffmpeg_reader=args.ffmpeg_reader
         )
         
         print(f"\nThumbnail generation complete:")
@@ -472,6 +602,20 @@ def analyze_colors_cli():
                         help="Skip segment-by-segment analysis")
     parser.add_argument("--segment-images", action="store_true",
                         help="Create palette images for each segment")
+    parser.add_argument("--clustering", choices=["kmeans", "minibatch", "dominant"], default="kmeans",
+                        help="Palette clustering method; minibatch clusters a pixel subsample and "
+                             "warm-starts each segment from the previous one. With --accumulation histogram "
+                             "the histogram bins are clustered, and dominant takes the most populated bins "
+                             "(default: kmeans)")
+    parser.add_argument("--max-palette-pixels", type=int, default=20000,
+                        help="Maximum pixels clustered per palette with --clustering minibatch (default: 20000)")
+    parser.add_argument("--accumulation", choices=["average", "histogram"], default="average",
+                        help="Combine sampled frames into an average frame, or stream them into a color "
+                             "histogram per segment without keeping frames in memory (default: average)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of processes analyzing segments in parallel (default: 1)")
+    parser.add_argument("--ffmpeg-reader", action="store_true",
+                        help="Decode sampled frames through a single FFmpeg pipe instead of seeking per frame")
     parser.add_argument("--metadata-file", 
                         help="Path to save color analysis as JSON (default: <output_dir>/color_analysis.json)")
     parser.add_argument("--log-level", default="INFO",
@@ -507,7 +651,12 @@ def analyze_colors_cli():
             create_palette_image=not args.no_palette_image,
             create_segments=not args.no_segments,
             segment_palette_images=args.segment_images,
-            metadata_file=args.metadata_file
+            metadata_file=args.metadata_file,
+            use_ffmpeg_reader=args.ffmpeg_reader,
+            color_clustering_method=args.clustering,
+            max_palette_pixels=args.max_palette_pixels,
+            color_accumulation=args.accumulation,
+            workers=args.workers
         )
         
         theme = results["theme"]
@@ -562,12 +711,32 @@ def detect_jump_cuts_cli():
                         help="Percentage of video to skip from end (default: 0.0)")
     parser.add_argument("--no-save-frames", action="store_true",
                         help="Skip saving frames before and after jump cuts")
+    parser.add_argument("--analysis-width", type=int, default=0,
+                        help="Width in pixels frames are decoded at for analysis, 0 for full resolution (default: 0)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of worker processes scoring frame pairs (default: 1)")
+    parser.add_argument("--scene-prefilter", action="store_true",
+                        help="Only analyze frames around candidate cuts from FFmpeg scene detection")
+    parser.add_argument("--scene-threshold", type=float, default=0.1,
+                        help="FFmpeg scene change score (0-1) for candidate cuts (default: 0.1)")
+    parser.add_argument("--cache", action="store_true",
+                        help="Cache per-frame metrics on disk so re-runs with a different sensitivity "
+                             "or minimum interval skip frame analysis")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Directory for cached frame metrics "
+                             "(default: jump_cut_metrics under $ASABAAL_CACHE_DIR or ~/.cache/asabaal_utils)")
+    parser.add_argument("--ffmpeg-reader", action="store_true",
+                        help="Decode sampled frames through a single FFmpeg pipe instead of seeking per frame")
     parser.add_argument("--metadata-file", 
                         help="Path to save jump cut metadata as JSON (default: <output_dir>/jump_cuts.json)")
     parser.add_argument("--smooth-output", 
                         help="Path to save a new video with smoothed transitions (optional)")
     parser.add_argument("--high-confidence-only", action="store_true",
                         help="Apply transitions only to high-confidence jump cuts")
+    parser.add_argument("--smooth-backend", choices=["moviepy", "ffmpeg"], default="moviepy",
+                        help="Render transitions with MoviePy composites or one FFmpeg xfade encode (default: moviepy)")
+    parser.add_argument("--threads", type=int, default=None,
+                        help="Number of FFmpeg threads for the ffmpeg smoothing backend (default: FFmpeg decides)")
     parser.add_argument("--log-level", default="INFO",
                         choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
                         help="Set the logging level")
@@ -599,7 +768,14 @@ def detect_jump_cuts_cli():
             min_jump_interval=args.min_interval,
             frame_sample_rate=args.sample_rate,
             save_frames=not args.no_save_frames,
-            metadata_file=args.metadata_file
+            metadata_file=args.metadata_file,
+            analysis_width=args.analysis_width or None,
+            use_ffmpeg_reader=args.ffmpeg_reader,
+            workers=args.workers,
+            scene_prefilter=args.scene_prefilter,
+            scene_threshold=args.scene_threshold,
+            use_cache=args.cache or args.cache_dir is not None,
+            cache_dir=args.cache_dir
         )
         
         print(f"\nJump cut detection complete:")
@@ -631,7 +807,9 @@ def detect_jump_cuts_cli():
                 video_path=args.video_file,
                 output_path=args.smooth_output,
                 jump_cuts_data=jump_cuts,
-                apply_all_transitions=not args.high_confidence_only
+                apply_all_transitions=not args.high_confidence_only,
+                backend=args.smooth_backend,
+                threads=args.threads
             )
             
             print(f"- Smoothed video saved to: {os.path.abspath(args.smooth_output)}")
@@ -662,6 +840,8 @@ def create_summary_cli():
                         help="Don't give preference to content from the beginning of the video")
     parser.add_argument("--no-favor-ending", action="store_true",
                         help="Don't give preference to content from the end of the video")
+    parser.add_argument("--ffmpeg-reader", action="store_true",
+                        help="Decode sampled frames through a single FFmpeg pipe instead of seeking per frame")
     parser.add_argument("--metadata-file", 
                         help="Path to save summary metadata as JSON (default: <output_dir>/summary.json)")
     parser.add_argument("--log-level", default="INFO",
@@ -724,6 +904,7 @@ def create_summary_cli():
             favor_ending=not args.no_favor_ending,
             metadata_file=args.metadata_file,
             use_memory_adaptation=use_memory_adaptation,
+            use_ffmpeg_reader=args.ffmpeg_reader,
             **memory_options
         )
         
@@ -946,7 +1127,9 @@ def main():
         
     command = sys.argv[0] if '/' not in sys.argv[0] else sys.argv[0].split('/')[-1]
     
-    if command == "remove-silence" or "remove_silence" in command:
+    if command == "remove-silence-batch" or "remove_silence_batch" in command:
+        sys.exit(remove_silence_batch_cli())
+    elif command == "remove-silence" or "remove_silence" in command:
         sys.exit(remove_silence_cli())
     elif command == "analyze-transcript" or "analyze_transcript" in command:
         sys.exit(analyze_transcript_cli())
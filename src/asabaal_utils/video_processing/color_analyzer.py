@@ -9,9 +9,12 @@ import logging
 import tempfile
 import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple, Union, Set
+from typing import List, Dict, Any, Optional, Tuple, Union, Set, Iterator
 from dataclasses import dataclass, field
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import multiprocessing
 import math
 import colorsys
 
@@ -19,12 +22,22 @@ import numpy as np
 from tqdm import tqdm
 # Also import as needed:
 # from moviepy import fadein
-from moviepy.video.io import VideoFileClip
+from moviepy.editor import VideoFileClip
 from PIL import Image, ImageDraw
-from sklearn.cluster import KMeans
+from scipy.spatial import cKDTree
+from sklearn.cluster import KMeans, MiniBatchKMeans
+
+from .frame_source import FFmpegFrameSource, group_frames_by_interval
+from .frame_metrics import color_metrics, metrics_to_dicts
 
 logger = logging.getLogger(__name__)
 
+# Per-channel weights of the perceptual color distance used to name colors
+_COLOR_NAME_WEIGHTS = np.array([0.3, 0.59, 0.11])
+
+# Nearest known colors examined per lookup to break distance ties
+_COLOR_NAME_CANDIDATES = 4
+
 
 @dataclass
 class ColorSegment:
@@ -82,6 +95,58 @@ class ColorTheme:
         }
 
 
+class ColorHistogram:
+    """
+    Running 3D color histogram of sampled frames.
+    
+    Every frame is folded into per-bin pixel counts and RGB sums and can be
+    discarded afterwards, so memory use does not depend on the number or size
+    of the frames. The RGB sums give the mean color of each bin.
+    """
+    
+    def __init__(self, bins_per_channel: int = 16):
+        """
+        Initialize an empty histogram.
+        
+        Args:
+            bins_per_channel: Number of bins per color channel (a power of two
+                up to 256)
+        """
+        self.bins_per_channel = bins_per_channel
+        self._shift = 8 - int(math.log2(bins_per_channel))
+        self.counts = np.zeros(bins_per_channel ** 3, dtype=np.int64)
+        self.sums = np.zeros((bins_per_channel ** 3, 3), dtype=np.float64)
+        self.frame_count = 0
+    
+    def add(self, frame: np.ndarray) -> None:
+        """
+        Fold the pixels of a frame into the histogram.
+        
+        Args:
+            frame: RGB uint8 frame
+        """
+        pixels = frame.reshape(-1, 3)
+        binned = (pixels >> self._shift).astype(np.intp)
+        index = (binned[:, 0] * self.bins_per_channel + binned[:, 1]) * self.bins_per_channel + binned[:, 2]
+        
+        size = len(self.counts)
+        self.counts += np.bincount(index, minlength=size)
+        for channel in range(3):
+            self.sums[:, channel] += np.bincount(index, weights=pixels[:, channel], minlength=size)
+        self.frame_count += 1
+    
+    def occupied_colors(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the mean color and pixel count of every non-empty bin.
+        
+        Returns:
+            Tuple of (colors of shape (M, 3), counts of shape (M,))
+        """
+        occupied = np.flatnonzero(self.counts)
+        counts = self.counts[occupied]
+        return self.sums[occupied] / counts[:, None], counts
+
+
 class ColorNameMatcher:
     """Matches RGB colors to human-readable color names."""
     
@@ -236,18 +301,46 @@ class ColorNameMatcher:
         return math.sqrt((r1 - r2) ** 2 * 0.3 + (g1 - g2) ** 2 * 0.59 + (b1 - b2) ** 2 * 0.11)
     
     @classmethod
-    def get_color_name(cls, rgb: Tuple[int, int, int]) -> str:
-        """Get the closest color name for an RGB tuple."""
-        min_distance = float('inf')
-        closest_color = "Unknown"
+    def _name_index(cls) -> Tuple[cKDTree, List[str]]:
+        """Get a KD-tree of the known colors in the weighted RGB space, building it once."""
+        if cls.__dict__.get("_tree") is None:
+            known = np.array(list(cls.COLOR_MAP.keys()), dtype=np.float64)
+            # Scaling each channel by the square root of its weight turns the
+            # weighted distance into a plain Euclidean one
+            cls._tree = cKDTree(known * np.sqrt(_COLOR_NAME_WEIGHTS))
+            cls._tree_names = list(cls.COLOR_MAP.values())
+        return cls._tree, cls._tree_names
+    
+    @classmethod
+    def get_color_names(cls, colors: Union[np.ndarray, List[Tuple[int, int, int]]]) -> List[str]:
+        """
+        Get the closest color names for many RGB colors at once.
+        
+        Args:
+            colors: Array of shape (N, 3), or a list of (r, g, b) tuples
+            
+        Returns:
+            Closest color name of each color
+        """
+        colors = np.asarray(colors, dtype=np.float64).reshape(-1, 3)
+        if len(colors) == 0:
+            return []
+        
+        tree, names = cls._name_index()
+        k = min(_COLOR_NAME_CANDIDATES, len(names))
+        distances, indices = tree.query(colors * np.sqrt(_COLOR_NAME_WEIGHTS), k=k)
+        distances, indices = distances.reshape(len(colors), k), indices.reshape(len(colors), k)
         
-        for known_rgb, color_name in cls.COLOR_MAP.items():
-            distance = cls._color_distance(rgb, known_rgb)
-            if distance < min_distance:
-                min_distance = distance
-                closest_color = color_name
+        # Equally close known colors resolve to the first one in COLOR_MAP
+        ties = distances <= distances[:, :1] + 1e-9
+        closest = np.where(ties, indices, len(names)).min(axis=1)
         
-        return closest_color
+        return [names[i] for i in closest]
+    
+    @classmethod
+    def get_color_name(cls, rgb: Tuple[int, int, int]) -> str:
+        """Get the closest color name for an RGB tuple."""
+        return cls.get_color_names([rgb])[0]
     
     @classmethod
     def get_emotion(cls, rgb: Tuple[int, int, int]) -> List[str]:
@@ -311,6 +404,12 @@ class ColorAnalyzer:
         skip_start_percent: float = 0.05,
         skip_end_percent: float = 0.05,
         color_clustering_method: str = "kmeans",
+        use_ffmpeg_reader: bool = False,
+        max_palette_pixels: int = 20000,
+        palette_sampling: str = "stratified",
+        color_accumulation: str = "average",
+        histogram_bins: int = 16,
+        workers: int = 1,
     ):
         """
         Initialize the color analyzer.
@@ -321,7 +420,26 @@ class ColorAnalyzer:
             segment_duration: Duration of each color segment in seconds
             skip_start_percent: Percentage of video to skip from the start
             skip_end_percent: Percentage of video to skip from the end
-            color_clustering_method: Method for color clustering ('kmeans' or 'dominant')
+            color_clustering_method: Method for color clustering ('kmeans',
+                'minibatch' or 'dominant'). 'minibatch' clusters a subsample of
+                at most max_palette_pixels pixels with MiniBatchKMeans, starting
+                each segment from the previous segment's palette.
+            use_ffmpeg_reader: Whether to decode the sampled frames with a single
+                FFmpeg process instead of seeking with MoviePy for each frame
+            max_palette_pixels: Maximum number of pixels clustered per palette
+                with the 'minibatch' method
+            palette_sampling: How pixels are subsampled for the 'minibatch'
+                method ('stratified' for a regular grid or 'random')
+            color_accumulation: How the sampled frames of a segment are combined.
+                'average' quantizes the mean frame; 'histogram' folds every
+                frame into a running color histogram as it is decoded and
+                clusters the histogram, so frames are not kept in memory.
+                The histogram is clustered with color_clustering_method, where
+                'dominant' takes the most populated bins.
+            histogram_bins: Bins per color channel for 'histogram' accumulation
+            workers: Number of worker processes analyzing segments (1 analyzes
+                them in this process). Each worker decodes its segments
+                itself, and segment palettes are not warm-started.
         """
         self.palette_size = palette_size
         self.frame_sample_rate = frame_sample_rate
@@ -329,14 +447,90 @@ class ColorAnalyzer:
         self.skip_start_percent = skip_start_percent
         self.skip_end_percent = skip_end_percent
         self.color_clustering_method = color_clustering_method
+        self.use_ffmpeg_reader = use_ffmpeg_reader
+        self.max_palette_pixels = max_palette_pixels
+        self.palette_sampling = palette_sampling
+        self.color_accumulation = color_accumulation
+        self.histogram_bins = histogram_bins
+        self.workers = max(1, workers)
+        
+        # Cluster centers of the last warm-started palette
+        self._previous_centers = None
     
-    def _quantize_colors(self, image: np.ndarray, n_colors: int) -> Tuple[List[Tuple[int, int, int]], List[float]]:
+    def _sample_palette_pixels(self, image: np.ndarray) -> np.ndarray:
+        """
+        Pick at most max_palette_pixels pixels of an image for clustering.
+        
+        Args:
+            image: Image as numpy array, or an (N, 3) array of pixels
+            
+        Returns:
+            Array of shape (M, 3) with the sampled pixels
+        """
+        pixels = image.reshape(-1, 3)
+        if len(pixels) <= self.max_palette_pixels:
+            return pixels
+        
+        if self.palette_sampling == "random":
+            rng = np.random.default_rng(0)
+            return pixels[np.sort(rng.choice(len(pixels), self.max_palette_pixels, replace=False))]
+        
+        # A regular grid keeps every region of the frame represented
+        if image.ndim == 3:
+            step = int(math.ceil(math.sqrt(len(pixels) / self.max_palette_pixels)))
+            return image[::step, ::step].reshape(-1, 3)
+        
+        step = int(math.ceil(len(pixels) / self.max_palette_pixels))
+        return pixels[::step]
+    
+    def _fit_minibatch_kmeans(self, image: np.ndarray, n_colors: int, warm_start: bool) -> MiniBatchKMeans:
+        """
+        Cluster a subsample of an image's pixels with MiniBatchKMeans.
+        
+        Args:
+            image: Image as numpy array
+            n_colors: Number of clusters
+            warm_start: Whether to start from the previous warm-started palette,
+                which keeps palettes of consecutive segments consistent
+            
+        Returns:
+            Fitted MiniBatchKMeans model
+        """
+        pixels = self._sample_palette_pixels(image).astype(np.float64)
+        
+        previous = self._previous_centers
+        if warm_start and previous is not None and len(previous) == n_colors:
+            init, n_init = previous, 1
+        else:
+            init, n_init = "k-means++", 3
+        
+        kmeans = MiniBatchKMeans(
+            n_clusters=n_colors,
+            init=init,
+            n_init=n_init,
+            batch_size=min(len(pixels), 4096),
+            random_state=0
+        ).fit(pixels)
+        
+        if warm_start:
+            self._previous_centers = kmeans.cluster_centers_
+        
+        return kmeans
+    
+    def _quantize_colors(
+        self,
+        image: np.ndarray,
+        n_colors: int,
+        warm_start: bool = False
+    ) -> Tuple[List[Tuple[int, int, int]], List[float]]:
         """
         Quantize colors in an image to a smaller palette.
         
         Args:
             image: Image as numpy array
             n_colors: Number of colors to extract
+            warm_start: Whether the 'minibatch' method starts from the previous
+                warm-started palette
             
         Returns:
             List of (r,g,b) tuples and their occurrence percentages
@@ -344,15 +538,18 @@ class ColorAnalyzer:
         # Reshape image for clustering
         pixels = image.reshape(-1, 3)
         
-        if self.color_clustering_method == "kmeans":
+        if self.color_clustering_method in ("kmeans", "minibatch"):
             # Use K-means clustering to find dominant colors
-            kmeans = KMeans(n_clusters=n_colors, random_state=0, n_init=10).fit(pixels)
+            if self.color_clustering_method == "kmeans":
+                kmeans = KMeans(n_clusters=n_colors, random_state=0, n_init=10).fit(pixels)
+            else:
+                kmeans = self._fit_minibatch_kmeans(image, n_colors, warm_start)
             centers = kmeans.cluster_centers_.astype(int)
             
             # Calculate cluster sizes
             labels = kmeans.labels_
             counts = np.bincount(labels)
-            total_pixels = len(pixels)
+            total_pixels = len(labels)
             percentages = [count / total_pixels for count in counts]
             
             colors = [tuple(center) for center in centers]
@@ -386,6 +583,64 @@ class ColorAnalyzer:
         
         return colors, percentages
     
+    def _quantize_histogram(
+        self,
+        histogram: ColorHistogram,
+        n_colors: int,
+        warm_start: bool = False
+    ) -> Tuple[List[Tuple[int, int, int]], List[float]]:
+        """
+        Derive a palette from an accumulated color histogram.
+        
+        The occupied bins are clustered weighted by their pixel counts with
+        KMeans or, for the 'minibatch' method, MiniBatchKMeans. The 'dominant'
+        method takes the most populated bins without clustering.
+        
+        Args:
+            histogram: Histogram of the analyzed frames
+            n_colors: Number of colors to extract
+            warm_start: Whether to start clustering from the previous
+                warm-started palette
+            
+        Returns:
+            List of (r,g,b) tuples and their occurrence percentages
+        """
+        bin_colors, counts = histogram.occupied_colors()
+        
+        if len(bin_colors) <= n_colors or self.color_clustering_method == "dominant":
+            # Without clustering, the most populated bins are the palette
+            top = np.argsort(-counts, kind="stable")[:n_colors]
+            centers, weights = bin_colors[top], counts[top].astype(np.float64)
+        else:
+            # Cluster the bin colors weighted by their pixel counts
+            previous = self._previous_centers
+            if warm_start and previous is not None and len(previous) == n_colors:
+                init, n_init = previous, 1
+            else:
+                init, n_init = "k-means++", 10 if self.color_clustering_method == "kmeans" else 3
+            
+            if self.color_clustering_method == "minibatch":
+                kmeans = MiniBatchKMeans(
+                    n_clusters=n_colors, init=init, n_init=n_init,
+                    batch_size=min(len(bin_colors), 4096), random_state=0
+                )
+            else:
+                kmeans = KMeans(n_clusters=n_colors, init=init, n_init=n_init, random_state=0)
+            kmeans.fit(bin_colors, sample_weight=counts)
+            if warm_start:
+                self._previous_centers = kmeans.cluster_centers_
+            
+            centers = kmeans.cluster_centers_
+            weights = np.bincount(kmeans.labels_, weights=counts, minlength=n_colors)
+        
+        # Sort by percentage
+        order = np.argsort(-weights, kind="stable")
+        order = order[weights[order] > 0]
+        colors = [tuple(int(c) for c in centers[i]) for i in order]
+        percentages = [float(weights[i] / counts.sum()) for i in order]
+        
+        return colors, percentages
+    
     def _calculate_frame_metrics(self, frame: np.ndarray) -> Dict[str, float]:
         """
         Calculate color metrics for a frame.
@@ -396,52 +651,19 @@ class ColorAnalyzer:
         Returns:
             Dictionary of color metrics
         """
-        # Convert to float for calculations
-        frame_float = frame.astype(float)
-        
-        # Calculate brightness (mean of all pixels)
-        brightness = np.mean(frame_float) / 255.0
-        
-        # Convert to HSV for saturation
-        hsv = np.zeros_like(frame_float)
-        # Vectorized RGB to HSV
-        r, g, b = frame_float[:, :, 0] / 255.0, frame_float[:, :, 1] / 255.0, frame_float[:, :, 2] / 255.0
-        maxc = np.maximum(np.maximum(r, g), b)
-        minc = np.minimum(np.minimum(r, g), b)
-        hsv[:, :, 2] = maxc
-        delta = maxc - minc
-        # Set saturation to 0 where maxc is 0 to avoid divide by zero
-        hsv[:, :, 1] = np.divide(delta, maxc, out=np.zeros_like(delta), where=maxc!=0)
-        
-        # Calculate mean saturation
-        saturation = np.mean(hsv[:, :, 1])
-        
-        # Calculate contrast (standard deviation of brightness)
-        contrast = np.std(frame_float) / 255.0
-        
-        # Calculate color variance (mean of channel variances)
-        r_var = np.var(frame[:, :, 0]) / 255.0
-        g_var = np.var(frame[:, :, 1]) / 255.0
-        b_var = np.var(frame[:, :, 2]) / 255.0
-        color_variance = (r_var + g_var + b_var) / 3.0
-        
-        # Calculate colorfulness
-        rg = frame_float[:, :, 0] - frame_float[:, :, 1]
-        yb = 0.5 * (frame_float[:, :, 0] + frame_float[:, :, 1]) - frame_float[:, :, 2]
-        rg_mean = np.mean(rg)
-        yb_mean = np.mean(yb)
-        rg_std = np.std(rg)
-        yb_std = np.std(yb)
-        colorfulness = np.sqrt(rg_std**2 + yb_std**2) + 0.3 * np.sqrt(rg_mean**2 + yb_mean**2)
-        colorfulness = min(1.0, colorfulness / 100.0)  # Normalize
+        return self._calculate_batch_metrics(frame[np.newaxis])[0]
+    
+    def _calculate_batch_metrics(self, frames: Union[np.ndarray, List[np.ndarray]]) -> List[Dict[str, float]]:
+        """
+        Calculate color metrics for several equally sized frames at once.
         
-        return {
-            "brightness": brightness,
-            "saturation": saturation,
-            "contrast": contrast,
-            "color_variance": color_variance,
-            "colorfulness": colorfulness
-        }
+        Args:
+            frames: (N, H, W, 3) array or list of frames
+            
+        Returns:
+            List with a dictionary of color metrics per frame
+        """
+        return metrics_to_dicts(color_metrics(frames))
     
     def _rgb_to_hex(self, rgb: Tuple[int, int, int]) -> str:
         """Convert RGB tuple to hex color code."""
@@ -548,6 +770,167 @@ class ColorAnalyzer:
         
         return output_path
     
+    def _iter_interval_frames(
+        self,
+        video: VideoFileClip,
+        video_path: str,
+        intervals: List[Tuple[float, float]]
+    ) -> Iterator[List[np.ndarray]]:
+        """
+        Decode the sampled frames of consecutive time intervals.
+        
+        Args:
+            video: Clip to decode frames from
+            video_path: Path to the video file
+            intervals: Consecutive (start_time, end_time) tuples
+            
+        Yields:
+            List of sampled frames for each interval
+        """
+        if not intervals:
+            return
+        
+        if self.use_ffmpeg_reader:
+            with FFmpegFrameSource(
+                video_path,
+                self.frame_sample_rate,
+                start_time=intervals[0][0],
+                end_time=intervals[-1][1]
+            ) as source:
+                yield from group_frames_by_interval(tqdm(source, desc="Analyzing frames"), intervals)
+            return
+        
+        sampling_interval = 1.0 / self.frame_sample_rate
+        for i, (start, end) in enumerate(intervals):
+            sample_times = np.arange(start, end, sampling_interval)
+            yield [
+                video.get_frame(time)
+                for time in tqdm(sample_times, desc=f"Analyzing interval {i+1}/{len(intervals)}")
+            ]
+    
+    def _iter_sampled_frames(
+        self,
+        video: VideoFileClip,
+        video_path: str,
+        intervals: List[Tuple[float, float]]
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Decode the sampled frames of consecutive time intervals one at a time.
+        
+        Frames are not copied; each one is only valid until the next is read.
+        
+        Args:
+            video: Clip to decode frames from
+            video_path: Path to the video file
+            intervals: Consecutive (start_time, end_time) tuples
+            
+        Yields:
+            Tuples of (interval index, frame) in time order
+        """
+        if not intervals:
+            return
+        
+        if self.use_ffmpeg_reader:
+            with FFmpegFrameSource(
+                video_path,
+                self.frame_sample_rate,
+                start_time=intervals[0][0],
+                end_time=intervals[-1][1]
+            ) as source:
+                index = 0
+                for timestamp, frame in tqdm(source, desc="Analyzing frames"):
+                    while index < len(intervals) and timestamp >= intervals[index][1]:
+                        index += 1
+                    if index == len(intervals):
+                        break
+                    if timestamp >= intervals[index][0]:
+                        yield index, frame
+            return
+        
+        sampling_interval = 1.0 / self.frame_sample_rate
+        for i, (start, end) in enumerate(intervals):
+            sample_times = np.arange(start, end, sampling_interval)
+            for time in tqdm(sample_times, desc=f"Analyzing interval {i+1}/{len(intervals)}"):
+                yield i, video.get_frame(time)
+    
+    def _iter_interval_palettes(
+        self,
+        video: VideoFileClip,
+        video_path: str,
+        intervals: List[Tuple[float, float]],
+        warm_start: bool = False
+    ) -> Iterator[Optional[Tuple[List[Tuple[int, int, int]], List[float], Dict[str, float]]]]:
+        """
+        Extract the palette and color metrics of consecutive time intervals.
+        
+        Args:
+            video: Clip to decode frames from
+            video_path: Path to the video file
+            intervals: Consecutive (start_time, end_time) tuples
+            warm_start: Whether each palette starts from the previous one
+            
+        Yields:
+            For each interval, (colors, percentages, metrics), or None if no
+            frame was sampled in it
+        """
+        if self.color_accumulation != "histogram":
+            for frames in self._iter_interval_frames(video, video_path, intervals):
+                if not frames:
+                    yield None
+                    continue
+                
+                # Combine frames for analysis
+                combined_frame = np.mean(frames, axis=0).astype(np.uint8)
+                colors, percentages = self._quantize_colors(combined_frame, self.palette_size, warm_start)
+                yield colors, percentages, self._calculate_frame_metrics(combined_frame)
+            return
+        
+        def finish(histogram: ColorHistogram, metrics: List[Dict[str, float]]):
+            if histogram.frame_count == 0:
+                return None
+            colors, percentages = self._quantize_histogram(histogram, self.palette_size, warm_start)
+            mean_metrics = {name: float(np.mean([m[name] for m in metrics])) for name in metrics[0]}
+            return colors, percentages, mean_metrics
+        
+        # Frames are folded into the histogram of their interval as they are
+        # decoded; only the histogram of the current interval is kept
+        current = 0
+        histogram, metrics = ColorHistogram(self.histogram_bins), []
+        for index, frame in self._iter_sampled_frames(video, video_path, intervals):
+            while current < index:
+                yield finish(histogram, metrics)
+                histogram, metrics = ColorHistogram(self.histogram_bins), []
+                current += 1
+            histogram.add(frame)
+            metrics.append(self._calculate_frame_metrics(frame))
+        
+        for _ in range(current, len(intervals)):
+            yield finish(histogram, metrics)
+            histogram, metrics = ColorHistogram(self.histogram_bins), []
+    
+    def _iter_interval_palettes_parallel(
+        self,
+        video_path: str,
+        intervals: List[Tuple[float, float]]
+    ) -> Iterator[Optional[Tuple[List[Tuple[int, int, int]], List[float], Dict[str, float]]]]:
+        """
+        Extract the palette and color metrics of intervals in worker processes.
+        
+        Args:
+            video_path: Path to the video file
+            intervals: Consecutive (start_time, end_time) tuples
+            
+        Yields:
+            For each interval in order, (colors, percentages, metrics), or None
+            if no frame was sampled in it
+        """
+        # Forked workers can deadlock in the OpenMP runtime used by KMeans once
+        # this process has clustered, so workers are started fresh
+        with ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            yield from executor.map(_analyze_interval_palette, repeat(self), repeat(video_path), intervals)
+    
     def analyze_video_colors(
         self, 
         video_path: Union[str, Path],
@@ -587,6 +970,7 @@ class ColorAnalyzer:
         video_basename = os.path.splitext(os.path.basename(video_path))[0]
         
         segments = []
+        self._previous_centers = None
         all_colors = []
         all_percentages = []
         frame_metrics = []
@@ -599,44 +983,34 @@ class ColorAnalyzer:
             end_time = duration * (1.0 - self.skip_end_percent)
             effective_duration = end_time - start_time
             
-            # Calculate frame sampling interval
-            sampling_interval = 1.0 / self.frame_sample_rate
-            
             # Process video in segments or as a whole
             if create_segments:
                 # Define segments
                 segment_starts = np.arange(start_time, end_time, self.segment_duration)
+                segment_intervals = [
+                    (seg_start, min(seg_start + self.segment_duration, end_time))
+                    for seg_start in segment_starts
+                ]
                 
                 logger.info(f"Analyzing video in {len(segment_starts)} segments")
                 
-                for i, seg_start in enumerate(segment_starts):
-                    seg_end = min(seg_start + self.segment_duration, end_time)
-                    
-                    # Sample frames within this segment
-                    segment_frames = []
-                    segment_times = np.arange(seg_start, seg_end, sampling_interval)
-                    
-                    for time in tqdm(segment_times, desc=f"Analyzing segment {i+1}/{len(segment_starts)}"):
-                        frame = video.get_frame(time)
-                        segment_frames.append(frame)
-                    
-                    if not segment_frames:
-                        continue
-                    
-                    # Combine frames for analysis
-                    combined_frame = np.mean(segment_frames, axis=0).astype(np.uint8)
-                    
-                    # Extract colors
-                    colors, percentages = self._quantize_colors(
-                        combined_frame, 
-                        self.palette_size
+                if self.workers > 1:
+                    segment_palettes = self._iter_interval_palettes_parallel(video_path, segment_intervals)
+                else:
+                    segment_palettes = self._iter_interval_palettes(
+                        video, video_path, segment_intervals, warm_start=True
                     )
+                for i, ((seg_start, seg_end), palette) in enumerate(
+                    zip(segment_intervals, segment_palettes)
+                ):
+                    if palette is None:
+                        continue
                     
-                    # Calculate metrics
-                    metrics = self._calculate_frame_metrics(combined_frame)
+                    # Extract colors and metrics
+                    colors, percentages, metrics = palette
                     
                     # Create color names and hex values
-                    color_names = [ColorNameMatcher.get_color_name(color) for color in colors]
+                    color_names = ColorNameMatcher.get_color_names(colors)
                     color_hex = [self._rgb_to_hex(color) for color in colors]
                     
                     # Create segment
@@ -688,15 +1062,23 @@ class ColorAnalyzer:
                     self.palette_size
                 )
                 
+            elif self.color_accumulation == "histogram":
+                # Accumulate one histogram over the whole video
+                palette = list(self._iter_interval_palettes(video, video_path, [(start_time, end_time)]))[0]
+                if palette is None:
+                    raise ValueError(
+                        f"No frames were sampled between {start_time:.2f}s and {end_time:.2f}s of {video_path}"
+                    )
+                colors, percentages, metrics = palette
+                frame_metrics.append(metrics)
+                
             else:
                 # Sample frames throughout the video
-                sample_times = np.arange(start_time, end_time, sampling_interval)
                 frames = []
+                for interval_frames in self._iter_interval_frames(video, video_path, [(start_time, end_time)]):
+                    frames.extend(interval_frames)
                 
-                for time in tqdm(sample_times, desc="Analyzing frames"):
-                    frame = video.get_frame(time)
-                    frames.append(frame)
-                    frame_metrics.append(self._calculate_frame_metrics(frame))
+                frame_metrics.extend(self._calculate_batch_metrics(frames))
                 
                 # Combine frames for analysis
                 combined_frame = np.mean(frames, axis=0).astype(np.uint8)
@@ -708,7 +1090,7 @@ class ColorAnalyzer:
                 )
         
         # Create color names and hex values
-        color_names = [ColorNameMatcher.get_color_name(color) for color in colors]
+        color_names = ColorNameMatcher.get_color_names(colors)
         color_hex = [self._rgb_to_hex(color) for color in colors]
         
         # Generate complementary colors
@@ -788,6 +1170,30 @@ class ColorAnalyzer:
         return theme, segments
 
 
+def _analyze_interval_palette(
+    analyzer: ColorAnalyzer,
+    video_path: str,
+    interval: Tuple[float, float]
+) -> Optional[Tuple[List[Tuple[int, int, int]], List[float], Dict[str, float]]]:
+    """
+    Extract the palette of one interval in a worker process with its own decoder.
+    
+    Args:
+        analyzer: Analyzer with the settings to use
+        video_path: Path to the video file
+        interval: (start_time, end_time) of the interval
+        
+    Returns:
+        (colors, percentages, metrics), or None if no frame was sampled
+    """
+    if analyzer.use_ffmpeg_reader:
+        # The FFmpeg reader starts its own decoder at the interval's offset
+        return list(analyzer._iter_interval_palettes(None, video_path, [interval]))[0]
+    
+    with VideoFileClip(video_path) as video:
+        return list(analyzer._iter_interval_palettes(video, video_path, [interval]))[0]
+
+
 def analyze_video_colors(
     video_path: Union[str, Path],
     output_dir: Optional[Union[str, Path]] = None,
@@ -797,7 +1203,12 @@ def analyze_video_colors(
     create_palette_image: bool = True,
     create_segments: bool = True,
     segment_palette_images: bool = False,
-    metadata_file: Optional[Union[str, Path]] = None
+    metadata_file: Optional[Union[str, Path]] = None,
+    use_ffmpeg_reader: bool = False,
+    color_clustering_method: str = "kmeans",
+    max_palette_pixels: int = 20000,
+    color_accumulation: str = "average",
+    workers: int = 1
 ) -> Dict[str, Any]:
     """
     Analyze colors in a video.
@@ -812,6 +1223,15 @@ def analyze_video_colors(
         create_segments: Whether to analyze the video in segments
         segment_palette_images: Whether to create palette images for each segment
         metadata_file: Optional path to save color metadata as JSON
+        use_ffmpeg_reader: Whether to decode sampled frames through a single
+            FFmpeg process
+        color_clustering_method: Method for color clustering ('kmeans',
+            'minibatch' or 'dominant')
+        max_palette_pixels: Maximum number of pixels clustered per palette with
+            the 'minibatch' method
+        color_accumulation: How sampled frames are combined ('average' or
+            'histogram' for a streaming color histogram per segment)
+        workers: Number of worker processes analyzing segments
         
     Returns:
         Dictionary with color analysis results
@@ -821,6 +1241,11 @@ def analyze_video_colors(
         palette_size=palette_size,
         frame_sample_rate=frame_sample_rate,
         segment_duration=segment_duration,
+        use_ffmpeg_reader=use_ffmpeg_reader,
+        color_clustering_method=color_clustering_method,
+        max_palette_pixels=max_palette_pixels,
+        color_accumulation=color_accumulation,
+        workers=workers,
     )
     
     # Analyze the video
@@ -0,0 +1,223 @@
+"""
+Batched frame metrics for video analysis.
+
+The color analyzer and the thumbnail generator score sampled frames by
+brightness, saturation, contrast, colorfulness and sharpness. Computing these
+one frame at a time creates several float64 copies of every frame. The
+functions in this module instead take an (N, H, W, 3) uint8 stack of frames,
+work through it in batches with two float32 scratch planes that are reused for
+every intermediate result, and return one record per frame in a structured
+array.
+
+Both analyzers keep their own metric definitions, so that thresholds tuned
+for them stay valid: ``color_metrics`` matches the color analyzer and
+``thumbnail_metrics`` matches the PIL-based metrics of the thumbnail
+generator.
+"""
+
+from typing import Dict, Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+
+# Metrics of the color analyzer
+COLOR_METRICS_DTYPE = np.dtype([
+    ("brightness", np.float32),
+    ("saturation", np.float32),
+    ("contrast", np.float32),
+    ("color_variance", np.float32),
+    ("colorfulness", np.float32),
+])
+
+# Metrics of the thumbnail generator
+THUMBNAIL_METRICS_DTYPE = np.dtype([
+    ("brightness", np.float32),
+    ("contrast", np.float32),
+    ("colorfulness", np.float32),
+    ("sharpness", np.float32),
+])
+
+# Fixed-point weights PIL uses to convert RGB to luma ("L" mode)
+_LUMA_WEIGHTS = (19595, 38470, 7471)
+_LUMA_SHIFT = 16
+
+Frames = Union[np.ndarray, Sequence[np.ndarray]]
+
+
+def _iter_batches(
+    frames: Frames,
+    batch_size: int
+) -> Iterator[Tuple[int, np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Split a frame stack into batches with reused float32 scratch planes.
+
+    Args:
+        frames: (N, H, W, 3) uint8 array or sequence of equally sized RGB frames
+        batch_size: Number of frames per batch
+
+    Yields:
+        (offset, batch, plane_a, plane_b) where batch is the (n, H, W, 3)
+        frames starting at offset and the planes are (n, H, W) float32 buffers
+    """
+    batch_size = max(1, batch_size)
+    planes = None
+
+    for offset in range(0, len(frames), batch_size):
+        batch = np.asarray(frames[offset:offset + batch_size], dtype=np.uint8)
+        if batch.ndim != 4 or batch.shape[-1] != 3:
+            raise ValueError(f"Expected an (N, H, W, 3) stack of RGB frames, got shape {batch.shape}")
+
+        if planes is None:
+            shape = (min(batch_size, len(frames)),) + batch.shape[1:3]
+            planes = (np.empty(shape, dtype=np.float32), np.empty(shape, dtype=np.float32))
+
+        count = len(batch)
+        yield offset, batch, planes[0][:count], planes[1][:count]
+
+
+def _center_and_square(plane: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute per-frame means and variances of a plane, overwriting it.
+
+    Args:
+        plane: (n, H, W) float32 plane; replaced by its squared deviations
+
+    Returns:
+        Tuple of (means, variances), each of shape (n,)
+    """
+    mean = plane.mean(axis=(1, 2), dtype=np.float64)
+    plane -= mean.astype(np.float32)[:, np.newaxis, np.newaxis]
+    np.square(plane, out=plane)
+    return mean, plane.mean(axis=(1, 2), dtype=np.float64)
+
+
+def color_metrics(frames: Frames, batch_size: int = 8) -> np.ndarray:
+    """
+    Calculate the color analyzer's metrics for a stack of frames.
+
+    Args:
+        frames: (N, H, W, 3) uint8 array or sequence of equally sized RGB frames
+        batch_size: Number of frames processed together; bounds the scratch
+            memory to two float32 planes of this many frames
+
+    Returns:
+        Structured array of COLOR_METRICS_DTYPE with one record per frame:
+        brightness (mean pixel value), saturation (mean HSV saturation),
+        contrast (standard deviation of pixel values), color_variance (mean
+        channel variance divided by 255) and colorfulness (Hasler-Suesstrunk
+        measure divided by 100), all clipped or scaled to 0-1 as before
+    """
+    metrics = np.zeros(len(frames), dtype=COLOR_METRICS_DTYPE)
+
+    for offset, batch, plane_a, plane_b in _iter_batches(frames, batch_size):
+        out = metrics[offset:offset + len(batch)]
+        red, green, blue = batch[..., 0], batch[..., 1], batch[..., 2]
+
+        # Channel means and variances
+        channel_means = np.empty((len(batch), 3))
+        channel_vars = np.empty((len(batch), 3))
+        for c in range(3):
+            np.copyto(plane_a, batch[..., c])
+            channel_means[:, c], channel_vars[:, c] = _center_and_square(plane_a)
+
+        mean = channel_means.mean(axis=1)
+        out["brightness"] = mean / 255.0
+        out["color_variance"] = channel_vars.mean(axis=1) / 255.0
+        # Variance over all values is the mean channel variance plus the
+        # variance of the channel means
+        spread = ((channel_means - mean[:, np.newaxis]) ** 2).mean(axis=1)
+        out["contrast"] = np.sqrt(channel_vars.mean(axis=1) + spread) / 255.0
+
+        # Saturation is (max - min) / max, and 0 where max is 0
+        np.maximum(red, green, out=plane_a)
+        np.maximum(plane_a, blue, out=plane_a)
+        np.minimum(red, green, out=plane_b)
+        np.minimum(plane_b, blue, out=plane_b)
+        np.subtract(plane_a, plane_b, out=plane_b)
+        np.maximum(plane_a, 1.0, out=plane_a)
+        np.divide(plane_b, plane_a, out=plane_b)
+        out["saturation"] = plane_b.mean(axis=(1, 2), dtype=np.float64)
+
+        # Colorfulness from the red-green and yellow-blue opponent planes
+        np.subtract(red, green, out=plane_a, dtype=np.float32)
+        rg_mean, rg_var = _center_and_square(plane_a)
+        np.add(red, green, out=plane_b, dtype=np.float32)
+        plane_b *= 0.5
+        plane_b -= blue
+        yb_mean, yb_var = _center_and_square(plane_b)
+        colorfulness = np.sqrt(rg_var + yb_var) + 0.3 * np.sqrt(rg_mean ** 2 + yb_mean ** 2)
+        out["colorfulness"] = np.minimum(1.0, colorfulness / 100.0)
+
+    return metrics
+
+
+def thumbnail_metrics(frames: Frames, batch_size: int = 8) -> np.ndarray:
+    """
+    Calculate the thumbnail generator's metrics for a stack of frames.
+
+    The metrics reproduce the PIL computations the thumbnail generator used:
+    luma uses PIL's fixed-point RGB to "L" conversion, and the edge image
+    applies the FIND_EDGES kernel and keeps the border pixels of the frame.
+
+    Args:
+        frames: (N, H, W, 3) uint8 array or sequence of equally sized RGB frames
+        batch_size: Number of frames processed together; bounds the scratch
+            memory to two float32 planes of this many frames
+
+    Returns:
+        Structured array of THUMBNAIL_METRICS_DTYPE with one record per frame:
+        brightness (mean luma), contrast (luma range), colorfulness (scaled
+        variance of the channel means) and sharpness (scaled standard
+        deviation of the red channel's edge image), all in 0-1
+    """
+    metrics = np.zeros(len(frames), dtype=THUMBNAIL_METRICS_DTYPE)
+
+    for offset, batch, plane_a, plane_b in _iter_batches(frames, batch_size):
+        out = metrics[offset:offset + len(batch)]
+
+        # Fixed-point luma; every intermediate value is an integer below 2**24,
+        # so float32 holds it exactly
+        np.multiply(batch[..., 0], np.float32(_LUMA_WEIGHTS[0]), out=plane_a)
+        for c in (1, 2):
+            np.multiply(batch[..., c], np.float32(_LUMA_WEIGHTS[c]), out=plane_b)
+            plane_a += plane_b
+        plane_a += 1 << (_LUMA_SHIFT - 1)
+        plane_a *= np.float32(1.0 / (1 << _LUMA_SHIFT))
+        np.floor(plane_a, out=plane_a)
+
+        out["brightness"] = plane_a.mean(axis=(1, 2), dtype=np.float64) / 255.0
+        out["contrast"] = (plane_a.max(axis=(1, 2)) - plane_a.min(axis=(1, 2))) / 255.0
+
+        channel_means = batch.mean(axis=(1, 2), dtype=np.float64)
+        out["colorfulness"] = np.minimum(1.0, np.var(channel_means, axis=1) / 255.0 * 5)
+
+        # 3x3 edge kernel (8 at the center, -1 around it) on the red channel,
+        # clipped to 0-255, with the border pixels left as they are
+        red = batch[..., 0]
+        height, width = red.shape[1:]
+        np.copyto(plane_b, red)
+        inner = plane_b[:, 1:-1, 1:-1]
+        np.multiply(red[:, 1:-1, 1:-1], np.float32(8), out=inner)
+        for dy in range(3):
+            for dx in range(3):
+                if (dy, dx) != (1, 1):
+                    inner -= red[:, dy:height - 2 + dy, dx:width - 2 + dx]
+        np.clip(inner, 0, 255, out=inner)
+
+        _, edge_var = _center_and_square(plane_b)
+        out["sharpness"] = np.minimum(1.0, np.sqrt(edge_var) / 50.0)
+
+    return metrics
+
+
+def metrics_to_dicts(metrics: np.ndarray) -> List[Dict[str, float]]:
+    """
+    Convert a structured metrics array into one dictionary per frame.
+
+    Args:
+        metrics: Structured array returned by color_metrics or thumbnail_metrics
+
+    Returns:
+        List of dictionaries mapping metric names to floats
+    """
+    names = metrics.dtype.names
+    return [{name: float(record[name]) for name in names} for record in metrics]
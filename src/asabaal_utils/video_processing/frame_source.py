@@ -0,0 +1,206 @@
+"""
+Raw FFmpeg frame source for video analysis.
+
+The analysis modules sample frames at a fixed rate. Calling
+``VideoFileClip.get_frame`` for every sample can make MoviePy seek and
+re-decode, so this module instead starts a single FFmpeg process whose
+``fps`` and ``scale`` filters produce exactly the sampled frames, and reads
+them from a raw rgb24 pipe.
+"""
+
+import logging
+import subprocess
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+logger = logging.getLogger(__name__)
+
+
+class FFmpegFrameSource:
+    """
+    Decodes frames sampled at a fixed rate through one FFmpeg process.
+
+    Iterating yields ``(timestamp, frame)`` tuples where frame is an RGB
+    uint8 array of shape (height, width, 3). Frames are read into a small
+    ring of reused buffers: a yielded frame stays valid while the next frame
+    is read, so comparing consecutive frames needs no copies, but callers that
+    keep frames for longer must copy them.
+    """
+
+    def __init__(
+        self,
+        video_path: Union[str, Path],
+        sample_rate: float,
+        start_time: float = 0.0,
+        end_time: Optional[float] = None,
+        width: Optional[int] = None,
+        buffer_count: int = 2,
+        frame_ranges: Optional[Sequence[Tuple[int, int]]] = None,
+    ):
+        """
+        Initialize the frame source.
+
+        Args:
+            video_path: Path to the video file
+            sample_rate: Frames per second to produce
+            start_time: Time of the first sampled frame in seconds
+            end_time: Time to stop sampling at in seconds (default: end of video)
+            width: Width in pixels to scale frames to, keeping the aspect ratio
+                (None to keep the source resolution)
+            buffer_count: Number of reused frame buffers
+            frame_ranges: Sorted, non-overlapping (first, end) ranges of sample
+                numbers, counted from start_time, to produce (None for all).
+                FFmpeg still decodes the frames between the ranges but drops
+                them before scaling, so one process serves every range.
+        """
+        self.video_path = str(video_path)
+        self.sample_rate = sample_rate
+        self.start_time = start_time
+        self.buffer_count = max(1, buffer_count)
+        self.frame_ranges = None if frame_ranges is None else [
+            (int(first), int(end)) for first, end in frame_ranges if end > first
+        ]
+
+        infos = ffmpeg_parse_infos(self.video_path)
+        self.source_size = tuple(infos["video_size"])
+        source_width, source_height = self.source_size
+        self.duration = infos["duration"]
+        self.end_time = self.duration if end_time is None else min(end_time, self.duration)
+
+        if width and width != source_width:
+            # Keep dimensions even so every pixel format can be scaled to them
+            self.width = int(width)
+            self.height = max(2, int(round(source_height * width / source_width / 2)) * 2)
+        else:
+            self.width, self.height = source_width, source_height
+
+        self._process = None
+
+    def _build_command(self) -> List[str]:
+        """Build the FFmpeg command that writes sampled frames to stdout."""
+        # The seek below is not accurate, so frames before start_time reach the
+        # filter with negative timestamps. start_time=0 anchors the sampling
+        # grid at the requested start, and round=up selects the last frame at
+        # or before each sample time, like VideoFileClip.get_frame does.
+        filters = [f"fps={self.sample_rate}:round=up:start_time=0"]
+        if self.frame_ranges is not None:
+            selected = "+".join(f"between(n,{first},{end - 1})" for first, end in self.frame_ranges)
+            filters.append(f"select='{selected or 0}'")
+        if (self.width, self.height) != self.source_size:
+            filters.append(f"scale={self.width}:{self.height}")
+
+        return [
+            "ffmpeg",
+            "-v", "error",
+            "-ss", f"{self.start_time:.6f}",
+            "-noaccurate_seek",
+            "-i", self.video_path,
+            # Leave a sample of slack so the last sample before end_time is
+            # not cut off; iteration stops at end_time itself
+            "-t", f"{self.end_time - self.start_time + 1.0 / self.sample_rate:.6f}",
+            "-an", "-sn",
+            "-vf", ",".join(filters),
+            # Do not duplicate frames to fill the gaps between frame ranges
+            "-vsync", "passthrough",
+            "-f", "rawvideo",
+            "-pix_fmt", "rgb24",
+            "-"
+        ]
+
+    def _iter_sample_numbers(self) -> Iterator[int]:
+        """Yield the sample numbers of the produced frames in order."""
+        if self.frame_ranges is None:
+            sample = 0
+            while True:
+                yield sample
+                sample += 1
+        else:
+            for first, end in self.frame_ranges:
+                yield from range(first, end)
+
+    def __iter__(self) -> Iterator[Tuple[float, np.ndarray]]:
+        """Start FFmpeg and yield (timestamp, frame) tuples."""
+        if self.end_time <= self.start_time:
+            return
+
+        frame_size = self.width * self.height * 3
+        buffers = [bytearray(frame_size) for _ in range(self.buffer_count)]
+        frames = [
+            np.frombuffer(buffer, dtype=np.uint8).reshape(self.height, self.width, 3)
+            for buffer in buffers
+        ]
+
+        self._process = subprocess.Popen(
+            self._build_command(), stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        index = 0
+        try:
+            for sample in self._iter_sample_numbers():
+                timestamp = self.start_time + sample / self.sample_rate
+                if timestamp >= self.end_time:
+                    break
+
+                view = memoryview(buffers[index % self.buffer_count])
+                filled = 0
+                while filled < frame_size:
+                    count = self._process.stdout.readinto(view[filled:])
+                    if not count:
+                        break
+                    filled += count
+                if filled < frame_size:
+                    break
+
+                yield timestamp, frames[index % self.buffer_count]
+                index += 1
+        finally:
+            self.close()
+
+        logger.debug(f"Read {index} frames from {self.video_path}")
+
+    def close(self) -> None:
+        """Stop the FFmpeg process if it is still running."""
+        if self._process is None:
+            return
+
+        process, self._process = self._process, None
+        if process.poll() is None:
+            process.kill()
+        process.communicate()
+
+        if process.returncode not in (0, -9):
+            logger.warning(f"FFmpeg frame reader exited with code {process.returncode}")
+
+    def __enter__(self) -> "FFmpegFrameSource":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def group_frames_by_interval(
+    frames: Iterable[Tuple[float, np.ndarray]],
+    intervals: Sequence[Tuple[float, float]]
+) -> Iterator[List[np.ndarray]]:
+    """
+    Collect timestamped frames into consecutive time intervals.
+
+    Args:
+        frames: Iterable of (timestamp, frame) tuples in time order
+        intervals: Consecutive (start, end) intervals in time order
+
+    Yields:
+        For each interval, copies of the frames with start <= timestamp < end
+    """
+    frames = iter(frames)
+    pending = next(frames, None)
+
+    for start, end in intervals:
+        interval_frames = []
+        while pending is not None and pending[0] < end:
+            if pending[0] >= start:
+                interval_frames.append(pending[1].copy())
+            pending = next(frames, None)
+        yield interval_frames
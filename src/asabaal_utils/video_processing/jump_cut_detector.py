@@ -5,14 +5,20 @@ This module provides utilities for detecting and optionally smoothing jump cuts
 """
 
 import os
+import re
 import logging
 import tempfile
 import json
+import subprocess
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple, Union, Set
+from typing import List, Dict, Any, Optional, Tuple, Union, Set, Iterable, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 import math
+import itertools
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 
 import numpy as np
 from tqdm import tqdm
@@ -23,11 +29,46 @@ from moviepy.video.compositing.transitions import crossfadein
 from moviepy.video.fx.fadein import fadein
 from moviepy.video.fx.fadeout import fadeout
 from PIL import Image, ImageChops, ImageFilter
-from scipy.ndimage import gaussian_filter
-from skimage.metrics import structural_similarity as ssim
+from scipy.ndimage import gaussian_filter, median_filter, uniform_filter
+
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+from .frame_source import FFmpegFrameSource
+from .npz_cache import NpzCache
 
 logger = logging.getLogger(__name__)
 
+# Number of frame pairs scored per worker task
+_PAIR_BATCH_SIZE = 16
+
+# Upper bound for the shared memory holding frames of in-flight batches
+_PAIR_BUFFER_BYTES = 256 * 1024 * 1024
+
+# Per-process state of frame pair scoring workers
+_pair_worker_state: Dict[str, Any] = {}
+
+# Columns of the frame score table produced while scanning a video
+FRAME_SCORE_DTYPE = np.dtype([
+    ("frame_index", np.int32),
+    ("timestamp", np.float64),
+    ("previous_timestamp", np.float64),
+    ("similarity_score", np.float32),
+    ("difference_score", np.float32),
+    ("motion_score", np.float32),
+    ("color_change_score", np.float32),
+    ("total_score", np.float32),
+])
+
+# Cache namespace of per-frame metrics
+METRICS_CACHE_NAMESPACE = "jump_cut_metrics"
+
+# Structural similarity parameters, matching the skimage.metrics.structural_similarity
+# defaults for uint8 images (7x7 uniform window, sample covariance)
+_SSIM_WIN_SIZE = 7
+_SSIM_COV_NORM = _SSIM_WIN_SIZE ** 2 / (_SSIM_WIN_SIZE ** 2 - 1)
+_SSIM_C1 = (0.01 * 255) ** 2
+_SSIM_C2 = (0.03 * 255) ** 2
+
 
 class TransitionType(Enum):
     """Types of transitions that can be applied to jump cuts."""
@@ -44,6 +85,22 @@ class TransitionType(Enum):
     NONE = "none"  # No transition, just for detection
 
 
+# FFmpeg xfade transitions used to render each transition type. xfade has no
+# zoom-out, so it falls back to a plain fade.
+_XFADE_TRANSITIONS = {
+    TransitionType.CROSSFADE: "fade",
+    TransitionType.FADE_BLACK: "fadeblack",
+    TransitionType.FADE_WHITE: "fadewhite",
+    TransitionType.DISSOLVE: "dissolve",
+    TransitionType.WIPE_LEFT: "wipeleft",
+    TransitionType.WIPE_RIGHT: "wiperight",
+    TransitionType.WIPE_UP: "wipeup",
+    TransitionType.WIPE_DOWN: "wipedown",
+    TransitionType.ZOOM_IN: "zoomin",
+    TransitionType.ZOOM_OUT: "fade",
+}
+
+
 @dataclass
 class JumpCut:
     """A detected jump cut in a video."""
@@ -99,6 +156,14 @@ class JumpCutDetector:
         motion_weight: float = 0.8,
         color_weight: float = 0.6,
         smoothing_window: int = 3,  # Number of frames to smooth detection results
+        analysis_width: Optional[int] = None,  # Width frames are decoded at for scoring
+        thumbnail_width: Optional[int] = None,  # Width of the color thumbnail used for color metrics
+        use_ffmpeg_reader: bool = False,  # Decode sampled frames through one FFmpeg pipe
+        workers: int = 1,  # Processes scoring frame pairs
+        scene_prefilter: bool = False,  # Only analyze windows around FFmpeg scene changes
+        scene_threshold: float = 0.1,  # FFmpeg scene score (0-1) for candidate cuts
+        scene_window: float = 1.0,  # Seconds analyzed on each side of a candidate
+        cache: Optional[NpzCache] = None,  # Store of per-frame metrics
     ):
         """
         Initialize the jump cut detector.
@@ -115,6 +180,27 @@ class JumpCutDetector:
             motion_weight: Weight of motion detection in detection
             color_weight: Weight of color changes in detection
             smoothing_window: Number of frames to smooth detection results
+            analysis_width: Width in pixels that frames are decoded at for scoring
+                (None to score full-resolution frames). A proxy such as 320 is
+                much faster but changes the metrics slightly, so sensitivity
+                may need retuning. Saved frames and timestamps are not affected.
+            thumbnail_width: Width in pixels of the color thumbnail used for the
+                pixel difference and color histogram metrics (None to use the
+                scored frame itself)
+            use_ffmpeg_reader: Whether to decode the sampled frames with a single
+                FFmpeg process instead of seeking with MoviePy for each frame
+            workers: Number of worker processes scoring frame pairs (1 scores
+                them in this process)
+            scene_prefilter: Whether to first find candidate cuts with FFmpeg's
+                scene change score in one low-resolution pass and analyze only
+                the frames around them
+            scene_threshold: Minimum FFmpeg scene change score (0-1) of a
+                candidate cut. Keep this low; candidates are only a prefilter.
+            scene_window: Seconds analyzed on each side of a candidate cut
+            cache: Optional on-disk cache. When given, the raw per-frame metrics
+                are stored in it, and re-runs on the same video with a different
+                sensitivity, weights, smoothing window or minimum interval
+                re-score the cached metrics without decoding.
         """
         self.sensitivity = sensitivity
         self.min_jump_interval = min_jump_interval
@@ -127,6 +213,14 @@ class JumpCutDetector:
         self.motion_weight = motion_weight
         self.color_weight = color_weight
         self.smoothing_window = smoothing_window
+        self.analysis_width = analysis_width
+        self.thumbnail_width = thumbnail_width
+        self.use_ffmpeg_reader = use_ffmpeg_reader
+        self.workers = max(1, workers)
+        self.scene_prefilter = scene_prefilter
+        self.scene_threshold = scene_threshold
+        self.scene_window = scene_window
+        self.cache = cache
         
         # Thresholds based on sensitivity
         self.similarity_threshold = 0.8 - (sensitivity * 0.3)  # Lower is more sensitive
@@ -149,16 +243,90 @@ class JumpCutDetector:
         Returns:
             Tuple of (similarity_score, difference_score, motion_score, color_change_score)
         """
-        # Convert to grayscale for structural similarity
-        gray1 = np.mean(frame1, axis=2).astype(np.uint8)
-        gray2 = np.mean(frame2, axis=2).astype(np.uint8)
+        return self._compare_analysis_frames(
+            self._prepare_analysis_frame(frame1),
+            self._prepare_analysis_frame(frame2)
+        )
+    
+    def _prepare_analysis_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, np.ndarray, Tuple]:
+        """
+        Reduce a decoded frame to what the difference metrics need.
         
-        # Calculate structural similarity
-        try:
-            similarity_score = ssim(gray1, gray2)
-        except Exception:
-            # Fallback if SSIM fails (e.g., if images are too different)
+        The local moments are computed once per frame and reused for both
+        pairs the frame belongs to.
+        
+        Args:
+            frame: Frame as numpy array
+            
+        Returns:
+            Tuple of (grayscale frame, color thumbnail, SSIM local moments)
+        """
+        # Convert to grayscale for structural similarity and edges
+        gray = np.mean(frame, axis=2).astype(np.uint8)
+        
+        return gray, self._color_thumbnail(frame), _ssim_moments(gray)
+    
+    def _prepare_analysis_batch(self, frames: np.ndarray) -> List[Tuple[np.ndarray, np.ndarray, Tuple]]:
+        """
+        Prepare a stack of frames, filtering all of them at once.
+        
+        Args:
+            frames: Frames as an array of shape (N, height, width, 3)
+            
+        Returns:
+            List of (grayscale frame, color thumbnail, SSIM local moments)
+        """
+        grays = np.mean(frames, axis=3).astype(np.uint8)
+        means, variances = _ssim_moments(grays)
+        
+        return [
+            (grays[j], self._color_thumbnail(frames[j]), (means[j], variances[j]))
+            for j in range(len(frames))
+        ]
+    
+    def _color_thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Downscale a frame for the pixel and histogram differences.
+        
+        Args:
+            frame: Frame as numpy array
+            
+        Returns:
+            Frame resized to thumbnail_width, or the frame itself if it is smaller
+        """
+        height, width = frame.shape[:2]
+        if self.thumbnail_width and width > self.thumbnail_width:
+            thumbnail_height = max(1, round(height * self.thumbnail_width / width))
+            return np.asarray(
+                Image.fromarray(frame).resize((self.thumbnail_width, thumbnail_height), Image.BOX)
+            )
+        return frame
+    
+    def _compare_analysis_frames(
+        self,
+        analysis1: Tuple[np.ndarray, np.ndarray, Tuple],
+        analysis2: Tuple[np.ndarray, np.ndarray, Tuple]
+    ) -> Tuple[float, float, float, float]:
+        """
+        Calculate difference metrics between two prepared analysis frames.
+        
+        Args:
+            analysis1: (grayscale, thumbnail, SSIM moments) of the first frame
+            analysis2: (grayscale, thumbnail, SSIM moments) of the second frame
+            
+        Returns:
+            Tuple of (similarity_score, difference_score, motion_score, color_change_score)
+        """
+        gray1, frame1, moments1 = analysis1
+        gray2, frame2, moments2 = analysis2
+        
+        # Calculate structural similarity from the cached moments; only the
+        # cross term depends on both frames
+        if min(gray1.shape) < _SSIM_WIN_SIZE:
+            # Fallback for frames smaller than the SSIM window
             similarity_score = 0.0
+        else:
+            similarity_score = _ssim_from_moments(gray1, moments1, gray2, moments2)
         
         # Calculate mean absolute difference
         diff = np.abs(frame1.astype(np.float32) - frame2.astype(np.float32))
@@ -304,6 +472,444 @@ class JumpCutDetector:
         
         return frame1_path, frame2_path
     
+    def _detect_scene_candidates(self, video_path: str) -> Optional[List[float]]:
+        """
+        Find candidate cut times with FFmpeg's scene change detection.
+        
+        The video is decoded once and scaled down before the select filter
+        scores the change between consecutive frames.
+        
+        Args:
+            video_path: Path to the video file
+            
+        Returns:
+            Times of frames whose scene score exceeds scene_threshold, or None
+            if FFmpeg failed
+        """
+        cmd = [
+            "ffmpeg",
+            "-v", "error",
+            "-i", video_path,
+            "-an", "-sn",
+            "-vf", f"scale=160:-2,select='gt(scene,{self.scene_threshold})',metadata=print:file=-",
+            "-f", "null",
+            "-"
+        ]
+        
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            logger.warning(f"FFmpeg scene detection failed: {result.stderr.strip()}")
+            return None
+        
+        candidates = []
+        for line in result.stdout.splitlines():
+            match = re.search(r"pts_time:\s*([\d.]+)", line)
+            if match:
+                candidates.append(float(match.group(1)))
+        
+        return candidates
+    
+    def _candidate_windows(self, video_path: str, sample_times: np.ndarray) -> List[Tuple[int, int]]:
+        """
+        Get the ranges of sampled frames to analyze.
+        
+        Args:
+            video_path: Path to the video file
+            sample_times: Timestamps of all sampled frames
+            
+        Returns:
+            Sorted, non-overlapping (first, end) index ranges into sample_times
+        """
+        everything = [(0, len(sample_times))]
+        if not self.scene_prefilter or len(sample_times) < 2:
+            return everything
+        
+        candidates = self._detect_scene_candidates(video_path)
+        if candidates is None:
+            logger.warning("Falling back to analyzing every sampled frame")
+            return everything
+        
+        windows = []
+        for candidate in candidates:
+            # Include the last sample before the candidate so the pair spanning
+            # the change is scored
+            first = min(
+                np.searchsorted(sample_times, candidate - self.scene_window),
+                max(0, np.searchsorted(sample_times, candidate, side="right") - 1)
+            )
+            end = np.searchsorted(sample_times, candidate + self.scene_window, side="right")
+            if end - first < 2:
+                continue
+            if windows and first <= windows[-1][1]:
+                windows[-1] = (windows[-1][0], max(windows[-1][1], int(end)))
+            else:
+                windows.append((int(first), int(end)))
+        
+        analyzed = sum(end - first for first, end in windows)
+        logger.info(f"Scene prefilter found {len(candidates)} candidates; "
+                    f"analyzing {analyzed} of {len(sample_times)} sampled frames")
+        return windows
+    
+    def _iter_analysis_windows(
+        self,
+        video_path: str,
+        video: VideoFileClip,
+        sample_times: np.ndarray,
+        windows: List[Tuple[int, int]]
+    ) -> Iterator[Tuple[int, Iterator[Tuple[float, np.ndarray]]]]:
+        """
+        Decode the sampled frames of every analyzed window with one decoder.
+        
+        Frames wider than analysis_width are scaled down by FFmpeg while
+        decoding, either through a second VideoFileClip or through an
+        FFmpegFrameSource if use_ffmpeg_reader is set. The decoder is opened
+        once for all windows: the FFmpeg reader selects the frames of every
+        window in a single process, and the scaled clip seeks between them.
+        
+        Args:
+            video_path: Path to the video file
+            video: Full-resolution clip of the same video
+            sample_times: Timestamps of all sampled frames
+            windows: Sorted, non-overlapping, non-empty (first, end) index
+                ranges into sample_times, as returned by _candidate_windows
+            
+        Yields:
+            Tuples of (first, frames) for every window, where frames yields
+            (timestamp, frame) and must be consumed before the next window
+        """
+        if not windows or windows[-1][1] <= windows[0][0]:
+            return
+        
+        width = None
+        if self.analysis_width and video.w > self.analysis_width:
+            width = self.analysis_width
+            logger.info(f"Decoding analysis frames at {width}px width "
+                        f"(source is {video.w}x{video.h})")
+        
+        if self.use_ffmpeg_reader:
+            offset = windows[0][0]
+            with FFmpegFrameSource(
+                video_path,
+                self.frame_sample_rate,
+                start_time=sample_times[offset],
+                end_time=sample_times[windows[-1][1] - 1] + 0.5 / self.frame_sample_rate,
+                width=width,
+                frame_ranges=[(first - offset, end - offset) for first, end in windows]
+            ) as source:
+                frames = iter(source)
+                for first, end in windows:
+                    yield first, itertools.islice(frames, end - first)
+            return
+        
+        analysis_video = video
+        if width:
+            analysis_video = VideoFileClip(video_path, audio=False, target_resolution=(None, width))
+        try:
+            for first, end in windows:
+                yield first, ((time, analysis_video.get_frame(time)) for time in sample_times[first:end])
+        finally:
+            if analysis_video is not video:
+                analysis_video.close()
+    
+    def _iter_pair_metrics(
+        self,
+        windows: Iterable[Tuple[int, Iterable[Tuple[float, np.ndarray]]]]
+    ) -> Iterator[Tuple[int, int, float, float, Tuple[float, float, float, float]]]:
+        """
+        Compute the difference metrics of consecutive frames in this process.
+        
+        Args:
+            windows: Iterable yielding (first, frames) for every window, where
+                first is the index of the window's first frame and frames
+                yields (timestamp, frame)
+            
+        Yields:
+            Tuples of (window_number, frame_index, timestamp, previous_timestamp,
+            metrics); frames of different windows are not compared
+        """
+        for window, (first, frames) in enumerate(windows):
+            prev_analysis = None
+            prev_timestamp = None
+            
+            for i, (timestamp, frame) in enumerate(frames, start=first):
+                curr_analysis = self._prepare_analysis_frame(frame)
+                if prev_analysis is not None:
+                    yield window, i, timestamp, prev_timestamp, self._compare_analysis_frames(
+                        prev_analysis, curr_analysis
+                    )
+                
+                prev_analysis = curr_analysis
+                prev_timestamp = timestamp
+    
+    def _iter_pair_metrics_parallel(
+        self,
+        windows: Iterable[Tuple[int, Iterable[Tuple[float, np.ndarray]]]]
+    ) -> Iterator[Tuple[int, int, float, float, Tuple[float, float, float, float]]]:
+        """
+        Compute the difference metrics of consecutive frames in worker processes.
+        
+        Frames are copied into batches in a shared memory ring so workers read
+        them without pickling. Each batch starts with the last frame of the
+        previous batch, or with the first frame of its window, and results are
+        yielded in frame order. The pool and the ring are created once, at the
+        first frame, and serve every window.
+        
+        Args:
+            windows: Iterable yielding (first, frames) for every window, where
+                first is the index of the window's first frame and frames
+                yields (timestamp, frame)
+            
+        Yields:
+            Tuples of (window_number, frame_index, timestamp, previous_timestamp,
+            metrics); frames of different windows are not compared
+        """
+        windows = iter(enumerate(windows))
+        for window, (first, frames) in windows:
+            frames = iter(frames)
+            head = next(frames, None)
+            if head is not None:
+                break
+        else:
+            return
+        
+        last_timestamp, frame = head
+        last_frame = np.array(frame, dtype=np.uint8)
+        
+        regions, batch_size = _pair_buffer_layout(self.workers, last_frame.nbytes)
+        shape = (regions, batch_size + 1) + last_frame.shape
+        
+        shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)))
+        try:
+            buffer = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+            
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_pair_worker,
+                initargs=(self, shm.name, shape)
+            ) as executor:
+                free_regions = deque(range(regions))
+                pending = deque()
+                
+                def collect():
+                    done_region, done_batch, future = pending.popleft()
+                    metrics = future.result()
+                    free_regions.append(done_region)
+                    for pair, pair_metrics in zip(done_batch, metrics):
+                        yield pair + (pair_metrics,)
+                
+                while True:
+                    region = None
+                    batch = []
+                    
+                    for index, (timestamp, frame) in enumerate(frames, start=first + 1):
+                        if region is None:
+                            if not free_regions:
+                                yield from collect()
+                            region = free_regions.popleft()
+                            buffer[region, 0] = last_frame
+                        
+                        buffer[region, len(batch) + 1] = frame
+                        batch.append((window, index, timestamp, last_timestamp))
+                        last_frame[...] = frame
+                        last_timestamp = timestamp
+                        
+                        if len(batch) == batch_size:
+                            pending.append((region, batch, executor.submit(_score_pair_batch, region, len(batch))))
+                            region, batch = None, []
+                    
+                    if batch:
+                        pending.append((region, batch, executor.submit(_score_pair_batch, region, len(batch))))
+                    
+                    # The next window starts a new batch from its own first frame
+                    for window, (first, frames) in windows:
+                        frames = iter(frames)
+                        head = next(frames, None)
+                        if head is not None:
+                            last_timestamp, frame = head
+                            last_frame[...] = frame
+                            break
+                    else:
+                        break
+                
+                while pending:
+                    yield from collect()
+        finally:
+            # The array view must be released before the segment can be closed
+            buffer = None
+            shm.close()
+            shm.unlink()
+    
+    def _score_frame_windows(
+        self,
+        windows: Iterable[Tuple[int, Iterable[Tuple[float, np.ndarray]]]],
+        total: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score every pair of consecutive frames within each window as the frames arrive.
+        
+        Args:
+            windows: Iterable yielding (first, frames) for every window, where
+                first is the index of the window's first frame and frames
+                yields (timestamp, frame) in order, at any resolution
+            total: Expected number of frames in all windows, for progress reporting
+            
+        Returns:
+            Tuple of (structured array with FRAME_SCORE_DTYPE, window number of
+            every row)
+        """
+        progress = tqdm(total=total, desc="Analyzing frame pairs")
+        
+        def counted(frames):
+            for item in frames:
+                progress.update()
+                yield item
+        
+        windows = ((first, counted(frames)) for first, frames in windows)
+        if self.workers > 1:
+            pair_metrics = self._iter_pair_metrics_parallel(windows)
+        else:
+            pair_metrics = self._iter_pair_metrics(windows)
+        
+        # Rows are written into a preallocated table that doubles when full
+        frame_scores = np.zeros(max(1, (total or 0) - 1), dtype=FRAME_SCORE_DTYPE)
+        row_windows = np.zeros(len(frame_scores), dtype=np.int64)
+        count = 0
+        with progress:
+            for window, i, timestamp, prev_timestamp, metrics in pair_metrics:
+                if count == len(frame_scores):
+                    frame_scores = np.resize(frame_scores, 2 * len(frame_scores))
+                    row_windows = np.resize(row_windows, 2 * len(row_windows))
+                frame_scores[count] = (i, timestamp, prev_timestamp) + tuple(metrics) + (0.0,)
+                row_windows[count] = window
+                count += 1
+        frame_scores = frame_scores[:count]
+        frame_scores["total_score"] = self._weighted_scores(frame_scores)
+        
+        return frame_scores, row_windows[:count]
+    
+    def _score_frame_stream(
+        self,
+        frames: Iterable[Tuple[float, np.ndarray]],
+        total: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Score every pair of consecutive frames as the frames arrive.
+        
+        Args:
+            frames: Iterable yielding (timestamp, frame) for the sampled frames
+                in order, at any resolution
+            total: Expected number of frames, for progress reporting
+            
+        Returns:
+            Structured array with FRAME_SCORE_DTYPE, one row per frame after
+            the first
+        """
+        frame_scores, _ = self._score_frame_windows([(0, frames)], total)
+        return frame_scores
+    
+    def _weighted_scores(self, frame_scores: np.ndarray) -> np.ndarray:
+        """
+        Combine the per-frame metrics into total scores.
+        
+        Args:
+            frame_scores: Structured array with FRAME_SCORE_DTYPE
+            
+        Returns:
+            Weighted total score of every row
+        """
+        return (
+            (1 - frame_scores["similarity_score"]) * self.similarity_weight +
+            frame_scores["difference_score"] * self.difference_weight +
+            frame_scores["motion_score"] * self.motion_weight +
+            frame_scores["color_change_score"] * self.color_weight
+        ) / (self.similarity_weight + self.difference_weight + 
+             self.motion_weight + self.color_weight)
+    
+    def _metrics_cache_key(self, video_path: str) -> Optional[str]:
+        """
+        Build the cache key of the per-frame metrics of a video.
+        
+        Only the settings that change which frames are analyzed or how they
+        are measured are part of the key; weights and thresholds are applied
+        after loading.
+        
+        Args:
+            video_path: Path to the video file
+            
+        Returns:
+            Cache key, or None without a cache
+        """
+        if self.cache is None:
+            return None
+        
+        return self.cache.make_key(
+            video_path,
+            "jump_cut_metrics",
+            frame_sample_rate=self.frame_sample_rate,
+            skip_start_percent=self.skip_start_percent,
+            skip_end_percent=self.skip_end_percent,
+            analysis_width=self.analysis_width,
+            thumbnail_width=self.thumbnail_width,
+            use_ffmpeg_reader=self.use_ffmpeg_reader,
+            scene_prefilter=(self.scene_threshold, self.scene_window) if self.scene_prefilter else None,
+        )
+    
+    def _analyze_frame_metrics(
+        self,
+        video_path: str,
+        video: VideoFileClip,
+        sample_times: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Measure every pair of consecutive sampled frames.
+        
+        Args:
+            video_path: Path to the video file
+            video: Open source clip
+            sample_times: Timestamps of all sampled frames
+            
+        Returns:
+            Tuple of (structured array with FRAME_SCORE_DTYPE, index of the
+            first row of every analyzed window)
+        """
+        # Consecutive frames are analyzed as they are decoded. Only the
+        # previous frame is kept, so memory use does not grow with the length
+        # of the video. All windows share one decoder and one worker pool.
+        windows = self._candidate_windows(video_path, sample_times)
+        frame_scores, row_windows = self._score_frame_windows(
+            self._iter_analysis_windows(video_path, video, sample_times, windows),
+            total=sum(end - first for first, end in windows)
+        )
+        window_starts = np.searchsorted(row_windows, np.arange(len(windows)))
+        
+        return frame_scores, window_starts.astype(np.int64)
+    
+    def _smooth_scores(self, scores: np.ndarray) -> np.ndarray:
+        """
+        Apply a sliding median to the total scores.
+        
+        The window covers smoothing_window // 2 scores on each side and is
+        truncated at both ends of the video.
+        
+        Args:
+            scores: Total scores in frame order
+            
+        Returns:
+            Smoothed scores
+        """
+        half = self.smoothing_window // 2
+        if half == 0 or len(scores) == 0:
+            return scores
+        
+        smoothed = median_filter(scores, size=2 * half + 1, mode="nearest")
+        
+        # Padding cannot reproduce truncated windows, so redo the edges
+        for i in range(min(half, len(scores))):
+            smoothed[i] = np.median(scores[:i + half + 1])
+            smoothed[-i - 1] = np.median(scores[-i - half - 1:])
+        
+        return smoothed
+    
     def detect_jump_cuts(
         self, 
         video_path: Union[str, Path],
@@ -349,79 +955,43 @@ class JumpCutDetector:
             frame_interval = 1.0 / self.frame_sample_rate
             sample_times = np.arange(start_time, end_time, frame_interval)
             
-            # Extract frames
-            frames = []
-            timestamps = []
-            
             logger.info(f"Sampling {len(sample_times)} frames for analysis")
             
-            for time in tqdm(sample_times, desc="Extracting frames"):
-                frame = video.get_frame(time)
-                frames.append(frame)
-                timestamps.append(time)
-            
-            # Analyze consecutive frames for jump cuts
-            logger.info("Analyzing frames for jump cuts")
-            frame_scores = []
-            
-            for i in tqdm(range(1, len(frames)), desc="Analyzing frame pairs"):
-                prev_frame = frames[i-1]
-                curr_frame = frames[i]
-                
-                # Calculate frame differences
-                similarity, difference, motion, color_change = self._calculate_frame_difference(
-                    prev_frame, curr_frame
+            # Reuse the per-frame metrics of an earlier run when possible
+            cache_key = self._metrics_cache_key(video_path)
+            cached = self.cache.load(cache_key) if cache_key else None
+            if cached is not None:
+                logger.info("Re-scoring jump cuts from cached frame metrics")
+                frame_scores, window_starts = cached["frame_scores"], cached["window_starts"]
+            else:
+                logger.info("Analyzing frames for jump cuts")
+                frame_scores, window_starts = self._analyze_frame_metrics(
+                    video_path, video, sample_times
                 )
-                
-                # Calculate weighted score
-                total_score = (
-                    (1 - similarity) * self.similarity_weight +
-                    difference * self.difference_weight +
-                    motion * self.motion_weight +
-                    color_change * self.color_weight
-                ) / (self.similarity_weight + self.difference_weight + 
-                     self.motion_weight + self.color_weight)
-                
-                frame_scores.append({
-                    "frame_index": i,
-                    "timestamp": timestamps[i],
-                    "similarity_score": similarity,
-                    "difference_score": difference,
-                    "motion_score": motion,
-                    "color_change_score": color_change,
-                    "total_score": total_score
-                })
-            
-            # Smooth scores to reduce false positives
-            if self.smoothing_window > 1:
-                smoothed_scores = []
-                window = self.smoothing_window
-                
-                for i in range(len(frame_scores)):
-                    start_idx = max(0, i - window // 2)
-                    end_idx = min(len(frame_scores), i + window // 2 + 1)
-                    window_scores = [frame_scores[j]["total_score"] for j in range(start_idx, end_idx)]
-                    # Use median for robustness
-                    smoothed_score = np.median(window_scores)
-                    
-                    smoothed_scores.append(smoothed_score)
-                
-                # Update original scores
-                for i, score in enumerate(smoothed_scores):
-                    frame_scores[i]["total_score"] = score
+                if cache_key:
+                    try:
+                        self.cache.store(
+                            cache_key, frame_scores=frame_scores, window_starts=window_starts
+                        )
+                    except OSError as e:
+                        logger.warning(f"Failed to store frame metrics in cache: {e}")
+            
+            # Smooth scores to reduce false positives, using the median for
+            # robustness. Windows are smoothed separately since the frames
+            # between them were not analyzed.
+            frame_scores["total_score"] = self._weighted_scores(frame_scores)
+            for scores in np.split(frame_scores, window_starts[1:]):
+                scores["total_score"] = self._smooth_scores(scores["total_score"])
             
             # Apply threshold and identify potential jump cuts
             # A jump cut needs to have a high total score (indicating significant change)
             threshold = 0.2 + (self.sensitivity * 0.3)  # Adjust based on sensitivity
             
-            potential_cuts = []
-            for score in frame_scores:
-                if score["total_score"] > threshold:
-                    potential_cuts.append(score)
+            potential_cuts = frame_scores[frame_scores["total_score"] > threshold]
             
             # Filter out jump cuts that are too close together
             filtered_cuts = []
-            if potential_cuts:
+            if len(potential_cuts):
                 filtered_cuts = [potential_cuts[0]]
                 
                 for cut in potential_cuts[1:]:
@@ -432,17 +1002,18 @@ class JumpCutDetector:
             # Create JumpCut objects
             for i, cut in enumerate(filtered_cuts):
                 # Determine confidence based on how much the score exceeds the threshold
-                confidence = min(1.0, (cut["total_score"] - threshold) / threshold)
+                confidence = min(1.0, (float(cut["total_score"]) - threshold) / threshold)
                 
-                # Get frames before and after the cut
-                frame_idx = cut["frame_index"]
-                frame_before = frames[frame_idx - 1]
-                frame_after = frames[frame_idx]
+                # Decode the frames before and after the cut again; frames are
+                # not kept during analysis
+                frame_idx = int(cut["frame_index"])
+                frame_before = video.get_frame(float(cut["previous_timestamp"]))
+                frame_after = video.get_frame(float(cut["timestamp"]))
                 
                 # Determine best transition type
                 transition_type, transition_duration = self._get_transition_type(
                     frame_before, frame_after,
-                    cut["similarity_score"], cut["difference_score"]
+                    float(cut["similarity_score"]), float(cut["difference_score"])
                 )
                 
                 # Save frames if requested
@@ -456,12 +1027,12 @@ class JumpCutDetector:
                 
                 jump_cut = JumpCut(
                     frame_index=frame_idx,
-                    timestamp=cut["timestamp"],
-                    similarity_score=cut["similarity_score"],
-                    difference_score=cut["difference_score"],
-                    motion_score=cut["motion_score"],
-                    color_change_score=cut["color_change_score"],
-                    total_score=cut["total_score"],
+                    timestamp=float(cut["timestamp"]),
+                    similarity_score=float(cut["similarity_score"]),
+                    difference_score=float(cut["difference_score"]),
+                    motion_score=float(cut["motion_score"]),
+                    color_change_score=float(cut["color_change_score"]),
+                    total_score=float(cut["total_score"]),
                     confidence=confidence,
                     frame_before_path=frame_before_path,
                     frame_after_path=frame_after_path,
@@ -478,7 +1049,8 @@ class JumpCutDetector:
                 "settings": {
                     "sensitivity": self.sensitivity,
                     "min_jump_interval": self.min_jump_interval,
-                    "frame_sample_rate": self.frame_sample_rate
+                    "frame_sample_rate": self.frame_sample_rate,
+                    "analysis_width": self.analysis_width
                 },
                 "jump_cuts": [cut.to_dict() for cut in jump_cuts]
             }
@@ -667,12 +1239,67 @@ class JumpCutDetector:
             # Default: no transition, just concatenate
             return concatenate_videoclips([clip1, clip2])
     
+    def _smooth_jump_cuts_ffmpeg(
+        self,
+        video_path: str,
+        jump_cuts: List[JumpCut],
+        output_path: str,
+        threads: Optional[int] = None
+    ) -> None:
+        """
+        Render smoothing transitions with a single FFmpeg xfade/acrossfade graph.
+        
+        Args:
+            video_path: Path to the input video file
+            jump_cuts: Jump cuts sorted by timestamp
+            output_path: Path to save the output video
+            threads: Number of threads for filtering and encoding (None lets
+                FFmpeg decide)
+        """
+        infos = ffmpeg_parse_infos(video_path)
+        duration = infos["duration"]
+        
+        # Split the video at every cut inside it
+        boundaries = [0.0]
+        transitions = []
+        for cut in jump_cuts:
+            if boundaries[-1] < cut.timestamp < duration:
+                boundaries.append(cut.timestamp)
+                transitions.append((cut.suggested_transition, cut.transition_duration))
+        boundaries.append(duration)
+        segments = list(zip(boundaries[:-1], boundaries[1:]))
+        
+        with tempfile.TemporaryDirectory(prefix="jump_cut_smoothing_") as temp_dir:
+            graph_file = os.path.join(temp_dir, "filter_graph.txt")
+            with open(graph_file, 'w') as f:
+                f.write(_build_xfade_graph(
+                    segments, transitions, infos["video_fps"], infos["audio_found"]
+                ))
+            
+            render_cmd = ["ffmpeg", "-y", "-i", video_path]
+            if threads:
+                render_cmd += ["-filter_complex_threads", str(threads)]
+            render_cmd += [
+                "-filter_complex_script", graph_file,
+                "-map", "[outv]", "-c:v", "libx264", "-preset", "medium", "-crf", "18"
+            ]
+            if infos["audio_found"]:
+                render_cmd += ["-map", "[outa]", "-c:a", "aac"]
+            if threads:
+                render_cmd += ["-threads", str(threads)]
+            render_cmd.append(output_path)
+            
+            logger.info(f"Writing smoothed video to {output_path}")
+            subprocess.run(render_cmd, check=True, capture_output=True)
+    
     def smooth_jump_cuts(
         self, 
         video_path: Union[str, Path],
         jump_cuts: List[JumpCut],
         output_path: Union[str, Path],
-        apply_all_transitions: bool = True
+        apply_all_transitions: bool = True,
+        backend: str = "moviepy",
+        threads: Optional[int] = None
     ) -> None:
         """
         Apply smoothing transitions to jump cuts in a video.
@@ -682,10 +1309,16 @@ class JumpCutDetector:
             jump_cuts: List of detected jump cuts
             output_path: Path to save the output video
             apply_all_transitions: Whether to apply all transitions or only high-confidence ones
+            backend: "moviepy" to composite transitions with MoviePy, or "ffmpeg"
+                to render the whole video in one FFmpeg encode with xfade
+            threads: Number of FFmpeg threads for the "ffmpeg" backend
         """
         video_path = str(video_path)
         output_path = str(output_path)
         
+        if backend not in ("moviepy", "ffmpeg"):
+            raise ValueError(f"Unknown smoothing backend: {backend}")
+        
         logger.info(f"Smoothing {len(jump_cuts)} jump cuts in {video_path}")
         
         # Sort jump cuts by timestamp
@@ -697,6 +1330,10 @@ class JumpCutDetector:
             jump_cuts = [cut for cut in jump_cuts if cut.confidence > 0.5]
             logger.info(f"Applying transitions to {len(jump_cuts)} high-confidence jump cuts")
         
+        if backend == "ffmpeg":
+            self._smooth_jump_cuts_ffmpeg(video_path, jump_cuts, output_path, threads)
+            return
+        
         if not jump_cuts:
             logger.warning("No jump cuts to smooth, copying input video to output")
             with VideoFileClip(video_path) as video:
@@ -773,6 +1410,185 @@ class JumpCutDetector:
             final_video.close()
 
 
+def _ssim_moments(gray: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the local means and variances structural similarity needs.
+    
+    Args:
+        gray: Grayscale frame of shape (height, width), or a stack of frames
+            of shape (N, height, width)
+        
+    Returns:
+        Tuple of (local means, local sample variances) as float64 arrays
+    """
+    size = (1,) * (gray.ndim - 2) + (_SSIM_WIN_SIZE, _SSIM_WIN_SIZE)
+    image = gray.astype(np.float64)
+    mean = uniform_filter(image, size=size)
+    variance = _SSIM_COV_NORM * (uniform_filter(image * image, size=size) - mean * mean)
+    return mean, variance
+
+
+def _ssim_from_moments(
+    gray1: np.ndarray,
+    moments1: Tuple[np.ndarray, np.ndarray],
+    gray2: np.ndarray,
+    moments2: Tuple[np.ndarray, np.ndarray]
+) -> Union[float, np.ndarray]:
+    """
+    Compute the mean structural similarity of frames with known local moments.
+    
+    Gives the same result as skimage.metrics.structural_similarity with its
+    defaults, but only filters the cross term of the two frames.
+    
+    Args:
+        gray1: First grayscale frame, or stack of frames
+        moments1: _ssim_moments of gray1
+        gray2: Second grayscale frame, or stack of frames
+        moments2: _ssim_moments of gray2
+        
+    Returns:
+        Mean SSIM, one value per frame pair for stacks
+    """
+    mean1, variance1 = moments1
+    mean2, variance2 = moments2
+    size = (1,) * (gray1.ndim - 2) + (_SSIM_WIN_SIZE, _SSIM_WIN_SIZE)
+    
+    cross = uniform_filter(gray1.astype(np.float64) * gray2, size=size)
+    covariance = _SSIM_COV_NORM * (cross - mean1 * mean2)
+    
+    ssim_map = (
+        (2 * mean1 * mean2 + _SSIM_C1) * (2 * covariance + _SSIM_C2)
+    ) / (
+        (mean1 * mean1 + mean2 * mean2 + _SSIM_C1) * (variance1 + variance2 + _SSIM_C2)
+    )
+    
+    # Ignore the filter radius around the edges, like skimage does
+    pad = (_SSIM_WIN_SIZE - 1) // 2
+    return ssim_map[..., pad:-pad, pad:-pad].mean(axis=(-2, -1))
+
+
+def _build_xfade_graph(
+    segments: List[Tuple[float, float]],
+    transitions: List[Tuple[TransitionType, float]],
+    fps: float,
+    has_audio: bool = True
+) -> str:
+    """
+    Build a filter graph joining segments of input 0 with transitions.
+    
+    Each transition overlaps the end of the output so far with the start of
+    the next segment, so the output is shorter than the input by the sum of
+    the transition durations.
+    
+    Args:
+        segments: Consecutive (start, end) times of the segments
+        transitions: (transition type, duration) between each pair of segments
+        fps: Frame rate of the input video
+        has_audio: Whether to include the audio stream
+        
+    Returns:
+        Filter graph producing [outv] and, with audio, [outa]
+    """
+    # xfade needs both inputs at the same constant frame rate and timebase,
+    # which trim and concat do not guarantee
+    normalize = f"settb=AVTB,fps={fps}"
+    filters = []
+    for i, (start, end) in enumerate(segments):
+        filters.append(
+            f"[0:v]trim=start={start:.6f}:end={end:.6f},setpts=PTS-STARTPTS,{normalize}[v{i}]"
+        )
+        if has_audio:
+            filters.append(f"[0:a]atrim=start={start:.6f}:end={end:.6f},asetpts=PTS-STARTPTS[a{i}]")
+    
+    video_label, audio_label = "[v0]", "[a0]"
+    output_length = segments[0][1] - segments[0][0]
+    
+    for i, (transition_type, duration) in enumerate(transitions, start=1):
+        segment_length = segments[i][1] - segments[i][0]
+        
+        # Like the MoviePy transitions, never use more than half of either side
+        duration = min(duration, (segments[i - 1][1] - segments[i - 1][0]) / 2, segment_length / 2)
+        last = i == len(transitions)
+        next_video = "[outv]" if last else f"[vx{i}]"
+        next_audio = "[outa]" if last else f"[ax{i}]"
+        
+        if transition_type == TransitionType.NONE or duration <= 0:
+            filters.append(f"{video_label}[v{i}]concat=n=2:v=1:a=0,{normalize}{next_video}")
+            if has_audio:
+                filters.append(f"{audio_label}[a{i}]concat=n=2:v=0:a=1{next_audio}")
+            output_length += segment_length
+        else:
+            offset = output_length - duration
+            filters.append(
+                f"{video_label}[v{i}]xfade=transition={_XFADE_TRANSITIONS[transition_type]}"
+                f":duration={duration:.6f}:offset={offset:.6f}{next_video}"
+            )
+            if has_audio:
+                filters.append(f"{audio_label}[a{i}]acrossfade=d={duration:.6f}{next_audio}")
+            output_length += segment_length - duration
+        
+        video_label, audio_label = next_video, next_audio
+    
+    if not transitions:
+        filters.append("[v0]null[outv]")
+        if has_audio:
+            filters.append("[a0]anull[outa]")
+    
+    return ";\n".join(filters)
+
+
+def _pair_buffer_layout(workers: int, frame_nbytes: int) -> Tuple[int, int]:
+    """
+    Size the shared memory ring of parallel frame pair scoring.
+    
+    Two batches are kept in flight per worker. Large frames reduce the batch
+    size and then the number of regions so the ring stays within
+    _PAIR_BUFFER_BYTES; only frames too large for two regions of a single
+    pair exceed it.
+    
+    Args:
+        workers: Number of worker processes
+        frame_nbytes: Size of one analysis frame in bytes
+        
+    Returns:
+        Tuple of (regions, batch_size), where each region holds batch_size + 1 frames
+    """
+    regions = int(min(workers * 2, max(2, _PAIR_BUFFER_BYTES // (2 * frame_nbytes))))
+    batch_size = int(max(1, min(
+        _PAIR_BATCH_SIZE, _PAIR_BUFFER_BYTES // (regions * frame_nbytes) - 1
+    )))
+    return regions, batch_size
+
+
+def _init_pair_worker(detector: "JumpCutDetector", shm_name: str, shape: Tuple[int, ...]) -> None:
+    """Attach a frame pair scoring worker to the shared frame buffer."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _pair_worker_state["detector"] = detector
+    _pair_worker_state["shm"] = shm
+    _pair_worker_state["frames"] = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+
+
+def _score_pair_batch(region: int, count: int) -> List[Tuple[float, float, float, float]]:
+    """
+    Score a batch of consecutive frame pairs from the shared frame buffer.
+    
+    Args:
+        region: Index of the batch region in the shared buffer
+        count: Number of pairs in the batch
+        
+    Returns:
+        Difference metrics of each pair
+    """
+    detector = _pair_worker_state["detector"]
+    frames = _pair_worker_state["frames"][region]
+    
+    analyses = detector._prepare_analysis_batch(frames[:count + 1])
+    return [
+        tuple(float(m) for m in detector._compare_analysis_frames(analyses[j - 1], analyses[j]))
+        for j in range(1, count + 1)
+    ]
+
+
 def detect_jump_cuts(
     video_path: Union[str, Path],
     output_dir: Optional[Union[str, Path]] = None,
@@ -781,7 +1597,14 @@ def detect_jump_cuts(
     frame_sample_rate: float = 10.0,
     save_frames: bool = True,
     metadata_file: Optional[Union[str, Path]] = None,
-    use_memory_adaptation: bool = True
+    use_memory_adaptation: bool = True,
+    analysis_width: Optional[int] = None,
+    use_ffmpeg_reader: bool = False,
+    workers: int = 1,
+    scene_prefilter: bool = False,
+    scene_threshold: float = 0.1,
+    use_cache: bool = False,
+    cache_dir: Optional[Union[str, Path]] = None
 ) -> List[Dict[str, Any]]:
     """
     Detect jump cuts in a video.
@@ -795,6 +1618,18 @@ def detect_jump_cuts(
         save_frames: Whether to save frames before and after jump cuts
         metadata_file: Optional path to save jump cut metadata as JSON
         use_memory_adaptation: Whether to use memory-adaptive processing
+        analysis_width: Width in pixels frames are decoded at for analysis
+            (None for full resolution)
+        use_ffmpeg_reader: Whether to decode sampled frames through a single
+            FFmpeg process
+        workers: Number of worker processes scoring frame pairs
+        scene_prefilter: Whether to analyze only windows around candidate cuts
+            found by FFmpeg's scene change detection
+        scene_threshold: Minimum FFmpeg scene change score (0-1) of a candidate
+        use_cache: Whether to store per-frame metrics on disk, so that re-running
+            with a different sensitivity or minimum interval skips decoding
+        cache_dir: Directory for cached frame metrics (default: jump_cut_metrics
+            under $ASABAAL_CACHE_DIR or ~/.cache/asabaal_utils)
         
     Returns:
         List of dictionaries with jump cut information
@@ -804,7 +1639,13 @@ def detect_jump_cuts(
         sensitivity=sensitivity,
         min_jump_interval=min_jump_interval,
         frame_sample_rate=frame_sample_rate,
-        save_frames=save_frames
+        save_frames=save_frames,
+        analysis_width=analysis_width,
+        use_ffmpeg_reader=use_ffmpeg_reader,
+        workers=workers,
+        scene_prefilter=scene_prefilter,
+        scene_threshold=scene_threshold,
+        cache=NpzCache(METRICS_CACHE_NAMESPACE, cache_dir) if use_cache else None
     )
     
     if use_memory_adaptation:
@@ -886,7 +1727,9 @@ def smooth_jump_cuts(
     video_path: Union[str, Path],
     output_path: Union[str, Path],
     jump_cuts_data: List[Dict[str, Any]],
-    apply_all_transitions: bool = True
+    apply_all_transitions: bool = True,
+    backend: str = "moviepy",
+    threads: Optional[int] = None
 ) -> None:
     """
     Apply smoothing transitions to jump cuts in a video.
@@ -896,6 +1739,9 @@ def smooth_jump_cuts(
         output_path: Path to save the output video
         jump_cuts_data: List of jump cut dictionaries from detect_jump_cuts
         apply_all_transitions: Whether to apply all transitions or only high-confidence ones
+        backend: "moviepy" to composite transitions with MoviePy, or "ffmpeg"
+            to render the whole video in one FFmpeg encode with xfade
+        threads: Number of FFmpeg threads for the "ffmpeg" backend
     """
     # Convert jump cuts data to JumpCut objects
     jump_cuts = []
@@ -928,5 +1774,7 @@ def smooth_jump_cuts(
         video_path=video_path,
         jump_cuts=jump_cuts,
         output_path=output_path,
-        apply_all_transitions=apply_all_transitions
+        apply_all_transitions=apply_all_transitions,
+        backend=backend,
+        threads=threads
     )
@@ -0,0 +1,198 @@
+"""
+Persistent cache of analysis results stored as .npz files.
+
+This module stores the raw results of media analysis on disk, keyed by a
+fingerprint of the media file and the analysis parameters, so that runs that
+only change later processing steps can skip decoding the media again. Each
+kind of analysis keeps its entries in its own namespace directory, e.g.
+silence maps of the silence detector or per-frame metrics of the jump cut
+detector.
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional, Union
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Environment variable overriding the root directory of all caches
+CACHE_DIR_ENV = "ASABAAL_CACHE_DIR"
+
+# Number of bytes hashed from the head, middle and tail of a file
+_FINGERPRINT_SAMPLE_BYTES = 1 << 20
+
+
+def default_cache_dir(namespace: str) -> Path:
+    """
+    Get the default directory for the cache entries of a namespace.
+
+    Args:
+        namespace: Name of the cached analysis, used as subdirectory.
+
+    Returns:
+        namespace under the directory from ASABAAL_CACHE_DIR, or under
+        ~/.cache/asabaal_utils
+    """
+    if os.environ.get(CACHE_DIR_ENV):
+        return Path(os.environ[CACHE_DIR_ENV]) / namespace
+    return Path.home() / ".cache" / "asabaal_utils" / namespace
+
+
+def fingerprint_file(file_path: Union[str, Path]) -> str:
+    """
+    Compute a cheap fingerprint identifying the contents of a media file.
+
+    The fingerprint combines the file size and modification time with a hash
+    of three samples taken from the start, middle and end of the file, so it
+    can be computed without reading multi-gigabyte recordings in full.
+
+    Args:
+        file_path: Path to the file.
+
+    Returns:
+        Hex digest identifying the file.
+    """
+    stat = os.stat(file_path)
+    digest = hashlib.sha256(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+
+    with open(file_path, "rb") as f:
+        offsets = {0, max(0, stat.st_size // 2 - _FINGERPRINT_SAMPLE_BYTES // 2),
+                   max(0, stat.st_size - _FINGERPRINT_SAMPLE_BYTES)}
+        for offset in sorted(offsets):
+            f.seek(offset)
+            digest.update(f.read(_FINGERPRINT_SAMPLE_BYTES))
+
+    return digest.hexdigest()
+
+
+class NpzCache:
+    """
+    On-disk cache of analysis results with least-recently-used eviction.
+
+    Each entry is a compressed .npz file named after a key derived from the
+    media fingerprint and the analysis parameters. Reading an entry refreshes
+    its modification time, and entries with the oldest modification time are
+    removed first once the cache grows beyond max_size_bytes.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_size_bytes: int = 256 * 1024 * 1024,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            namespace: Name of the cached analysis, which selects the default
+                directory.
+            cache_dir: Directory for cache entries (default: default_cache_dir(namespace))
+            max_size_bytes: Maximum total size of all entries before the least
+                recently used ones are evicted.
+        """
+        self.namespace = namespace
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir(namespace)
+        self.max_size_bytes = max_size_bytes
+
+    def make_key(self, file_path: Union[str, Path], kind: str, **params) -> str:
+        """
+        Build the cache key for a file and a set of analysis parameters.
+
+        Args:
+            file_path: Path to the analyzed media file.
+            kind: Name of the analysis producing the entry.
+            **params: Parameters the cached result depends on.
+
+        Returns:
+            Hex digest to use as cache key.
+        """
+        payload = json.dumps(
+            {"file": fingerprint_file(file_path), "kind": kind, "params": params},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def load(self, key: str) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Load a cache entry.
+
+        Args:
+            key: Key from make_key.
+
+        Returns:
+            Dictionary of arrays, or None if there is no usable entry.
+        """
+        path = self._entry_path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable {self.namespace} cache entry {path}: {e}")
+            self._remove(path)
+            return None
+
+        # Mark the entry as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return arrays
+
+    def store(self, key: str, **arrays) -> None:
+        """
+        Store a cache entry and evict old entries if the cache is too large.
+
+        Args:
+            key: Key from make_key.
+            **arrays: Arrays to store in the entry.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first so readers never see a partial entry
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(f, **arrays)
+            os.replace(temp_path, self._entry_path(key))
+        except Exception:
+            self._remove(Path(temp_path))
+            raise
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits max_size_bytes."""
+        entries = []
+        for path in self.cache_dir.glob("*.npz"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self.max_size_bytes:
+                break
+            self._remove(path)
+            total_size -= size
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.npz"
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
@@ -5,12 +5,16 @@ This module provides utilities for detecting and removing silence from videos.
 """
 
 import os
+import glob
+import time
 import numpy as np
 import tempfile
 import json
 import subprocess
 import shutil
-from typing import List, Tuple, Optional, Union, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from typing import List, Tuple, Optional, Union, Dict, Any, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 import logging
@@ -19,11 +23,22 @@ from tqdm import tqdm
 from moviepy.editor import VideoFileClip
 from moviepy.editor import concatenate_videoclips
 import librosa
+from scipy.signal import lfilter
 
 from .memory_utils import memory_adaptive_processing
+from .npz_cache import NpzCache, default_cache_dir
 
 logger = logging.getLogger(__name__)
 
+# Cache namespace of silence maps
+SILENCE_CACHE_NAMESPACE = "silence_maps"
+
+# Supported strategies for rendering non-silent segments with FFmpeg
+_RENDER_MODES = ("segments", "filter", "keyframe_copy")
+
+# Video file extensions whose audio is extracted before analysis
+_VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv')
+
 @dataclass
 class AudioSegment:
     """Represents an audio segment with start and end times and silence information."""
@@ -54,6 +69,12 @@ class SilenceDetector:
         padding: float = 0.1,
         chunk_size: float = 0.05,
         aggressive_silence_rejection: bool = False,
+        vectorized: bool = True,
+        streaming: bool = False,
+        block_duration: float = 30.0,
+        cache: Optional[NpzCache] = None,
+        refine_boundaries: bool = False,
+        refine_resolution: float = 0.001,
     ):
         """
         Initialize the silence detector.
@@ -67,6 +88,19 @@ class SilenceDetector:
             chunk_size: Size of audio chunks for analysis in seconds.
             aggressive_silence_rejection: If True, uses additional algorithms to detect
                 silences even in the presence of background noise.
+            vectorized: If True, computes chunk RMS values in a single NumPy pass
+                instead of iterating over chunks in Python.
+            streaming: If True, decodes audio through an FFmpeg pipe and analyzes it
+                block by block instead of loading the whole signal into memory.
+            block_duration: Duration in seconds of each decoded block in streaming mode.
+            cache: Optional NpzCache of silence maps. When given, the per-chunk RMS envelope is
+                stored after analysis, and later runs with the same threshold and chunk
+                size re-plan from it without decoding the file again.
+            refine_boundaries: If True, re-examines the two chunks around every
+                silence/sound transition at refine_resolution, so a large chunk_size
+                can be used without losing boundary precision.
+            refine_resolution: Window size in seconds used to refine boundaries.
+                Values down to one sample period give sample-accurate boundaries.
         """
         self.threshold_db = threshold_db
         self.min_silence_duration = min_silence_duration
@@ -74,6 +108,12 @@ class SilenceDetector:
         self.padding = padding
         self.chunk_size = chunk_size
         self.aggressive_silence_rejection = aggressive_silence_rejection
+        self.vectorized = vectorized
+        self.streaming = streaming
+        self.block_duration = block_duration
+        self.cache = cache
+        self.refine_boundaries = refine_boundaries
+        self.refine_resolution = refine_resolution
     
     def detect_silence_segments(self, file_path: Union[str, Path]) -> List[AudioSegment]:
         """
@@ -88,8 +128,35 @@ class SilenceDetector:
         logger.info(f"Detecting silence in {file_path}")
         file_path = str(file_path)
         
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(
+                file_path,
+                "chunk_envelope",
+                threshold_db=self.threshold_db,
+                chunk_size=self.chunk_size,
+                aggressive_silence_rejection=self.aggressive_silence_rejection,
+                streaming=self.streaming,
+                refine_resolution=self.refine_resolution if self.refine_boundaries else None,
+            )
+            cached = self.cache.load(cache_key)
+            if cached is not None:
+                logger.info("Re-planning silence segments from cached RMS envelope")
+                analyzer = ChunkAnalyzer(self, int(cached["sr"]))
+                segments = analyzer.replay(
+                    cached["rms"], cached["is_silence"], int(cached["n_samples"]), cached.get("offsets")
+                )
+                merged_segments = self._finalize_segments(segments)
+                logger.info(f"Found {sum(1 for s in merged_segments if s.is_silence)} silence segments")
+                return merged_segments
+        
+        if self.streaming:
+            merged_segments = self._finalize_segments(self._detect_segments_streaming(file_path, cache_key))
+            logger.info(f"Found {sum(1 for s in merged_segments if s.is_silence)} silence segments")
+            return merged_segments
+        
         # For video files, extract the audio
-        if file_path.lower().endswith(('.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv')):
+        if file_path.lower().endswith(_VIDEO_EXTENSIONS):
             with VideoFileClip(file_path) as video:
                 with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
                     audio_path = temp_file.name
@@ -100,101 +167,14 @@ class SilenceDetector:
         try:
             # Load audio using librosa
             y, sr = librosa.load(audio_path, sr=None)
-            duration = librosa.get_duration(y=y, sr=sr)
-            
-            # Convert threshold from dB to amplitude
-            threshold_amplitude = 10 ** (self.threshold_db / 20)
             
-            # Calculate chunk size in samples
-            chunk_samples = int(self.chunk_size * sr)
+            # Caching and boundary refinement need the chunk analyzer
+            if self.vectorized or cache_key is not None or self.refine_boundaries:
+                segments = self._detect_segments_vectorized(y, sr, cache_key)
+            else:
+                segments = self._detect_segments_loop(y, sr)
             
-            # Detect silence
-            segments = []
-            chunk_count = int(np.ceil(len(y) / chunk_samples))
-            
-            start_time = 0
-            is_current_silence = False
-            segment_start = 0
-            current_rms = 0
-            
-            for i in tqdm(range(chunk_count), desc="Analyzing audio"):
-                chunk_start = i * chunk_samples
-                chunk_end = min((i + 1) * chunk_samples, len(y))
-                chunk = y[chunk_start:chunk_end]
-                
-                # Calculate RMS power
-                rms = np.sqrt(np.mean(chunk**2))
-                is_silence = rms < threshold_amplitude
-                
-                # Dynamic threshold adjustment if aggressive rejection is enabled
-                if self.aggressive_silence_rejection:
-                    # Analyze spectral flatness (noisy silence vs. true silence)
-                    if len(chunk) >= 512:  # Minimum size for spectral analysis
-                        spectral_flatness = librosa.feature.spectral_flatness(y=chunk)
-                        is_silence = is_silence and np.mean(spectral_flatness) > 0.5
-                
-                # Time for this chunk
-                chunk_time = chunk_start / sr
-                
-                # State transition
-                if is_silence != is_current_silence:
-                    # End the current segment
-                    if is_current_silence:
-                        segments.append(AudioSegment(
-                            start=segment_start,
-                            end=chunk_time,
-                            is_silence=True,
-                            rms_power=current_rms
-                        ))
-                    else:
-                        segments.append(AudioSegment(
-                            start=segment_start,
-                            end=chunk_time,
-                            is_silence=False,
-                            rms_power=current_rms
-                        ))
-                    
-                    # Start a new segment
-                    segment_start = chunk_time
-                    is_current_silence = is_silence
-                    current_rms = rms
-                else:
-                    # Update RMS with moving average
-                    current_rms = 0.7 * current_rms + 0.3 * rms
-            
-            # Add the final segment
-            segments.append(AudioSegment(
-                start=segment_start,
-                end=duration,
-                is_silence=is_current_silence,
-                rms_power=current_rms
-            ))
-            
-            # Filter out segments that are too short
-            filtered_segments = []
-            for segment in segments:
-                if segment.is_silence and segment.duration < self.min_silence_duration:
-                    segment.is_silence = False
-                if not segment.is_silence and segment.duration < self.min_sound_duration:
-                    segment.is_silence = True
-                filtered_segments.append(segment)
-            
-            # Merge adjacent segments of the same type
-            merged_segments = []
-            current_segment = None
-            
-            for segment in filtered_segments:
-                if current_segment is None:
-                    current_segment = segment
-                elif current_segment.is_silence == segment.is_silence:
-                    current_segment.end = segment.end
-                    current_segment.rms_power = max(current_segment.rms_power, segment.rms_power)
-                else:
-                    merged_segments.append(current_segment)
-                    current_segment = segment
-            
-            if current_segment is not None:
-                merged_segments.append(current_segment)
+            merged_segments = self._finalize_segments(segments)
             
             logger.info(f"Found {sum(1 for s in merged_segments if s.is_silence)} silence segments")
             return merged_segments
@@ -207,6 +187,276 @@ class SilenceDetector:
                 except Exception as e:
                     logger.warning(f"Failed to delete temporary audio file: {e}")
     
+    def _detect_segments_loop(self, y: np.ndarray, sr: int) -> List[AudioSegment]:
+        """
+        Detect raw silence/sound segments by iterating over chunks in Python.
+        
+        Args:
+            y: Mono audio signal.
+            sr: Sample rate of the signal.
+            
+        Returns:
+            List of unfiltered AudioSegment objects, one per state change.
+        """
+        duration = librosa.get_duration(y=y, sr=sr)
+        
+        # Convert threshold from dB to amplitude
+        threshold_amplitude = 10 ** (self.threshold_db / 20)
+        
+        # Calculate chunk size in samples
+        chunk_samples = int(self.chunk_size * sr)
+        
+        # Detect silence
+        segments = []
+        chunk_count = int(np.ceil(len(y) / chunk_samples))
+        
+        is_current_silence = False
+        segment_start = 0
+        current_rms = 0
+        
+        for i in tqdm(range(chunk_count), desc="Analyzing audio"):
+            chunk_start = i * chunk_samples
+            chunk_end = min((i + 1) * chunk_samples, len(y))
+            chunk = y[chunk_start:chunk_end]
+            
+            # Calculate RMS power
+            rms = np.sqrt(np.mean(chunk**2))
+            is_silence = rms < threshold_amplitude
+            
+            # Dynamic threshold adjustment if aggressive rejection is enabled
+            if self.aggressive_silence_rejection:
+                # Analyze spectral flatness (noisy silence vs. true silence)
+                if len(chunk) >= 512:  # Minimum size for spectral analysis
+                    spectral_flatness = librosa.feature.spectral_flatness(y=chunk)
+                    is_silence = is_silence and np.mean(spectral_flatness) > 0.5
+            
+            # Time for this chunk
+            chunk_time = chunk_start / sr
+            
+            # State transition
+            if is_silence != is_current_silence:
+                # End the current segment
+                segments.append(AudioSegment(
+                    start=segment_start,
+                    end=chunk_time,
+                    is_silence=is_current_silence,
+                    rms_power=current_rms
+                ))
+                
+                # Start a new segment
+                segment_start = chunk_time
+                is_current_silence = is_silence
+                current_rms = rms
+            else:
+                # Update RMS with moving average
+                current_rms = 0.7 * current_rms + 0.3 * rms
+        
+        # Add the final segment
+        segments.append(AudioSegment(
+            start=segment_start,
+            end=duration,
+            is_silence=is_current_silence,
+            rms_power=current_rms
+        ))
+        
+        return segments
+    
+    def _detect_segments_vectorized(
+        self,
+        y: np.ndarray,
+        sr: int,
+        cache_key: Optional[str] = None
+    ) -> List[AudioSegment]:
+        """
+        Detect raw silence/sound segments with a single vectorized RMS pass.
+        
+        Produces the same segments as _detect_segments_loop: every chunk's RMS is
+        computed from a reshaped view of the signal, and segment boundaries are
+        taken from the changes in the resulting silence mask.
+        
+        Args:
+            y: Mono audio signal.
+            sr: Sample rate of the signal.
+            cache_key: If given, the chunk envelope is stored in the cache under this key.
+            
+        Returns:
+            List of unfiltered AudioSegment objects, one per state change.
+        """
+        analyzer = ChunkAnalyzer(self, sr, record_envelope=cache_key is not None)
+        analyzer.feed(y)
+        segments = analyzer.finish()
+        
+        if cache_key is not None:
+            self._store_envelope(cache_key, analyzer)
+        
+        return segments
+    
+    def _detect_segments_streaming(
+        self,
+        file_path: str,
+        cache_key: Optional[str] = None
+    ) -> List[AudioSegment]:
+        """
+        Detect raw silence/sound segments from audio decoded in bounded blocks.
+        
+        Args:
+            file_path: Path to the audio or video file.
+            cache_key: If given, the chunk envelope is stored in the cache under this key.
+            
+        Returns:
+            List of unfiltered AudioSegment objects, one per state change.
+        """
+        sample_rate, channels = _probe_audio_stream(file_path)
+        analyzer = ChunkAnalyzer(self, sample_rate, record_envelope=cache_key is not None)
+        
+        # Keep blocks aligned to whole chunks so no samples are carried over
+        chunks_per_block = max(1, int(self.block_duration / self.chunk_size))
+        block_samples = chunks_per_block * analyzer.chunk_samples
+        
+        for block in _iter_audio_blocks(file_path, sample_rate, channels, block_samples):
+            analyzer.feed(block)
+        
+        segments = analyzer.finish()
+        
+        if cache_key is not None:
+            self._store_envelope(cache_key, analyzer)
+        
+        return segments
+    
+    def follow_silence_segments(
+        self,
+        file_path: Union[str, Path],
+        idle_timeout: float = 10.0,
+        block_duration: float = 1.0
+    ) -> Iterator[AudioSegment]:
+        """
+        Detect silence in a file that is still being written.
+        
+        The file is decoded through an FFmpeg pipe that keeps reading as the
+        file grows, and newly appended audio is analyzed as soon as it arrives.
+        Segments are yielded as soon as they can no longer change: a segment is
+        final once the audio after it has run longer than min_silence_duration
+        (or min_sound_duration), so it will survive filtering and cannot be
+        merged with what follows. Following stops once the file has not grown
+        for idle_timeout seconds, and the remaining segments are then flushed.
+        
+        The yielded segments are the same as those from detect_silence_segments
+        on the finished file.
+        
+        Args:
+            file_path: Path to the growing audio or video file. The container must
+                be readable while it is written (e.g. WAV, Matroska or MPEG-TS).
+            idle_timeout: Seconds without new data after which the recording is
+                considered finished.
+            block_duration: Duration in seconds of audio decoded per read, which
+                bounds the detection latency.
+                
+        Yields:
+            Finalized AudioSegment objects in chronological order.
+        """
+        file_path = str(file_path)
+        logger.info(f"Following {file_path} for silence")
+        
+        sample_rate, channels = _probe_audio_stream(file_path)
+        analyzer = ChunkAnalyzer(self, sample_rate)
+        finalizer = SegmentFinalizer(self)
+        
+        chunks_per_block = max(1, int(block_duration / self.chunk_size))
+        block_samples = chunks_per_block * analyzer.chunk_samples
+        follow_options = ["-follow", "1", "-rw_timeout", str(int(idle_timeout * 1e6))]
+        
+        for block in _iter_audio_blocks(file_path, sample_rate, channels, block_samples, follow_options):
+            yield from finalizer.push(analyzer.feed(block))
+            yield from finalizer.settle(*analyzer.open_segment())
+        
+        # Final flush once the recording has stopped growing
+        closed_count = len(analyzer.segments)
+        yield from finalizer.push(analyzer.finish()[closed_count:])
+        yield from finalizer.flush()
+    
+    def _store_envelope(self, cache_key: str, analyzer: "ChunkAnalyzer") -> None:
+        """
+        Store the chunk envelope recorded by an analyzer in the cache.
+        
+        Args:
+            cache_key: Key to store the envelope under.
+            analyzer: ChunkAnalyzer created with record_envelope=True.
+        """
+        rms, is_silence, offsets = analyzer.envelope()
+        try:
+            self.cache.store(
+                cache_key,
+                rms=rms,
+                is_silence=is_silence,
+                offsets=offsets,
+                sr=np.int64(analyzer.sr),
+                n_samples=np.int64(analyzer.samples_seen),
+            )
+        except OSError as e:
+            logger.warning(f"Failed to store silence map in cache: {e}")
+    
+    def _flat_spectrum_mask(
+        self,
+        y: np.ndarray,
+        chunk_samples: int,
+        candidates: np.ndarray
+    ) -> np.ndarray:
+        """
+        Check which candidate silent chunks have a flat (noise-like) spectrum.
+        
+        The signal is transformed in blocks of block_duration seconds, each
+        with a single batch of chunk-aligned frames (see _chunk_flatness) that
+        never reach into neighbouring chunks. Blocks without candidates are
+        skipped. Unlike the reference loop, frames are not zero padded, so
+        flatness values differ slightly; the silence decisions for noise and
+        speech-like signals are the same.
+        
+        Args:
+            y: Mono audio signal starting at a chunk boundary.
+            chunk_samples: Number of samples per chunk.
+            candidates: Boolean mask of chunks that are silent by RMS.
+            
+        Returns:
+            Boolean mask that is False for candidates whose spectrum is not flat.
+        """
+        mask = np.ones(len(candidates), dtype=bool)
+        full_chunks = len(y) // chunk_samples
+        
+        # Chunks shorter than the minimum size for spectral analysis keep their RMS decision
+        if chunk_samples >= 512:
+            chunks_per_block = max(1, int(self.block_duration / self.chunk_size))
+            
+            for first_chunk in range(0, full_chunks, chunks_per_block):
+                last_chunk = min(first_chunk + chunks_per_block, full_chunks)
+                if not candidates[first_chunk:last_chunk].any():
+                    continue
+                
+                flatness = _chunk_flatness(
+                    y[first_chunk * chunk_samples:last_chunk * chunk_samples], chunk_samples
+                )
+                mask[first_chunk:last_chunk] = flatness > 0.5
+        
+        # A partial final chunk has a different length, so analyze it on its own
+        if full_chunks < len(candidates) and candidates[-1]:
+            chunk = y[full_chunks * chunk_samples:]
+            if len(chunk) >= 512:
+                mask[-1] = _chunk_flatness(chunk, len(chunk))[0] > 0.5
+        
+        return mask
+    
+    def _finalize_segments(self, segments: List[AudioSegment]) -> List[AudioSegment]:
+        """
+        Filter out segments that are too short and merge adjacent segments.
+        
+        Args:
+            segments: Raw AudioSegment objects in chronological order.
+            
+        Returns:
+            List of merged AudioSegment objects.
+        """
+        finalizer = SegmentFinalizer(self)
+        return finalizer.push(segments) + finalizer.flush()
+    
     def get_active_segments(self, segments: List[AudioSegment]) -> List[AudioSegment]:
         """
         Extract non-silent segments from the list of segments.
@@ -248,6 +498,526 @@ class SilenceDetector:
         
         return []
 
+class ChunkAnalyzer:
+    """
+    Stateful chunk analyzer for incremental silence detection.
+    
+    Audio is fed in consecutive blocks of any size. Complete chunks are analyzed
+    with the vectorized RMS engine as soon as they are available, and leftover
+    samples are carried over to the next block, so memory use is bounded by the
+    block size rather than by the length of the recording.
+    """
+    
+    def __init__(self, detector: SilenceDetector, sr: int, record_envelope: bool = False):
+        """
+        Initialize the chunk analyzer.
+        
+        Args:
+            detector: SilenceDetector providing the detection settings.
+            sr: Sample rate of the audio that will be fed.
+            record_envelope: If True, keeps the per-chunk RMS values, silence
+                decisions and boundary offsets so they can be cached and replayed
+                with replay().
+        """
+        self.detector = detector
+        self.sr = sr
+        self.chunk_samples = int(detector.chunk_size * sr)
+        self.threshold_amplitude = 10 ** (detector.threshold_db / 20)
+        self.refine_samples = max(1, int(detector.refine_resolution * sr)) if detector.refine_boundaries else None
+        self.segments: List[AudioSegment] = []
+        self.samples_seen = 0
+        
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._chunks_done = 0
+        self._is_current_silence = False
+        self._segment_start = 0.0
+        self._current_rms = 0.0
+        self._previous_chunk = np.zeros(0, dtype=np.float32)
+        self._envelope: Optional[List[Tuple[np.ndarray, np.ndarray, np.ndarray]]] = [] if record_envelope else None
+    
+    def feed(self, samples: np.ndarray) -> List[AudioSegment]:
+        """
+        Analyze the next block of mono samples.
+        
+        Args:
+            samples: Mono audio samples following the previously fed block.
+            
+        Returns:
+            Raw segments that were closed by this block.
+        """
+        samples = np.asarray(samples, dtype=np.float32)
+        self.samples_seen += len(samples)
+        
+        if len(self._pending):
+            samples = np.concatenate((self._pending, samples))
+        
+        complete = len(samples) - len(samples) % self.chunk_samples
+        self._pending = samples[complete:].copy()
+        
+        return self._analyze_chunks(samples[:complete])
+    
+    def finish(self) -> List[AudioSegment]:
+        """
+        Analyze any remaining partial chunk and close the final segment.
+        
+        Returns:
+            All raw segments in chronological order.
+        """
+        if len(self._pending):
+            self._analyze_chunks(self._pending)
+            self._pending = np.zeros(0, dtype=np.float32)
+        
+        self.segments.append(AudioSegment(
+            start=self._segment_start,
+            end=self.samples_seen / self.sr,
+            is_silence=self._is_current_silence,
+            rms_power=self._current_rms
+        ))
+        
+        return self.segments
+    
+    def open_segment(self) -> Tuple[bool, float]:
+        """
+        Get the state of the segment that has not been closed yet.
+        
+        Returns:
+            Tuple of (is_silence, duration) where duration covers the chunks
+            analyzed so far.
+        """
+        analyzed_time = self._chunks_done * self.chunk_samples / self.sr
+        return self._is_current_silence, analyzed_time - self._segment_start
+    
+    def replay(
+        self,
+        rms: np.ndarray,
+        is_silence: np.ndarray,
+        n_samples: int,
+        offsets: Optional[np.ndarray] = None
+    ) -> List[AudioSegment]:
+        """
+        Rebuild the raw segments from a recorded chunk envelope.
+        
+        No audio is needed: the segment state machine is driven directly by
+        the RMS values and silence decisions of each chunk.
+        
+        Args:
+            rms: RMS value of every chunk, as returned by envelope().
+            is_silence: Silence decision of every chunk, as returned by envelope().
+            n_samples: Total number of samples the envelope was computed from.
+            offsets: Refined boundary offsets, as returned by envelope().
+            
+        Returns:
+            All raw segments in chronological order.
+        """
+        rms = np.asarray(rms)
+        if offsets is None:
+            offsets = np.zeros(len(rms))
+        self._analyze_envelope(rms, np.asarray(is_silence, dtype=bool), np.asarray(offsets))
+        self.samples_seen = n_samples
+        return self.finish()
+    
+    def envelope(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the recorded chunk envelope.
+        
+        Returns:
+            Tuple of (rms, is_silence, offsets) arrays with one entry per analyzed
+            chunk. offsets holds the refined position of a transition relative to
+            the start of its chunk, and is zero elsewhere.
+        """
+        if self._envelope is None:
+            raise RuntimeError("ChunkAnalyzer was created without record_envelope=True")
+        if not self._envelope:
+            return np.zeros(0, dtype=np.float32), np.zeros(0, dtype=bool), np.zeros(0)
+        
+        rms, is_silence, offsets = zip(*self._envelope)
+        return np.concatenate(rms), np.concatenate(is_silence), np.concatenate(offsets)
+    
+    def _analyze_chunks(self, samples: np.ndarray) -> List[AudioSegment]:
+        """
+        Analyze chunk-aligned samples and update the segment state.
+        
+        Args:
+            samples: Samples starting at a chunk boundary. Only the last chunk
+                may be shorter than chunk_samples.
+                
+        Returns:
+            Raw segments that were closed by these samples.
+        """
+        rms = _chunk_rms(samples, self.chunk_samples)
+        is_silence = rms < self.threshold_amplitude
+        
+        if self.detector.aggressive_silence_rejection and is_silence.any():
+            is_silence &= self.detector._flat_spectrum_mask(samples, self.chunk_samples, is_silence)
+        
+        offsets = np.zeros(len(rms))
+        if self.refine_samples is not None and len(samples):
+            offsets = self._refine_offsets(samples, is_silence)
+            self._previous_chunk = samples[-self.chunk_samples:].copy()
+        
+        if self._envelope is not None:
+            self._envelope.append((rms, is_silence, offsets))
+        
+        return self._analyze_envelope(rms, is_silence, offsets)
+    
+    def _refine_offsets(self, samples: np.ndarray, is_silence: np.ndarray) -> np.ndarray:
+        """
+        Locate silence/sound transitions within their chunks at fine resolution.
+        
+        A transition detected at the start of chunk i lies somewhere in chunks
+        i-1 or i, so only those two chunks are re-analyzed with windows of
+        refine_samples. A new sound starts at the first loud window, and a sound
+        ends after the last loud window.
+        
+        Args:
+            samples: Chunk-aligned samples being analyzed.
+            is_silence: Silence decision of each chunk in samples.
+            
+        Returns:
+            Offset in seconds of each transition from the start of its chunk,
+            zero for chunks without a transition.
+        """
+        offsets = np.zeros(len(is_silence))
+        states = np.concatenate(([self._is_current_silence], is_silence))
+        
+        for chunk_index in np.flatnonzero(states[1:] != states[:-1]):
+            # The state before the first chunk is not measured, so keep time zero
+            if self._chunks_done + chunk_index == 0:
+                continue
+            
+            chunk_start = chunk_index * self.chunk_samples
+            if chunk_index > 0:
+                window = samples[chunk_start - self.chunk_samples:chunk_start + self.chunk_samples]
+            else:
+                window = np.concatenate((self._previous_chunk, samples[:self.chunk_samples]))
+            previous_samples = self.chunk_samples if chunk_index > 0 else len(self._previous_chunk)
+            
+            loud = np.flatnonzero(_chunk_rms(window, self.refine_samples) >= self.threshold_amplitude)
+            if not len(loud):
+                continue
+            
+            if is_silence[chunk_index]:
+                boundary = min((loud[-1] + 1) * self.refine_samples, len(window))
+            else:
+                boundary = loud[0] * self.refine_samples
+            offsets[chunk_index] = (boundary - previous_samples) / self.sr
+        
+        return offsets
+    
+    def _analyze_envelope(
+        self,
+        rms: np.ndarray,
+        is_silence: np.ndarray,
+        offsets: np.ndarray
+    ) -> List[AudioSegment]:
+        """
+        Update the segment state from the RMS values and silence decisions of chunks.
+        
+        Args:
+            rms: RMS value of each chunk.
+            is_silence: Silence decision of each chunk.
+            offsets: Refined transition offset of each chunk in seconds.
+            
+        Returns:
+            Raw segments that were closed by these chunks.
+        """
+        # Prepend the carried-over state and mark every chunk whose state
+        # differs from the one before it
+        states = np.concatenate(([self._is_current_silence], is_silence))
+        change_chunks = np.flatnonzero(states[1:] != states[:-1])
+        
+        closed = []
+        run_start = 0
+        
+        for chunk_index in change_chunks:
+            # The RMS of a finished run is an exponential moving average
+            # seeded with the RMS of its first chunk
+            if chunk_index > run_start:
+                self._current_rms = _moving_average_rms(rms[run_start:chunk_index], self._current_rms)
+            
+            chunk_time = (self._chunks_done + int(chunk_index)) * self.chunk_samples / self.sr
+            if offsets[chunk_index]:
+                # Refined boundaries may not move before the start of the current segment
+                chunk_time = max(chunk_time + float(offsets[chunk_index]), self._segment_start)
+            closed.append(AudioSegment(
+                start=self._segment_start,
+                end=chunk_time,
+                is_silence=self._is_current_silence,
+                rms_power=self._current_rms
+            ))
+            
+            self._segment_start = chunk_time
+            self._is_current_silence = not self._is_current_silence
+            self._current_rms = rms[chunk_index]
+            run_start = chunk_index + 1
+        
+        if run_start < len(rms):
+            self._current_rms = _moving_average_rms(rms[run_start:], self._current_rms)
+        
+        self._chunks_done += len(rms)
+        self.segments.extend(closed)
+        
+        return closed
+
+
+class SegmentFinalizer:
+    """
+    Incremental filtering and merging of raw segments.
+    
+    Raw segments are pushed in chronological order. Segments shorter than the
+    detector's minimum durations flip their type, adjacent segments of the same
+    type are merged, and a merged segment is returned as soon as a segment of
+    the other type follows it.
+    """
+    
+    def __init__(self, detector: SilenceDetector):
+        """
+        Initialize the segment finalizer.
+        
+        Args:
+            detector: SilenceDetector providing the minimum durations.
+        """
+        self.detector = detector
+        self._current: Optional[AudioSegment] = None
+    
+    def push(self, segments: List[AudioSegment]) -> List[AudioSegment]:
+        """
+        Add closed raw segments.
+        
+        Args:
+            segments: Raw AudioSegment objects following the previously pushed ones.
+            
+        Returns:
+            Merged segments that became final.
+        """
+        finalized = []
+        
+        for segment in segments:
+            # Filter out segments that are too short
+            if segment.is_silence and segment.duration < self.detector.min_silence_duration:
+                segment.is_silence = False
+            if not segment.is_silence and segment.duration < self.detector.min_sound_duration:
+                segment.is_silence = True
+            
+            # Merge adjacent segments of the same type
+            if self._current is None:
+                self._current = segment
+            elif self._current.is_silence == segment.is_silence:
+                self._current.end = segment.end
+                self._current.rms_power = max(self._current.rms_power, segment.rms_power)
+            else:
+                finalized.append(self._current)
+                self._current = segment
+        
+        return finalized
+    
+    def settle(self, is_silence: bool, duration: float) -> List[AudioSegment]:
+        """
+        Finalize the current merged segment early based on the still open raw segment.
+        
+        Once the open segment is long enough to keep its type after filtering,
+        the merged segment before it can no longer grow if the types differ.
+        
+        Args:
+            is_silence: Type of the open raw segment.
+            duration: Duration of the open raw segment so far.
+            
+        Returns:
+            The merged segment if it became final, otherwise an empty list.
+        """
+        if self._current is None or self._current.is_silence == is_silence:
+            return []
+        
+        min_duration = self.detector.min_silence_duration if is_silence else self.detector.min_sound_duration
+        if duration < min_duration:
+            return []
+        
+        finalized, self._current = self._current, None
+        return [finalized]
+    
+    def flush(self) -> List[AudioSegment]:
+        """
+        Return the last merged segment after all raw segments were pushed.
+        
+        Returns:
+            The remaining merged segment, if any.
+        """
+        if self._current is None:
+            return []
+        
+        finalized, self._current = self._current, None
+        return [finalized]
+
+
+def _probe_audio_stream(file_path: str) -> Tuple[int, int]:
+    """
+    Get the sample rate and channel count of the first audio stream.
+    
+    Args:
+        file_path: Path to the audio or video file.
+        
+    Returns:
+        Tuple of (sample_rate, channels)
+    """
+    probe_cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-select_streams", "a:0",
+        "-show_entries", "stream=sample_rate,channels",
+        "-of", "json",
+        file_path
+    ]
+    
+    probe_result = subprocess.run(
+        probe_cmd,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    
+    streams = json.loads(probe_result.stdout).get("streams", [])
+    if not streams:
+        raise ValueError(f"No audio stream found in {file_path}")
+    
+    return int(streams[0]["sample_rate"]), int(streams[0]["channels"])
+
+
+def _iter_audio_blocks(
+    file_path: str,
+    sample_rate: int,
+    channels: int,
+    block_samples: int,
+    input_options: Optional[List[str]] = None
+):
+    """
+    Decode audio through an FFmpeg pipe and yield mono blocks.
+    
+    Channels are averaged the same way librosa.load does, and audio is kept at
+    its native sample rate.
+    
+    Args:
+        file_path: Path to the audio or video file.
+        sample_rate: Native sample rate of the audio stream.
+        channels: Number of channels in the audio stream.
+        block_samples: Number of mono samples per yielded block.
+        input_options: Extra FFmpeg options placed before the input file.
+        
+    Yields:
+        Float32 arrays with up to block_samples samples each.
+    """
+    decode_cmd = [
+        "ffmpeg",
+        "-v", "error",
+        *(input_options or []),
+        "-i", file_path,
+        "-vn",
+        "-ar", str(sample_rate),
+        "-f", "f32le",
+        "-acodec", "pcm_f32le",
+        "-"
+    ]
+    
+    block_bytes = block_samples * channels * 4
+    process = subprocess.Popen(decode_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    
+    try:
+        while True:
+            data = process.stdout.read(block_bytes)
+            if not data:
+                break
+            
+            interleaved = np.frombuffer(data, dtype="<f4")
+            interleaved = interleaved[:len(interleaved) - len(interleaved) % channels]
+            yield interleaved.reshape(-1, channels).mean(axis=1)
+        
+        stderr = process.stderr.read()
+        if process.wait() != 0:
+            raise subprocess.CalledProcessError(
+                process.returncode, decode_cmd, stderr=stderr.decode(errors="replace")
+            )
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+        process.stderr.close()
+
+
+def _chunk_rms(y: np.ndarray, chunk_samples: int) -> np.ndarray:
+    """
+    Compute the RMS of consecutive fixed-size chunks of a signal.
+    
+    The final chunk may be shorter than chunk_samples, matching how the chunk
+    loop slices the signal.
+    
+    Args:
+        y: Mono audio signal.
+        chunk_samples: Number of samples per chunk.
+        
+    Returns:
+        Array with one RMS value per chunk.
+    """
+    full_chunks = len(y) // chunk_samples
+    squared = np.square(y[:full_chunks * chunk_samples]).reshape(full_chunks, chunk_samples)
+    rms = np.sqrt(np.mean(squared, axis=1))
+    
+    if len(y) % chunk_samples:
+        tail = y[full_chunks * chunk_samples:]
+        rms = np.append(rms, np.sqrt(np.mean(tail**2)))
+    
+    return rms
+
+
+def _chunk_flatness(y: np.ndarray, chunk_samples: int, n_fft: int = 2048) -> np.ndarray:
+    """
+    Compute the spectral flatness of consecutive fixed-size chunks of a signal.
+    
+    Every chunk is covered by half-overlapping frames of at most half a chunk
+    (and at most n_fft samples), spread evenly from its first to its last
+    sample, and all frames of the signal are transformed together. Frames
+    never reach into neighbouring chunks and are not zero padded, so the
+    values differ slightly from the centered per-chunk analysis of the
+    reference loop.
+    
+    Args:
+        y: Mono audio signal whose length is a multiple of chunk_samples.
+        chunk_samples: Number of samples per chunk.
+        n_fft: Maximum frame length.
+        
+    Returns:
+        Array with one spectral flatness value per chunk (the mean over its frames).
+    """
+    frame_length = min(n_fft, chunk_samples // 2)
+    chunks = y.reshape(-1, chunk_samples)
+    
+    frames_per_chunk = -(-2 * chunk_samples // frame_length) - 1
+    offsets = np.linspace(0, chunk_samples - frame_length, frames_per_chunk).round().astype(int)
+    frames = np.lib.stride_tricks.sliding_window_view(chunks, frame_length, axis=1)[:, offsets]
+    
+    window = librosa.filters.get_window("hann", frame_length, fftbins=True).astype(y.dtype)
+    magnitude = np.abs(np.fft.rfft(frames * window, axis=-1))
+    
+    # spectral_flatness expects (..., frequency, frame)
+    flatness = librosa.feature.spectral_flatness(S=np.swapaxes(magnitude, 1, 2))
+    return flatness.mean(axis=(1, 2))
+
+
+def _moving_average_rms(rms: np.ndarray, initial: float) -> float:
+    """
+    Apply the detector's RMS moving average to a run of chunks.
+    
+    Equivalent to repeatedly applying ``current = 0.7 * current + 0.3 * rms``.
+    
+    Args:
+        rms: RMS values of the chunks in the run.
+        initial: Moving average value before the first chunk.
+        
+    Returns:
+        Moving average value after the last chunk.
+    """
+    averaged, _ = lfilter([0.3], [1.0, -0.7], rms, zi=[0.7 * initial])
+    return averaged[-1]
+
 
 def _remove_silence_impl(
     input_file: Union[str, Path],
@@ -259,6 +1029,12 @@ def _remove_silence_impl(
     chunk_size: float = 0.05,
     aggressive_silence_rejection: bool = False,
     metadata: Optional[Dict[str, str]] = None,
+    streaming: bool = False,
+    cache_dir: Optional[Union[str, Path]] = None,
+    follow: bool = False,
+    follow_timeout: float = 10.0,
+    refine_boundaries: bool = False,
+    refine_resolution: float = 0.001,
 ) -> Tuple[float, float, float]:
     """
     Implementation of silence removal (without memory adaptation).
@@ -274,6 +1050,13 @@ def _remove_silence_impl(
         aggressive_silence_rejection: If True, uses additional algorithms to detect
             silences even in the presence of background noise.
         metadata: Optional dictionary of metadata to add to the output file.
+        streaming: If True, decodes audio in bounded blocks for silence detection.
+        cache_dir: If given, silence maps are cached in this directory.
+        follow: If True, detects silence while the input file is still being written.
+        follow_timeout: Seconds without new data after which a followed file is
+            considered finished.
+        refine_boundaries: If True, refines chunk boundaries at refine_resolution.
+        refine_resolution: Window size in seconds used to refine boundaries.
         
     Returns:
         Tuple of (original_duration, output_duration, time_saved)
@@ -289,10 +1072,17 @@ def _remove_silence_impl(
         padding=padding,
         chunk_size=chunk_size,
         aggressive_silence_rejection=aggressive_silence_rejection,
+        streaming=streaming,
+        cache=NpzCache(SILENCE_CACHE_NAMESPACE, cache_dir) if cache_dir else None,
+        refine_boundaries=refine_boundaries,
+        refine_resolution=refine_resolution,
     )
     
     # Detect silence segments
-    segments = detector.detect_silence_segments(input_file)
+    if follow:
+        segments = list(detector.follow_silence_segments(input_file, idle_timeout=follow_timeout))
+    else:
+        segments = detector.detect_silence_segments(input_file)
     active_segments = detector.get_active_segments(segments)
     
     # If no active segments were found, return the original video
@@ -348,6 +1138,513 @@ def _remove_silence_impl(
     return original_duration, output_duration, time_saved
 
 
+def _render_with_segment_files(
+    input_file: str,
+    output_file: str,
+    segments: List[Tuple[float, float]],
+    temp_dir: str,
+    max_workers: Optional[int] = None,
+) -> float:
+    """
+    Render segments by extracting each one with FFmpeg and concatenating them.
+    
+    Segments are extracted concurrently on a bounded pool of FFmpeg processes.
+    If any extraction fails, the remaining ones are cancelled and the segment
+    files written so far are removed.
+    
+    Args:
+        input_file: Path to the input video file
+        output_file: Path to save the output video file
+        segments: List of (start, end) times to keep
+        temp_dir: Directory for intermediary files
+        max_workers: Maximum number of concurrent FFmpeg processes
+            (default: number of CPUs)
+        
+    Returns:
+        Duration of the output file in seconds
+    """
+    segments_file = os.path.join(temp_dir, "segments.txt")
+    segment_files = []
+    extract_cmds = []
+    
+    for i, (start, end) in enumerate(segments):
+        segment_file = os.path.join(temp_dir, f"segment_{i:03d}.mp4")
+        duration = end - start
+        
+        # Extract segment
+        extract_cmds.append([
+            "ffmpeg",
+            "-y",  # Overwrite output files
+            "-i", input_file,
+            "-ss", str(start),
+            "-t", str(duration),
+            "-c", "copy",  # Copy streams without re-encoding
+            segment_file
+        ])
+        segment_files.append(segment_file)
+    
+    try:
+        _run_ffmpeg_pool(extract_cmds, max_workers or os.cpu_count() or 1)
+    except Exception:
+        for segment_file in segment_files:
+            if os.path.exists(segment_file):
+                os.unlink(segment_file)
+        raise
+    
+    # Create a segments file for the concat demuxer in segment order
+    with open(segments_file, 'w') as f:
+        for segment_file in segment_files:
+            f.write(f"file '{segment_file}'\n")
+    
+    # Concatenate all segments
+    concat_cmd = [
+        "ffmpeg",
+        "-y",  # Overwrite output files
+        "-f", "concat",
+        "-safe", "0",
+        "-i", segments_file,
+        "-c", "copy",  # Copy streams without re-encoding
+        '-progress', 'pipe:1',
+        output_file
+    ]
+    
+    logger.info("Concatenating non-silent segments...")
+    subprocess.run(concat_cmd, check=True, capture_output=True)
+    
+    return _probe_output_duration(output_file)
+
+
+def _probe_output_duration(output_file: str) -> float:
+    """
+    Get the duration of a rendered file from its container.
+    
+    Args:
+        output_file: Path to the rendered video file
+        
+    Returns:
+        Duration of the file in seconds
+    """
+    output_duration_cmd = [
+        "ffprobe", 
+        "-v", "error", 
+        "-show_entries", "format=duration",
+        "-of", "json",
+        output_file
+    ]
+    
+    output_duration_result = subprocess.run(
+        output_duration_cmd, 
+        capture_output=True, 
+        text=True, 
+        check=True
+    )
+    
+    output_duration_data = json.loads(output_duration_result.stdout)
+    return float(output_duration_data["format"]["duration"])
+
+
+def _run_ffmpeg_pool(commands: List[List[str]], max_workers: int) -> None:
+    """
+    Run FFmpeg commands on a bounded pool of concurrent processes.
+    
+    The first failing command stops the pool: queued commands are cancelled and
+    running processes are killed before the error is raised.
+    
+    Args:
+        commands: FFmpeg command lines to run
+        max_workers: Maximum number of processes running at once
+        
+    Raises:
+        subprocess.CalledProcessError: If any command exits with a non-zero status
+    """
+    running = set()
+    lock = threading.Lock()
+    failed = threading.Event()
+    
+    def run_command(command: List[str]) -> None:
+        with lock:
+            if failed.is_set():
+                return
+            process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            running.add(process)
+        
+        try:
+            _, stderr = process.communicate()
+        finally:
+            with lock:
+                running.discard(process)
+        
+        if process.returncode != 0 and not failed.is_set():
+            raise subprocess.CalledProcessError(
+                process.returncode, command, stderr=stderr.decode(errors="replace")
+            )
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(run_command, command) for command in commands]
+        
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            with lock:
+                failed.set()
+                for process in running:
+                    process.kill()
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def _render_with_filter_graph(
+    input_file: str,
+    output_file: str,
+    segments: List[Tuple[float, float]],
+    temp_dir: str,
+    has_video: bool = True,
+    has_audio: bool = True,
+) -> float:
+    """
+    Render segments in a single FFmpeg invocation using trim/atrim and concat.
+    
+    The input is decoded once and re-encoded once, so cut points are frame
+    accurate regardless of the keyframe layout.
+    
+    Args:
+        input_file: Path to the input video file
+        output_file: Path to save the output video file
+        segments: List of (start, end) times to keep
+        temp_dir: Directory for intermediary files
+        has_video: Whether the input has a video stream
+        has_audio: Whether the input has an audio stream
+        
+    Returns:
+        Duration of the rendered file in seconds
+    """
+    graph_file = os.path.join(temp_dir, "filter_graph.txt")
+    
+    # The graph for long talks is too large for the command line, so it is
+    # passed through a script file
+    with open(graph_file, 'w') as f:
+        f.write(_build_trim_concat_graph(segments, has_video, has_audio))
+    
+    render_cmd = [
+        "ffmpeg",
+        "-y",  # Overwrite output files
+        "-i", input_file,
+        "-filter_complex_script", graph_file,
+    ]
+    if has_video:
+        render_cmd += ["-map", "[outv]", "-c:v", "libx264", "-preset", "medium", "-crf", "18"]
+    if has_audio:
+        render_cmd += ["-map", "[outa]", "-c:a", "aac"]
+    render_cmd.append(output_file)
+    
+    subprocess.run(render_cmd, check=True, capture_output=True)
+    
+    return _probe_output_duration(output_file)
+
+
+def _build_trim_concat_graph(
+    segments: List[Tuple[float, float]],
+    has_video: bool = True,
+    has_audio: bool = True,
+) -> str:
+    """
+    Build a filter graph that keeps the given segments of input 0.
+    
+    Args:
+        segments: List of (start, end) times to keep
+        has_video: Whether to include the video stream
+        has_audio: Whether to include the audio stream
+        
+    Returns:
+        Filter graph producing [outv] and/or [outa]
+    """
+    filters = []
+    concat_inputs = []
+    
+    for i, (start, end) in enumerate(segments):
+        if has_video:
+            filters.append(f"[0:v]trim=start={start:.6f}:end={end:.6f},setpts=PTS-STARTPTS[v{i}]")
+            concat_inputs.append(f"[v{i}]")
+        if has_audio:
+            filters.append(f"[0:a]atrim=start={start:.6f}:end={end:.6f},asetpts=PTS-STARTPTS[a{i}]")
+            concat_inputs.append(f"[a{i}]")
+    
+    outputs = ("[outv]" if has_video else "") + ("[outa]" if has_audio else "")
+    filters.append(
+        f"{''.join(concat_inputs)}concat=n={len(segments)}:v={int(has_video)}:a={int(has_audio)}{outputs}"
+    )
+    
+    return ";\n".join(filters)
+
+
+def _render_with_keyframe_copy(
+    input_file: str,
+    output_file: str,
+    segments: List[Tuple[float, float]],
+    temp_dir: str,
+    padding: float = 0.0,
+    has_video: bool = True,
+) -> float:
+    """
+    Render segments in a single stream-copy pass with keyframe-aligned cuts.
+    
+    Segment starts are moved to a keyframe so that no segment begins with an
+    undecodable frame, and the snapped segments are read through the concat
+    demuxer's inpoint/outpoint directives without re-encoding. Audio-only
+    inputs are cut at the segment times as they are, since every audio
+    packet can start a segment.
+    
+    Args:
+        input_file: Path to the input video file
+        output_file: Path to save the output video file
+        segments: List of (start, end) times to keep
+        temp_dir: Directory for intermediary files
+        padding: Padding around the segments; a start may move to any
+            keyframe this close to it, forwards or backwards
+        has_video: Whether the input has a video stream
+        
+    Returns:
+        Duration of the rendered file in seconds
+    """
+    keyframes = _probe_keyframe_times(input_file) if has_video else []
+    snapped_segments = _snap_segments_to_keyframes(segments, keyframes, padding)
+    
+    segments_file = os.path.join(temp_dir, "segments.txt")
+    escaped_input = os.path.abspath(input_file).replace("'", "'\\''")
+    
+    with open(segments_file, 'w') as f:
+        for start, end in snapped_segments:
+            f.write(f"file '{escaped_input}'\n")
+            f.write(f"inpoint {start:.6f}\n")
+            f.write(f"outpoint {end:.6f}\n")
+    
+    copy_cmd = [
+        "ffmpeg",
+        "-y",  # Overwrite output files
+        "-f", "concat",
+        "-safe", "0",
+        "-i", segments_file,
+        "-c", "copy",  # Copy streams without re-encoding
+        "-avoid_negative_ts", "make_zero",
+        output_file
+    ]
+    
+    subprocess.run(copy_cmd, check=True, capture_output=True)
+    
+    return _probe_output_duration(output_file)
+
+
+def _probe_keyframe_times(input_file: str) -> List[float]:
+    """
+    Get the presentation times of all video keyframes without decoding.
+    
+    Args:
+        input_file: Path to the input video file
+        
+    Returns:
+        Sorted list of keyframe times in seconds
+    """
+    keyframe_cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "packet=pts_time,flags",
+        "-of", "csv=print_section=0",
+        input_file
+    ]
+    
+    keyframe_result = subprocess.run(
+        keyframe_cmd,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    
+    keyframes = []
+    for line in keyframe_result.stdout.splitlines():
+        fields = line.strip().split(",")
+        if len(fields) >= 2 and "K" in fields[1]:
+            try:
+                keyframes.append(float(fields[0]))
+            except ValueError:
+                continue
+    
+    return sorted(keyframes)
+
+
+def _snap_segments_to_keyframes(
+    segments: List[Tuple[float, float]],
+    keyframes: List[float],
+    padding: float = 0.0,
+) -> List[Tuple[float, float]]:
+    """
+    Move segment starts to keyframes.
+    
+    A start moves to the nearest keyframe within padding of it, in either
+    direction, so the cut stays inside the padding around the silence. Only
+    when there is no such keyframe does it move back to the preceding one,
+    which can be up to a whole GOP earlier. Segments that overlap after
+    snapping are merged. Without keyframes, as for audio-only inputs, the
+    segments are returned unchanged.
+    
+    Args:
+        segments: Sorted list of (start, end) times to keep
+        keyframes: Sorted list of keyframe times
+        padding: Maximum distance of a start to a keyframe it may snap to
+            without falling back to the preceding keyframe
+        
+    Returns:
+        List of keyframe-aligned (start, end) times
+    """
+    if not keyframes:
+        return list(segments)
+    
+    keyframe_array = np.asarray(keyframes, dtype=float)
+    snapped = []
+    
+    for start, end in segments:
+        nearby = keyframe_array[
+            (np.abs(keyframe_array - start) <= padding + 1e-6) & (keyframe_array < end)
+        ]
+        if len(nearby):
+            start = float(nearby[np.argmin(np.abs(nearby - start))])
+        else:
+            index = np.searchsorted(keyframe_array, start, side="right") - 1
+            start = float(keyframe_array[index]) if index >= 0 else 0.0
+        
+        if snapped and start <= snapped[-1][1]:
+            snapped[-1] = (snapped[-1][0], max(snapped[-1][1], end))
+        else:
+            snapped.append((start, end))
+    
+    return snapped
+
+
+def _detect_silence_ffmpeg(
+    input_file: str,
+    threshold_db: float,
+    min_silence_duration: float,
+    cache: Optional[NpzCache] = None,
+) -> Tuple[float, set, List[Tuple[float, float]]]:
+    """
+    Probe a file and detect its silent parts with FFmpeg's silencedetect filter.
+    
+    Args:
+        input_file: Path to the input video file
+        threshold_db: Threshold in decibels below which audio is considered silence
+        min_silence_duration: Minimum duration in seconds for a segment to be considered silence
+        cache: Optional NpzCache of silence maps. A cached silence map for the same file,
+            threshold and minimum silence duration is used instead of running FFmpeg.
+        
+    Returns:
+        Tuple of (original_duration, stream_types, silent_segments)
+    """
+    cache_key = None
+    if cache is not None:
+        cache_key = cache.make_key(
+            input_file,
+            "silencedetect",
+            threshold_db=threshold_db,
+            min_silence_duration=min_silence_duration,
+        )
+        cached = cache.load(cache_key)
+        if cached is not None:
+            logger.info("Using cached silence map")
+            original_duration = float(cached["original_duration"])
+            silent_segments = [(float(start), float(end)) for start, end in cached["silent_segments"]]
+            return original_duration, set(cached["stream_types"].tolist()), silent_segments
+    
+    # Step 1: Get video duration and stream types
+    duration_cmd = [
+        "ffprobe", 
+        "-v", "error", 
+        "-show_entries", "format=duration:stream=codec_type",
+        "-of", "json",
+        input_file
+    ]
+    
+    duration_result = subprocess.run(
+        duration_cmd, 
+        capture_output=True, 
+        text=True, 
+        check=True
+    )
+    
+    duration_data = json.loads(duration_result.stdout)
+    original_duration = float(duration_data["format"]["duration"])
+    stream_types = {stream.get("codec_type") for stream in duration_data.get("streams", [])}
+    
+    logger.info(f"Original video duration: {original_duration:.2f}s")
+    
+    # Step 2: Detect silent parts
+    # Convert threshold_db to silence detection noise value (negative dB value)
+    noise = threshold_db
+    
+    # Detect silence using ffmpeg's silencedetect filter
+    detect_cmd = [
+        "ffmpeg",
+        "-i", input_file,
+        "-af", f"silencedetect=noise={noise}dB:d={min_silence_duration}",
+        "-f", "null",
+        '-progress', 'pipe:1',  # Output progress to stdout
+        "-"
+    ]
+    
+    logger.info("Detecting silence segments...")
+    detect_process = subprocess.run(
+        detect_cmd,
+        capture_output=True,
+        text=True
+    )
+    
+    # Process the stderr output to extract silence start/end times
+    stderr_lines = detect_process.stderr.split("\n")
+    
+    silence_starts = []
+    silence_ends = []
+    
+    for line in stderr_lines:
+        if "silence_start" in line:
+            try:
+                timestamp = float(line.split("silence_start: ")[1].split()[0])
+                silence_starts.append(timestamp)
+            except (IndexError, ValueError):
+                continue
+        elif "silence_end" in line:
+            try:
+                timestamp = float(line.split("silence_end: ")[1].split()[0])
+                silence_ends.append(timestamp)
+            except (IndexError, ValueError):
+                continue
+    
+    # If we didn't find any silence starts but have ends, assume silence at the beginning
+    if len(silence_ends) > len(silence_starts):
+        silence_starts.insert(0, 0)
+    
+    # If we have more starts than ends, assume silence continues to the end
+    if len(silence_starts) > len(silence_ends):
+        silence_ends.append(original_duration)
+    
+    # Create list of silent segments
+    silent_segments = list(zip(silence_starts, silence_ends))
+    
+    # Only cache complete analyses
+    if cache_key is not None and detect_process.returncode == 0:
+        try:
+            cache.store(
+                cache_key,
+                original_duration=np.float64(original_duration),
+                stream_types=np.array(sorted(t for t in stream_types if t), dtype=str),
+                silent_segments=np.array(silent_segments, dtype=np.float64).reshape(-1, 2),
+            )
+        except OSError as e:
+            logger.warning(f"Failed to store silence map in cache: {e}")
+    
+    return original_duration, stream_types, silent_segments
+
+
 def _remove_silence_ffmpeg(
     input_file: Union[str, Path],
     output_file: Union[str, Path],
@@ -355,6 +1652,9 @@ def _remove_silence_ffmpeg(
     min_silence_duration: float = 0.5,
     min_sound_duration: float = 0.3,
     padding: float = 0.1,
+    render_mode: str = "segments",
+    segment_workers: Optional[int] = None,
+    cache: Optional[NpzCache] = None,
 ) -> Tuple[float, float, float]:
     """
     Remove silence from a video file using direct FFmpeg implementation.
@@ -370,10 +1670,20 @@ def _remove_silence_ffmpeg(
         min_silence_duration: Minimum duration in seconds for a segment to be considered silence
         min_sound_duration: Minimum duration in seconds for a segment to be considered sound
         padding: Padding in seconds to add before and after non-silent segments
+        render_mode: How to render the non-silent segments:
+            "segments" extracts each segment with its own FFmpeg process and joins them,
+            "filter" re-encodes once through a trim/concat filter graph,
+            "keyframe_copy" stream-copies in one pass with cut points snapped to keyframes
+        segment_workers: Maximum number of concurrent FFmpeg processes used to extract
+            segments in "segments" render mode (default: number of CPUs)
+        cache: Optional NpzCache of silence maps used to reuse the silence map of a previous run
         
     Returns:
         Tuple of (original_duration, output_duration, time_saved)
     """
+    if render_mode not in _RENDER_MODES:
+        raise ValueError(f"Unknown render mode '{render_mode}', expected one of {_RENDER_MODES}")
+    
     input_file = str(input_file)
     output_file = str(output_file)
     
@@ -381,81 +1691,11 @@ def _remove_silence_ffmpeg(
     temp_dir = tempfile.mkdtemp(prefix="silence_removal_")
     
     try:
-        # Step 1: Get video duration
-        duration_cmd = [
-            "ffprobe", 
-            "-v", "error", 
-            "-show_entries", "format=duration",
-            "-of", "json",
-            input_file
-        ]
-        
-        duration_result = subprocess.run(
-            duration_cmd, 
-            capture_output=True, 
-            text=True, 
-            check=True
-        )
-        
-        duration_data = json.loads(duration_result.stdout)
-        original_duration = float(duration_data["format"]["duration"])
-        
-        logger.info(f"Original video duration: {original_duration:.2f}s")
-        
-        # Step 2: Detect silent parts
-        silence_file = os.path.join(temp_dir, "silence_timestamps.txt")
-        
-        # Convert threshold_db to silence detection noise value (negative dB value)
-        noise = threshold_db
-        
-        # Detect silence using ffmpeg's silencedetect filter
-        detect_cmd = [
-            "ffmpeg",
-            "-i", input_file,
-            "-af", f"silencedetect=noise={noise}dB:d={min_silence_duration}",
-            "-f", "null",
-            '-progress', 'pipe:1',  # Output progress to stdout
-            "-"
-        ]
-        
-        logger.info("Detecting silence segments...")
-        detect_process = subprocess.run(
-            detect_cmd,
-            capture_output=True,
-            text=True
+        # Steps 1-2: Get video duration and stream types, and detect silent parts
+        original_duration, stream_types, silent_segments = _detect_silence_ffmpeg(
+            input_file, threshold_db, min_silence_duration, cache
         )
         
-        # Process the stderr output to extract silence start/end times
-        stderr_lines = detect_process.stderr.split("\n")
-        
-        silence_starts = []
-        silence_ends = []
-        
-        for line in stderr_lines:
-            if "silence_start" in line:
-                try:
-                    timestamp = float(line.split("silence_start: ")[1].split()[0])
-                    silence_starts.append(timestamp)
-                except (IndexError, ValueError):
-                    continue
-            elif "silence_end" in line:
-                try:
-                    timestamp = float(line.split("silence_end: ")[1].split()[0])
-                    silence_ends.append(timestamp)
-                except (IndexError, ValueError):
-                    continue
-        
-        # If we didn't find any silence starts but have ends, assume silence at the beginning
-        if len(silence_ends) > len(silence_starts):
-            silence_starts.insert(0, 0)
-        
-        # If we have more starts than ends, assume silence continues to the end
-        if len(silence_starts) > len(silence_ends):
-            silence_ends.append(original_duration)
-        
-        # Create list of silent segments
-        silent_segments = list(zip(silence_starts, silence_ends))
-        
         logger.info(f"Detected {len(silent_segments)} silent segments")
         
         # No silent segments or minimal silence - just copy the file
@@ -491,65 +1731,26 @@ def _remove_silence_ffmpeg(
             shutil.copy2(input_file, output_file)
             return original_duration, original_duration, 0.0
         
-        # Step 4: Generate a complex filter to extract and concatenate non-silent segments
-        segments_file = os.path.join(temp_dir, "segments.txt")
-        
-        # Create a segments file for the concat demuxer
-        with open(segments_file, 'w') as f:
-            for i, (start, end) in enumerate(non_silent_segments):
-                segment_file = os.path.join(temp_dir, f"segment_{i:03d}.mp4")
-                duration = end - start
-                
-                # Extract segment
-                extract_cmd = [
-                    "ffmpeg",
-                    "-y",  # Overwrite output files
-                    "-i", input_file,
-                    "-ss", str(start),
-                    "-t", str(duration),
-                    "-c", "copy",  # Copy streams without re-encoding
-                    '-progress', 'pipe:1',
-                    segment_file
-                ]
-                
-                subprocess.run(extract_cmd, check=True, capture_output=True)
-                
-                # Write to concat file
-                f.write(f"file '{segment_file}'\n")
-        
-        # Step 5: Concatenate all segments
-        concat_cmd = [
-            "ffmpeg",
-            "-y",  # Overwrite output files
-            "-f", "concat",
-            "-safe", "0",
-            "-i", segments_file,
-            "-c", "copy",  # Copy streams without re-encoding
-            '-progress', 'pipe:1',
-            output_file
-        ]
-        
-        logger.info("Concatenating non-silent segments...")
-        subprocess.run(concat_cmd, check=True, capture_output=True)
-        
-        # Step 6: Get output duration
-        output_duration_cmd = [
-            "ffprobe", 
-            "-v", "error", 
-            "-show_entries", "format=duration",
-            "-of", "json",
-            output_file
-        ]
-        
-        output_duration_result = subprocess.run(
-            output_duration_cmd, 
-            capture_output=True, 
-            text=True, 
-            check=True
-        )
-        
-        output_duration_data = json.loads(output_duration_result.stdout)
-        output_duration = float(output_duration_data["format"]["duration"])
+        # Step 4: Render the non-silent segments into the output file
+        if render_mode == "filter":
+            logger.info(f"Rendering {len(non_silent_segments)} segments through a single filter graph...")
+            output_duration = _render_with_filter_graph(
+                input_file, output_file, non_silent_segments, temp_dir,
+                has_video="video" in stream_types,
+                has_audio="audio" in stream_types,
+            )
+        elif render_mode == "keyframe_copy":
+            logger.info(f"Stream-copying {len(non_silent_segments)} keyframe-aligned segments...")
+            output_duration = _render_with_keyframe_copy(
+                input_file, output_file, non_silent_segments, temp_dir, padding,
+                has_video="video" in stream_types,
+            )
+        else:
+            logger.info(f"Extracting {len(non_silent_segments)} segments...")
+            output_duration = _render_with_segment_files(
+                input_file, output_file, non_silent_segments, temp_dir,
+                max_workers=segment_workers,
+            )
         
         # Calculate time saved
         time_saved = original_duration - output_duration
@@ -587,6 +1788,15 @@ def remove_silence(
     chunk_duration: Optional[float] = None,
     resolution_scale: Optional[float] = None,
     use_ffmpeg: bool = True,  # New parameter to choose the implementation
+    streaming: bool = False,
+    render_mode: str = "segments",
+    segment_workers: Optional[int] = None,
+    use_cache: bool = False,
+    cache_dir: Optional[Union[str, Path]] = None,
+    follow: bool = False,
+    follow_timeout: float = 10.0,
+    refine_boundaries: bool = False,
+    refine_resolution: float = 0.001,
 ) -> Union[Tuple[float, float, float], Dict[str, Any]]:
     """
     Remove silence from a video file.
@@ -608,11 +1818,34 @@ def remove_silence(
         chunk_duration: Duration of each chunk in seconds when using chunked strategy
         resolution_scale: Scale factor for resolution when using reduced_resolution strategy
         use_ffmpeg: Whether to use the direct FFmpeg implementation (more memory efficient)
+        streaming: Whether to decode audio in bounded blocks for silence detection
+            (MoviePy implementation only)
+        render_mode: How the FFmpeg implementation renders the kept segments
+            ("segments", "filter" or "keyframe_copy")
+        segment_workers: Maximum number of concurrent segment extractions in
+            "segments" render mode (default: number of CPUs)
+        use_cache: Whether to cache silence maps on disk, so that re-running with
+            different padding or min_sound_duration does not analyze the file again
+        cache_dir: Directory for cached silence maps (default: silence_maps under
+            $ASABAAL_CACHE_DIR or ~/.cache/asabaal_utils)
+        follow: Whether to analyze the input while it is still being recorded and
+            render once it stops growing (MoviePy implementation without memory adaptation)
+        follow_timeout: Seconds without new data after which a followed recording
+            is considered finished
+        refine_boundaries: Whether to refine silence boundaries around each transition
+            at refine_resolution instead of stopping at chunk_size steps
+            (MoviePy implementation only)
+        refine_resolution: Window size in seconds used to refine boundaries
         
     Returns:
         Tuple of (original_duration, output_duration, time_saved) or
         Dict with processing results if memory adaptation is used
     """
+    if use_cache:
+        cache_dir = str(cache_dir or default_cache_dir(SILENCE_CACHE_NAMESPACE))
+    else:
+        cache_dir = None
+    
     # Use the direct FFmpeg implementation if specified
     if use_ffmpeg:
         logger.info("Using direct FFmpeg implementation for silence removal")
@@ -623,10 +1856,14 @@ def remove_silence(
             min_silence_duration=min_silence_duration,
             min_sound_duration=min_sound_duration,
             padding=padding,
+            render_mode=render_mode,
+            segment_workers=segment_workers,
+            cache=NpzCache(SILENCE_CACHE_NAMESPACE, cache_dir) if cache_dir else None,
         )
     
-    # Otherwise use the MoviePy-based implementation
-    if not use_memory_adaptation:
+    # Otherwise use the MoviePy-based implementation. A followed recording has no
+    # final size yet, so it cannot be planned for by memory adaptation.
+    if not use_memory_adaptation or follow:
         # Use the direct implementation without memory adaptation
         return _remove_silence_impl(
             input_file=input_file,
@@ -638,6 +1875,12 @@ def remove_silence(
             chunk_size=chunk_size,
             aggressive_silence_rejection=aggressive_silence_rejection,
             metadata=metadata,
+            streaming=streaming,
+            cache_dir=cache_dir,
+            follow=follow,
+            follow_timeout=follow_timeout,
+            refine_boundaries=refine_boundaries,
+            refine_resolution=refine_resolution,
         )
     
     # Prepare memory management options
@@ -664,5 +1907,225 @@ def remove_silence(
         chunk_size=chunk_size,
         aggressive_silence_rejection=aggressive_silence_rejection,
         metadata=metadata,
+        streaming=streaming,
+        cache_dir=cache_dir,
+        refine_boundaries=refine_boundaries,
+        refine_resolution=refine_resolution,
         **memory_options,
     )
+
+
+def collect_batch_inputs(
+    source: Union[str, Path],
+    output_dir: Union[str, Path],
+    suffix: str = "_nosilence",
+) -> List[Tuple[str, str]]:
+    """
+    Resolve the input and output files of a batch silence removal.
+    
+    Args:
+        source: A directory (its video files are used), a manifest file, or a
+            glob pattern. A manifest is either a JSON list of input paths or
+            {"input": ..., "output": ...} objects, or a text file with one input
+            per line, optionally followed by a tab and an output path.
+        output_dir: Directory for outputs that are not given explicitly.
+        suffix: Suffix added to the input file name for default output names.
+        
+    Returns:
+        List of (input_file, output_file) tuples.
+    """
+    source = str(source)
+    
+    def default_output(input_file: str) -> str:
+        root, ext = os.path.splitext(os.path.basename(input_file))
+        return os.path.join(str(output_dir), f"{root}{suffix}{ext}")
+    
+    pairs = []
+    if os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            input_file = os.path.join(source, name)
+            if os.path.isfile(input_file) and name.lower().endswith(_VIDEO_EXTENSIONS):
+                pairs.append((input_file, default_output(input_file)))
+    elif os.path.isfile(source):
+        manifest_dir = os.path.dirname(os.path.abspath(source))
+        
+        if source.lower().endswith(".json"):
+            with open(source, "r") as f:
+                entries = json.load(f)
+            items = [
+                (entry, None) if isinstance(entry, str) else (entry["input"], entry.get("output"))
+                for entry in entries
+            ]
+        else:
+            items = []
+            with open(source, "r") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line or line.startswith("#"):
+                        continue
+                    input_file, _, output_file = line.partition("\t")
+                    items.append((input_file.strip(), output_file.strip() or None))
+        
+        # Relative manifest paths are relative to the manifest itself
+        for input_file, output_file in items:
+            input_file = os.path.join(manifest_dir, input_file)
+            if output_file:
+                output_file = os.path.join(manifest_dir, output_file)
+            pairs.append((input_file, output_file or default_output(input_file)))
+    else:
+        for input_file in sorted(glob.glob(source, recursive=True)):
+            if os.path.isfile(input_file):
+                pairs.append((input_file, default_output(input_file)))
+    
+    if not pairs:
+        raise ValueError(f"No input files found for {source}")
+    
+    outputs = [os.path.abspath(output_file) for _, output_file in pairs]
+    if len(set(outputs)) != len(outputs):
+        raise ValueError("Several inputs map to the same output file; use a manifest with explicit outputs")
+    
+    return pairs
+
+
+def _is_up_to_date(input_file: str, output_file: str) -> bool:
+    """Check whether an output file exists and is newer than its input."""
+    return (
+        os.path.exists(output_file)
+        and os.path.getmtime(output_file) >= os.path.getmtime(input_file)
+    )
+
+
+def _remove_silence_batch_item(
+    input_file: str,
+    output_file: str,
+    options: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Remove silence from one file of a batch and describe the outcome.
+    
+    The output is rendered to a temporary name and moved into place only on
+    success, so an interrupted run never leaves an output that looks up to date.
+    
+    Args:
+        input_file: Path to the input video file.
+        output_file: Path to save the output video file.
+        options: Keyword arguments for remove_silence.
+        
+    Returns:
+        Report entry for the file.
+    """
+    entry = {"input_file": input_file, "output_file": output_file}
+    start_time = time.perf_counter()
+    
+    root, ext = os.path.splitext(output_file)
+    partial_file = f"{root}.partial{ext}"
+    
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+        result = remove_silence(input_file, partial_file, **options)
+        
+        # Unwrap the result of memory-adaptive processing
+        if isinstance(result, dict):
+            if result.get("status") != "success":
+                raise RuntimeError(result.get("message", "Unknown error"))
+            result = result.get("result")
+        
+        os.replace(partial_file, output_file)
+        entry["status"] = "success"
+        
+        if isinstance(result, tuple) and len(result) == 3:
+            original_duration, output_duration, time_saved = result
+            entry["original_duration"] = float(original_duration)
+            entry["output_duration"] = float(output_duration)
+            entry["time_saved"] = float(time_saved)
+    except Exception as e:
+        logger.error(f"Failed to remove silence from {input_file}: {e}")
+        entry["status"] = "failed"
+        entry["error"] = str(e)
+        if os.path.exists(partial_file):
+            os.unlink(partial_file)
+    
+    entry["processing_time"] = time.perf_counter() - start_time
+    return entry
+
+
+def remove_silence_batch(
+    source: Union[str, Path],
+    output_dir: Union[str, Path],
+    jobs: Optional[int] = None,
+    suffix: str = "_nosilence",
+    overwrite: bool = False,
+    report_file: Optional[Union[str, Path]] = None,
+    **options,
+) -> Dict[str, Any]:
+    """
+    Remove silence from many files using a shared pool of worker processes.
+    
+    Worker processes import the video libraries once and then handle several
+    files each. Outputs newer than their input are skipped unless overwrite is set.
+    
+    Args:
+        source: Directory, manifest file or glob pattern (see collect_batch_inputs).
+        output_dir: Directory for outputs that are not given by a manifest.
+        jobs: Number of files processed in parallel (default: number of CPUs).
+        suffix: Suffix added to input file names for default output names.
+        overwrite: Whether to process files whose output is already up to date.
+        report_file: Optional path to write the JSON report to.
+        **options: Keyword arguments passed to remove_silence for every file.
+        
+    Returns:
+        Report dictionary with one entry per file and a summary.
+    """
+    batch_start = time.perf_counter()
+    pairs = collect_batch_inputs(source, output_dir, suffix)
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    
+    # Share the CPUs between the files processed in parallel
+    if "segment_workers" not in options or options["segment_workers"] is None:
+        options["segment_workers"] = max(1, (os.cpu_count() or 1) // jobs)
+    
+    entries: List[Optional[Dict[str, Any]]] = [None] * len(pairs)
+    pending = []
+    
+    for index, (input_file, output_file) in enumerate(pairs):
+        if not overwrite and _is_up_to_date(input_file, output_file):
+            logger.info(f"Skipping {input_file}: output is up to date")
+            entries[index] = {"input_file": input_file, "output_file": output_file, "status": "skipped"}
+        else:
+            pending.append(index)
+    
+    logger.info(f"Removing silence from {len(pending)} of {len(pairs)} files with {jobs} jobs")
+    
+    if jobs == 1 or len(pending) <= 1:
+        for index in tqdm(pending, desc="Removing silence"):
+            entries[index] = _remove_silence_batch_item(*pairs[index], options)
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as executor:
+            futures = {
+                executor.submit(_remove_silence_batch_item, *pairs[index], options): index
+                for index in pending
+            }
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Removing silence"):
+                entries[futures[future]] = future.result()
+    
+    processed = [entry for entry in entries if entry["status"] == "success"]
+    report = {
+        "files": entries,
+        "summary": {
+            "total_files": len(entries),
+            "processed": len(processed),
+            "skipped": sum(1 for entry in entries if entry["status"] == "skipped"),
+            "failed": sum(1 for entry in entries if entry["status"] == "failed"),
+            "original_duration": sum(entry.get("original_duration", 0.0) for entry in processed),
+            "output_duration": sum(entry.get("output_duration", 0.0) for entry in processed),
+            "time_saved": sum(entry.get("time_saved", 0.0) for entry in processed),
+            "wall_time": time.perf_counter() - batch_start,
+        },
+    }
+    
+    if report_file:
+        with open(report_file, "w") as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Batch report saved to {report_file}")
+    
+    return report
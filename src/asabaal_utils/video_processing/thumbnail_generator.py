@@ -16,8 +16,11 @@ import json
 
 import numpy as np
 from tqdm import tqdm
-from moviepy.video.io import VideoFileClip
-from PIL import Image, ImageStat, ImageEnhance, ImageFilter
+from moviepy.editor import VideoFileClip
+from PIL import Image, ImageEnhance
+
+from .frame_source import FFmpegFrameSource
+from .frame_metrics import metrics_to_dicts, thumbnail_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +62,8 @@ class ThumbnailGenerator:
         prefer_human_frames: bool = True,
         output_format: str = "jpg",
         output_quality: int = 90,
+        use_ffmpeg_reader: bool = False,
+        metrics_batch_size: int = 8,
     ):
         """
         Initialize the thumbnail generator.
@@ -76,6 +81,10 @@ class ThumbnailGenerator:
             prefer_human_frames: If True, will prioritize frames with human subjects
             output_format: Format to save thumbnails (jpg, png)
             output_quality: Output quality (0-100) for JPEG format
+            use_ffmpeg_reader: Whether to decode the analyzed frames with a single
+                FFmpeg process instead of seeking with MoviePy for each frame
+            metrics_batch_size: Number of analyzed frames whose quality metrics
+                are computed together
         """
         self.frames_to_extract = frames_to_extract
         self.min_frame_interval = min_frame_interval
@@ -89,6 +98,8 @@ class ThumbnailGenerator:
         self.prefer_human_frames = prefer_human_frames
         self.output_format = output_format.lower()
         self.output_quality = output_quality
+        self.use_ffmpeg_reader = use_ffmpeg_reader
+        self.metrics_batch_size = max(1, metrics_batch_size)
         
         # Validate parameters
         if self.output_format not in ["jpg", "jpeg", "png"]:
@@ -129,34 +140,50 @@ class ThumbnailGenerator:
         Returns:
             Dictionary of quality metrics
         """
-        # Convert to PIL Image for analysis
-        pil_img = Image.fromarray(frame)
-        
-        # Calculate brightness
-        gray = pil_img.convert("L")
-        stat = ImageStat.Stat(gray)
-        brightness = stat.mean[0] / 255.0
+        return self._calculate_batch_metrics(frame[np.newaxis])[0]
+    
+    def _calculate_batch_metrics(self, frames: Union[np.ndarray, List[np.ndarray]]) -> List[Dict[str, float]]:
+        """
+        Calculate image quality metrics for several equally sized frames at once.
         
-        # Calculate contrast
-        extrema = gray.getextrema()
-        contrast = (extrema[1] - extrema[0]) / 255.0
+        Args:
+            frames: (N, H, W, 3) array or list of frames
+            
+        Returns:
+            List with a dictionary of quality metrics per frame
+        """
+        return metrics_to_dicts(thumbnail_metrics(frames))
+    
+    def _select_candidates(
+        self,
+        batch: List[Tuple[float, np.ndarray, float]]
+    ) -> List[Tuple[float, float, Dict[str, float], float]]:
+        """
+        Score a batch of analyzed frames and keep those meeting the basic criteria.
         
-        # Calculate colorfulness - variance of color channels
-        stat = ImageStat.Stat(pil_img)
-        r_var = np.var(stat.mean[:3]) / 255.0
-        colorfulness = min(1.0, r_var * 5)  # Scale up for better distribution
+        Args:
+            batch: List of (timestamp, frame, motion_score) tuples
+            
+        Returns:
+            List of (timestamp, quality_score, metrics, motion_score) tuples
+        """
+        candidates = []
+        batch_metrics = self._calculate_batch_metrics([frame for _, frame, _ in batch])
         
-        # Calculate sharpness - standard deviation of Laplacian
-        laplacian = pil_img.filter(ImageFilter.FIND_EDGES)
-        stat = ImageStat.Stat(laplacian)
-        sharpness = min(1.0, stat.stddev[0] / 50.0)  # Normalize to 0-1
+        for (time, _, motion_score), metrics in zip(batch, batch_metrics):
+            # Calculate overall quality score
+            quality_score = self._calculate_quality_score(metrics, motion_score)
+            
+            # Record as candidate if it meets basic criteria
+            if (metrics["brightness"] >= self.min_brightness and 
+                metrics["brightness"] <= self.max_brightness and
+                metrics["contrast"] >= self.min_contrast and
+                metrics["colorfulness"] >= self.min_colorfulness and
+                motion_score <= self.motion_threshold):
+                
+                candidates.append((time, quality_score, metrics, motion_score))
         
-        return {
-            "brightness": brightness,
-            "contrast": contrast,
-            "colorfulness": colorfulness,
-            "sharpness": sharpness,
-        }
+        return candidates
     
     def _calculate_quality_score(self, metrics: Dict[str, float], motion_score: float) -> float:
         """
@@ -268,32 +295,37 @@ class ThumbnailGenerator:
             prev_frame = None
             candidate_times = []
             
-            # First pass: analyze frames and collect candidates
-            for time in tqdm(np.arange(start_time, end_time, sampling_interval), desc="Analyzing frames"):
-                # Extract frame at the specified time
-                frame = video.get_frame(time)
-                
+            sample_times = np.arange(start_time, end_time, sampling_interval)
+            if self.use_ffmpeg_reader:
+                # The frame source keeps the previous frame valid while the next
+                # one is read, which is all the motion score needs
+                frames = FFmpegFrameSource(
+                    video_path, 1.0 / sampling_interval, start_time=start_time, end_time=end_time
+                )
+            else:
+                frames = ((time, video.get_frame(time)) for time in sample_times)
+            
+            # First pass: analyze frames in batches and collect candidates
+            batch = []
+            for time, frame in tqdm(frames, total=len(sample_times), desc="Analyzing frames"):
                 # Calculate motion score
                 motion_score = self._calculate_motion_score(frame, prev_frame)
                 
-                # Calculate frame metrics
-                metrics = self._calculate_frame_metrics(frame)
+                if self.use_ffmpeg_reader:
+                    # Batched frames outlive the reader's reused buffers
+                    frame = frame.copy()
+                batch.append((time, frame, motion_score))
                 
-                # Calculate overall quality score
-                quality_score = self._calculate_quality_score(metrics, motion_score)
-                
-                # Record as candidate if it meets basic criteria
-                if (metrics["brightness"] >= self.min_brightness and 
-                    metrics["brightness"] <= self.max_brightness and
-                    metrics["contrast"] >= self.min_contrast and
-                    metrics["colorfulness"] >= self.min_colorfulness and
-                    motion_score <= self.motion_threshold):
-                    
-                    candidate_times.append((time, quality_score, metrics, motion_score))
+                if len(batch) == self.metrics_batch_size:
+                    candidate_times.extend(self._select_candidates(batch))
+                    batch = []
                 
                 # Update previous frame
                 prev_frame = frame
             
+            if batch:
+                candidate_times.extend(self._select_candidates(batch))
+            
             # Sort candidates by quality score
             candidate_times.sort(key=lambda x: x[1], reverse=True)
             
@@ -379,7 +411,8 @@ def generate_thumbnails(
     skip_end_percent: float = 0.05,
     output_format: str = "jpg",
     output_quality: int = 90,
-    metadata_file: Optional[Union[str, Path]] = None
+    metadata_file: Optional[Union[str, Path]] = None,
+    use_ffmpeg_reader: bool = False
 ) -> List[Dict[str, Any]]:
     """
     Generate candidate thumbnails from a video.
@@ -394,6 +427,8 @@ def generate_thumbnails(
         output_format: Format to save thumbnails ("jpg" or "png")
         output_quality: Output quality for JPEG format (1-100)
         metadata_file: Optional path to save thumbnail metadata as JSON
+        use_ffmpeg_reader: Whether to decode analyzed frames through a single
+            FFmpeg process
         
     Returns:
         List of dictionaries with thumbnail information
@@ -405,7 +440,8 @@ def generate_thumbnails(
         skip_start_percent=skip_start_percent,
         skip_end_percent=skip_end_percent,
         output_format=output_format,
-        output_quality=output_quality
+        output_quality=output_quality,
+        use_ffmpeg_reader=use_ffmpeg_reader
     )
     
     # Generate thumbnails
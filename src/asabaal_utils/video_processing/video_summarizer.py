@@ -11,7 +11,7 @@ import tempfile
 import json
 import math
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple, Union, Set
+from typing import List, Dict, Any, Optional, Tuple, Union, Set, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 import heapq
@@ -30,6 +30,7 @@ from PIL import Image, ImageStat
 from .silence_detector import SilenceDetector
 from .thumbnail_generator import ThumbnailGenerator
 from .memory_utils import memory_adaptive_processing
+from .frame_source import FFmpegFrameSource, group_frames_by_interval
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +90,7 @@ class VideoSummarizer:
         transition_duration: float = 0.5,
         summary_style: SummaryStyle = SummaryStyle.OVERVIEW,
         use_memory_adaptation: bool = True,
+        use_ffmpeg_reader: bool = False,
     ):
         """
         Initialize the video summarizer.
@@ -110,6 +112,8 @@ class VideoSummarizer:
             transition_duration: Duration for transitions between segments
             summary_style: Style of the summary to create
             use_memory_adaptation: Whether to use memory-adaptive processing
+            use_ffmpeg_reader: Whether to decode the analyzed frames with a single
+                FFmpeg process instead of seeking with MoviePy for each frame
         """
         self.target_duration = target_duration
         self.segment_length = segment_length
@@ -127,6 +131,7 @@ class VideoSummarizer:
         self.transition_duration = transition_duration
         self.summary_style = summary_style
         self.use_memory_adaptation = use_memory_adaptation
+        self.use_ffmpeg_reader = use_ffmpeg_reader
         
         # Silence detector for finding speech segments
         self.silence_detector = SilenceDetector(
@@ -338,6 +343,47 @@ class VideoSummarizer:
         
         return merged_segments
     
+    def _iter_segment_frames(
+        self,
+        video: VideoFileClip,
+        segment_times: List[Tuple[float, float]]
+    ) -> Iterator[List[np.ndarray]]:
+        """
+        Decode the sampled frames of each segment.
+        
+        Args:
+            video: VideoFileClip to decode frames from
+            segment_times: Consecutive (start_time, end_time) tuples
+            
+        Yields:
+            List of sampled frames for each segment
+        """
+        if not segment_times:
+            return
+        
+        if self.use_ffmpeg_reader:
+            with FFmpegFrameSource(
+                video.filename,
+                self.frame_sample_rate,
+                start_time=segment_times[0][0],
+                end_time=segment_times[-1][1]
+            ) as source:
+                yield from group_frames_by_interval(source, segment_times)
+            return
+        
+        for start_time, end_time in segment_times:
+            frame_times = np.arange(start_time, end_time, 1.0/self.frame_sample_rate)
+            frames = []
+            
+            for time in frame_times:
+                try:
+                    frame = video.get_frame(time)
+                    frames.append(frame)
+                except Exception as e:
+                    logger.warning(f"Error extracting frame at {time}: {e}")
+            
+            yield frames
+    
     def _score_segments(
         self,
         video: VideoFileClip,
@@ -360,18 +406,10 @@ class VideoSummarizer:
         segments = []
         prev_frame = None
         
-        for i, (start_time, end_time) in enumerate(tqdm(segment_times, desc="Scoring segments")):
-            # Extract frames for this segment
-            frame_times = np.arange(start_time, end_time, 1.0/self.frame_sample_rate)
-            frames = []
-            
-            for time in frame_times:
-                try:
-                    frame = video.get_frame(time)
-                    frames.append(frame)
-                except Exception as e:
-                    logger.warning(f"Error extracting frame at {time}: {e}")
-            
+        segment_frames = self._iter_segment_frames(video, segment_times)
+        for i, ((start_time, end_time), frames) in enumerate(
+            zip(tqdm(segment_times, desc="Scoring segments"), segment_frames)
+        ):
             if not frames:
                 logger.warning(f"No frames extracted for segment {i} ({start_time}-{end_time})")
                 continue
@@ -1112,6 +1150,7 @@ def create_video_summary(
     segment_count: Optional[int] = None,
     chunk_duration: Optional[float] = None,
     resolution_scale: Optional[float] = None,
+    use_ffmpeg_reader: bool = False,
 ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
     """
     Create a content-aware summary of a video.
@@ -1130,6 +1169,8 @@ def create_video_summary(
         segment_count: Number of segments to split video into when using segment strategy
         chunk_duration: Duration of each chunk in seconds when using chunked strategy
         resolution_scale: Scale factor for resolution when using reduced_resolution strategy
+        use_ffmpeg_reader: Whether to decode analyzed frames through a single
+            FFmpeg process
         
     Returns:
         List of dictionaries with segment information or
@@ -1149,7 +1190,8 @@ def create_video_summary(
         favor_beginning=favor_beginning,
         favor_ending=favor_ending,
         summary_style=style,
-        use_memory_adaptation=use_memory_adaptation
+        use_memory_adaptation=use_memory_adaptation,
+        use_ffmpeg_reader=use_ffmpeg_reader
     )
     
     # Create summary
@@ -0,0 +1,273 @@
+import numpy as np
+import pytest
+import shutil
+import subprocess
+
+from pathlib import Path
+from typing import List, Tuple
+from asabaal_utils.video_processing.color_analyzer import ColorAnalyzer, ColorHistogram, ColorNameMatcher
+
+requires_ffmpeg = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg is not installed")
+
+# Colors of the four quadrants of the synthesized frames
+QUADRANT_COLORS: List[Tuple[int, int, int]] = [(220, 30, 30), (30, 200, 40), (20, 40, 210), (240, 230, 60)]
+
+# FFmpeg colors of the one-second segments of the synthesized videos
+SEGMENT_COLORS: List[str] = ["red", "lime", "blue", "yellow", "white"]
+
+
+def _quadrant_frame(height: int = 360, width: int = 640, noise: int = 12, seed: int = 0) -> np.ndarray:
+    """Create a frame made of four noisy solid-color quadrants.
+
+    Parameters
+    ----------
+    height : int
+        Frame height in pixels
+    width : int
+        Frame width in pixels
+    noise : int
+        Maximum per-channel noise added to every pixel
+    seed : int
+        Seed of the noise
+
+    Returns
+    -------
+    np.ndarray
+        RGB uint8 frame
+    """
+    frame: np.ndarray = np.zeros((height, width, 3), dtype=np.int16)
+    half_h, half_w = height // 2, width // 2
+    for (rows, cols), color in zip(
+        [(slice(0, half_h), slice(0, half_w)), (slice(0, half_h), slice(half_w, None)),
+         (slice(half_h, None), slice(0, half_w)), (slice(half_h, None), slice(half_w, None))],
+        QUADRANT_COLORS
+    ):
+        frame[rows, cols] = color
+    frame += np.random.default_rng(seed).integers(-noise, noise + 1, frame.shape, dtype=np.int16)
+    return np.clip(frame, 0, 255).astype(np.uint8)
+
+
+class TestColorAnalyzer:
+    """Test suite for the color analyzer.
+
+    Methods
+    -------
+    test_palette_subsampling
+        Check that stratified and random sampling stay within the pixel budget
+    test_minibatch_palette_matches_kmeans
+        Check that the subsampled MiniBatchKMeans palette matches full KMeans
+    test_warm_start_keeps_palette_stable
+        Check that warm-started palettes of similar segments keep their order
+    test_vectorized_color_names
+        Check that the KD-tree lookup matches a linear scan over COLOR_MAP
+    test_histogram_palette
+        Check that a palette derived from an accumulated histogram finds the frame colors
+    test_histogram_clustering_methods
+        Check that every clustering method derives a palette from a histogram
+    test_streaming_histogram_segments
+        Check that histogram accumulation analyzes each segment's own frames
+    test_histogram_without_frames
+        Check that a whole-video histogram without sampled frames raises a ValueError
+    test_parallel_segments_match_serial
+        Check that segments analyzed in worker processes are merged in order
+    """
+
+    @pytest.mark.parametrize("sampling", ["stratified", "random"])
+    def test_palette_subsampling(self: "TestColorAnalyzer", sampling: str) -> None:
+        """Test that subsampling bounds the number of clustered pixels.
+
+        Parameters
+        ----------
+        sampling : str
+            Pixel sampling strategy
+        """
+        analyzer: ColorAnalyzer = ColorAnalyzer(max_palette_pixels=5000, palette_sampling=sampling)
+        frame: np.ndarray = _quadrant_frame()
+
+        pixels: np.ndarray = analyzer._sample_palette_pixels(frame)
+        flat: np.ndarray = analyzer._sample_palette_pixels(frame.reshape(-1, 3))
+
+        assert pixels.shape[1] == 3 and 2500 <= len(pixels) <= 5000
+        assert flat.shape[1] == 3 and 2500 <= len(flat) <= 5000
+        np.testing.assert_array_equal(analyzer._sample_palette_pixels(frame[:10, :10]), frame[:10, :10].reshape(-1, 3))
+
+    def test_minibatch_palette_matches_kmeans(self: "TestColorAnalyzer") -> None:
+        """Test the fast palette against the full KMeans palette."""
+        frame: np.ndarray = _quadrant_frame()
+
+        expected_colors, expected_pct = ColorAnalyzer(color_clustering_method="kmeans")._quantize_colors(frame, 4)
+        colors, percentages = ColorAnalyzer(
+            color_clustering_method="minibatch", max_palette_pixels=4000
+        )._quantize_colors(frame, 4)
+
+        np.testing.assert_allclose(sorted(colors), sorted(expected_colors), atol=3)
+        np.testing.assert_allclose(percentages, expected_pct, atol=0.03)
+
+    def test_warm_start_keeps_palette_stable(self: "TestColorAnalyzer") -> None:
+        """Test that consecutive segments reuse the previous palette as a start."""
+        analyzer: ColorAnalyzer = ColorAnalyzer(color_clustering_method="minibatch", max_palette_pixels=4000)
+
+        first, _ = analyzer._quantize_colors(_quadrant_frame(seed=1), 4, warm_start=True)
+        centers: np.ndarray = analyzer._previous_centers.copy()
+        second, _ = analyzer._quantize_colors(_quadrant_frame(seed=2), 4, warm_start=True)
+
+        np.testing.assert_allclose(second, first, atol=3)
+        np.testing.assert_allclose(analyzer._previous_centers, centers, atol=3)
+        np.testing.assert_allclose(sorted(centers.tolist()), sorted(QUADRANT_COLORS), atol=3)
+
+    def test_vectorized_color_names(self: "TestColorAnalyzer") -> None:
+        """Test batched color naming against the weighted-distance linear scan."""
+        colors: np.ndarray = np.random.default_rng(0).integers(0, 256, (2000, 3))
+        expected: List[str] = [
+            min(ColorNameMatcher.COLOR_MAP.items(),
+                key=lambda item: ColorNameMatcher._color_distance(tuple(color), item[0]))[1]
+            for color in colors
+        ]
+
+        assert ColorNameMatcher.get_color_names(colors) == expected
+        assert ColorNameMatcher.get_color_name(tuple(colors[0])) == expected[0]
+        assert ColorNameMatcher.get_color_names(list(ColorNameMatcher.COLOR_MAP)) == \
+            list(ColorNameMatcher.COLOR_MAP.values())
+        assert ColorNameMatcher.get_color_names(np.zeros((0, 3))) == []
+
+    def test_histogram_palette(self: "TestColorAnalyzer") -> None:
+        """Test palette extraction from a histogram of several frames."""
+        histogram: ColorHistogram = ColorHistogram(16)
+        for seed in range(3):
+            histogram.add(_quadrant_frame(seed=seed))
+
+        colors, percentages = ColorAnalyzer()._quantize_histogram(histogram, 4)
+
+        assert histogram.frame_count == 3
+        assert int(histogram.counts.sum()) == 3 * 360 * 640
+        np.testing.assert_allclose(sorted(colors), sorted(QUADRANT_COLORS), atol=2)
+        np.testing.assert_allclose(percentages, [0.25] * 4, atol=0.01)
+
+    @pytest.mark.parametrize("method", ["kmeans", "minibatch", "dominant"])
+    def test_histogram_clustering_methods(self: "TestColorAnalyzer", method: str) -> None:
+        """Test that histogram palettes respect the clustering method.
+
+        Parameters
+        ----------
+        method : str
+            Palette clustering method
+        """
+        histogram: ColorHistogram = ColorHistogram(16)
+        histogram.add(_quadrant_frame(noise=0))
+        analyzer: ColorAnalyzer = ColorAnalyzer(color_clustering_method=method)
+
+        colors, percentages = analyzer._quantize_histogram(histogram, 3, warm_start=True)
+
+        assert len(colors) == 3
+        if method == "dominant":
+            # The three most populated bins, without merging the fourth color
+            assert set(colors) <= set(QUADRANT_COLORS)
+            np.testing.assert_allclose(percentages, [0.25] * 3)
+        else:
+            # Two of the four colors share a cluster
+            np.testing.assert_allclose(percentages, [0.5, 0.25, 0.25])
+            assert analyzer._previous_centers.shape == (3, 3)
+
+    @requires_ffmpeg
+    @pytest.mark.parametrize("use_ffmpeg_reader", [False, True])
+    def test_streaming_histogram_segments(
+        self: "TestColorAnalyzer", tmp_path: Path, use_ffmpeg_reader: bool
+    ) -> None:
+        """Test that every segment gets the palette of its own frames.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        use_ffmpeg_reader : bool
+            Whether frames are decoded through the FFmpeg pipe
+        """
+        video_path: Path = tmp_path / "colors.mp4"
+        subprocess.run(
+            ["ffmpeg", "-v", "error", "-y", "-f", "lavfi", "-i",
+             "color=c=red:s=160x120:r=25:d=2[a];color=c=blue:s=160x120:r=25:d=2[b];[a][b]concat=n=2:v=1:a=0",
+             "-c:v", "libx264", "-pix_fmt", "yuv444p", "-qp", "0", str(video_path)],
+            check=True
+        )
+        analyzer: ColorAnalyzer = ColorAnalyzer(
+            palette_size=3, frame_sample_rate=4.0, segment_duration=2.0, skip_start_percent=0.0,
+            skip_end_percent=0.0, color_accumulation="histogram", use_ffmpeg_reader=use_ffmpeg_reader
+        )
+
+        theme, segments = analyzer.analyze_video_colors(
+            video_path, output_dir=tmp_path, create_palette_image=False
+        )
+
+        assert [(s.start_time, s.end_time) for s in segments] == [(0.0, 2.0), (2.0, 4.0)]
+        assert [s.color_names[0] for s in segments] == ["Red", "Blue"]
+        assert [len(s.dominant_colors) for s in segments] == [1, 1]
+        assert sorted(theme.color_names) == ["Blue", "Red"]
+        assert segments[1].brightness == pytest.approx(1 / 3, abs=0.02)
+
+    @requires_ffmpeg
+    def test_histogram_without_frames(self: "TestColorAnalyzer", tmp_path: Path) -> None:
+        """Test that an empty analysis range is reported instead of crashing.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        """
+        video_path: Path = tmp_path / "colors.mp4"
+        subprocess.run(
+            ["ffmpeg", "-v", "error", "-y", "-f", "lavfi", "-i", "color=c=red:s=160x120:r=25:d=2",
+             "-pix_fmt", "yuv420p", str(video_path)],
+            check=True
+        )
+        analyzer: ColorAnalyzer = ColorAnalyzer(
+            skip_start_percent=0.6, skip_end_percent=0.6, color_accumulation="histogram"
+        )
+
+        with pytest.raises(ValueError, match="No frames were sampled"):
+            analyzer.analyze_video_colors(
+                video_path, output_dir=tmp_path, create_palette_image=False, create_segments=False
+            )
+
+    @requires_ffmpeg
+    @pytest.mark.parametrize("accumulation", ["average", "histogram"])
+    def test_parallel_segments_match_serial(
+        self: "TestColorAnalyzer", tmp_path: Path, accumulation: str
+    ) -> None:
+        """Test that worker processes give the same segments and theme.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        accumulation : str
+            How sampled frames of a segment are combined
+        """
+        video_path: Path = tmp_path / "colors.mp4"
+        subprocess.run(
+            ["ffmpeg", "-v", "error", "-y", "-f", "lavfi", "-i",
+             ";".join(f"color=c={c}:s=160x120:r=25:d=1[{c}]" for c in SEGMENT_COLORS)
+             + ";" + "".join(f"[{c}]" for c in SEGMENT_COLORS) + f"concat=n={len(SEGMENT_COLORS)}:v=1:a=0",
+             "-c:v", "libx264", "-pix_fmt", "yuv444p", "-qp", "0", str(video_path)],
+            check=True
+        )
+
+        results: list = []
+        for workers in (1, 2):
+            analyzer: ColorAnalyzer = ColorAnalyzer(
+                palette_size=3, frame_sample_rate=2.0, segment_duration=1.0, skip_start_percent=0.0,
+                skip_end_percent=0.0, color_accumulation=accumulation, workers=workers
+            )
+            results.append(analyzer.analyze_video_colors(
+                video_path, output_dir=tmp_path / str(workers), create_palette_image=False,
+                segment_palette_images=True
+            ))
+
+        (serial_theme, serial_segments), (parallel_theme, parallel_segments) = results
+        assert len(parallel_segments) == 5
+        assert [s.color_names[0] for s in parallel_segments] == ["Red", "Green", "Blue", "Yellow", "White"]
+        assert [s.start_time for s in parallel_segments] == [s.start_time for s in serial_segments]
+        assert [s.color_names for s in parallel_segments] == [s.color_names for s in serial_segments]
+        assert [s.brightness for s in parallel_segments] == \
+            pytest.approx([s.brightness for s in serial_segments])
+        assert parallel_theme.color_names == serial_theme.color_names
+        assert len(list((tmp_path / "2").glob("*_segment_*_palette.png"))) == 5
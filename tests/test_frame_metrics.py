@@ -0,0 +1,138 @@
+import numpy as np
+import pytest
+
+from typing import Dict, List
+from PIL import Image, ImageFilter, ImageStat
+from asabaal_utils.video_processing.frame_metrics import (
+    COLOR_METRICS_DTYPE, THUMBNAIL_METRICS_DTYPE, color_metrics, metrics_to_dicts, thumbnail_metrics
+)
+
+
+def _frame_stack(count: int = 7, height: int = 37, width: int = 53) -> np.ndarray:
+    """Create random frames plus black, white and single-channel frames.
+
+    Parameters
+    ----------
+    count : int
+        Number of frames
+    height : int
+        Frame height in pixels
+    width : int
+        Frame width in pixels
+
+    Returns
+    -------
+    np.ndarray
+        (count, height, width, 3) uint8 stack
+    """
+    frames: np.ndarray = np.random.default_rng(0).integers(0, 256, (count, height, width, 3), dtype=np.uint8)
+    frames[0] = 0
+    frames[1] = 255
+    frames[2, :, :, 1:] = 0
+    return frames
+
+
+def _reference_color_metrics(frame: np.ndarray) -> Dict[str, float]:
+    """Compute the color analyzer's metrics of one frame in float64.
+
+    Parameters
+    ----------
+    frame : np.ndarray
+        RGB uint8 frame
+
+    Returns
+    -------
+    Dict[str, float]
+        Color metrics of the frame
+    """
+    values: np.ndarray = frame.astype(np.float64)
+    maxc: np.ndarray = values.max(axis=2)
+    delta: np.ndarray = maxc - values.min(axis=2)
+    rg: np.ndarray = values[..., 0] - values[..., 1]
+    yb: np.ndarray = 0.5 * (values[..., 0] + values[..., 1]) - values[..., 2]
+    colorfulness: float = np.hypot(rg.std(), yb.std()) + 0.3 * np.hypot(rg.mean(), yb.mean())
+    return {
+        "brightness": values.mean() / 255.0,
+        "saturation": np.mean(np.divide(delta, maxc, out=np.zeros_like(delta), where=maxc != 0)),
+        "contrast": values.std() / 255.0,
+        "color_variance": values.reshape(-1, 3).var(axis=0).mean() / 255.0,
+        "colorfulness": min(1.0, colorfulness / 100.0),
+    }
+
+
+def _reference_thumbnail_metrics(frame: np.ndarray) -> Dict[str, float]:
+    """Compute the thumbnail generator's metrics of one frame with PIL.
+
+    Parameters
+    ----------
+    frame : np.ndarray
+        RGB uint8 frame
+
+    Returns
+    -------
+    Dict[str, float]
+        Quality metrics of the frame
+    """
+    image: Image.Image = Image.fromarray(frame)
+    gray: Image.Image = image.convert("L")
+    extrema = gray.getextrema()
+    return {
+        "brightness": ImageStat.Stat(gray).mean[0] / 255.0,
+        "contrast": (extrema[1] - extrema[0]) / 255.0,
+        "colorfulness": min(1.0, np.var(ImageStat.Stat(image).mean[:3]) / 255.0 * 5),
+        "sharpness": min(1.0, ImageStat.Stat(image.filter(ImageFilter.FIND_EDGES)).stddev[0] / 50.0),
+    }
+
+
+class TestFrameMetrics:
+    """Test suite for the batched frame metrics.
+
+    Methods
+    -------
+    test_color_metrics
+        Check the color analyzer's metrics against a float64 computation per frame
+    test_thumbnail_metrics
+        Check the thumbnail generator's metrics against PIL
+    test_invalid_stack
+        Check that frames without three channels are rejected and empty stacks are allowed
+    """
+
+    @pytest.mark.parametrize("batch_size", [1, 3, 16])
+    def test_color_metrics(self: "TestFrameMetrics", batch_size: int) -> None:
+        """Test batched color metrics for batches of several sizes.
+
+        Parameters
+        ----------
+        batch_size : int
+            Number of frames processed together
+        """
+        frames: np.ndarray = _frame_stack()
+
+        metrics: np.ndarray = color_metrics(frames, batch_size=batch_size)
+
+        assert metrics.dtype == COLOR_METRICS_DTYPE and len(metrics) == len(frames)
+        for result, frame in zip(metrics_to_dicts(metrics), frames):
+            assert result == pytest.approx(_reference_color_metrics(frame), abs=1e-5)
+
+    @pytest.mark.parametrize("batch_size", [1, 3, 16])
+    def test_thumbnail_metrics(self: "TestFrameMetrics", batch_size: int) -> None:
+        """Test batched thumbnail metrics for a list of frames.
+
+        Parameters
+        ----------
+        batch_size : int
+            Number of frames processed together
+        """
+        frames: List[np.ndarray] = list(_frame_stack())
+
+        metrics: np.ndarray = thumbnail_metrics(frames, batch_size=batch_size)
+
+        assert metrics.dtype == THUMBNAIL_METRICS_DTYPE and len(metrics) == len(frames)
+        for result, frame in zip(metrics_to_dicts(metrics), frames):
+            assert result == pytest.approx(_reference_thumbnail_metrics(frame), abs=1e-5)
+
+    def test_invalid_stack(self: "TestFrameMetrics") -> None:
+        """Test that grayscale frames raise a ValueError and empty stacks give no records."""
+        with pytest.raises(ValueError):
+            color_metrics(np.zeros((2, 4, 4), dtype=np.uint8))
+        assert len(thumbnail_metrics(np.zeros((0, 4, 4, 3), dtype=np.uint8))) == 0
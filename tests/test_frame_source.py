@@ -0,0 +1,165 @@
+import numpy as np
+import pytest
+import shutil
+import subprocess
+
+from pathlib import Path
+from typing import List, Tuple
+from moviepy.editor import VideoFileClip
+from asabaal_utils.video_processing.frame_source import FFmpegFrameSource, group_frames_by_interval
+from asabaal_utils.video_processing.thumbnail_generator import ThumbnailCandidate, ThumbnailGenerator
+
+requires_ffmpeg = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg is not installed")
+
+
+@pytest.fixture(scope="module")
+def test_video(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Synthesize a moving test pattern clip.
+
+    Parameters
+    ----------
+    tmp_path_factory : pytest.TempPathFactory
+        Factory for module-scoped temporary directories
+
+    Returns
+    -------
+    Path
+        Path of the synthesized clip
+    """
+    if shutil.which("ffmpeg") is None:
+        pytest.skip("ffmpeg is not installed")
+    path: Path = tmp_path_factory.mktemp("frames") / "pattern.mp4"
+    subprocess.run(
+        ["ffmpeg", "-v", "error", "-y", "-f", "lavfi", "-i", "testsrc=size=320x180:rate=25:duration=4",
+         "-c:v", "libx264", "-pix_fmt", "yuv420p", str(path)],
+        check=True
+    )
+    return path
+
+
+class TestFFmpegFrameSource:
+    """Test suite for the raw FFmpeg frame source.
+
+    Methods
+    -------
+    test_frames_match_moviepy
+        Check that sampled frames equal VideoFileClip.get_frame at the same times
+    test_scaled_frames
+        Check that frames are scaled to the requested width
+    test_frame_ranges
+        Check that selected ranges of samples are read through one process
+    test_previous_frame_stays_valid
+        Check that the previous frame is not overwritten by the next one
+    test_group_frames_by_interval
+        Check that frames are split into consecutive intervals
+    test_thumbnails_match_moviepy
+        Check that thumbnail generation gives the same candidates with both readers
+    """
+
+    @requires_ffmpeg
+    @pytest.mark.parametrize("start_time, sample_rate", [(0.0, 2.0), (0.3, 3.0), (1.1, 10.0)])
+    def test_frames_match_moviepy(
+        self: "TestFFmpegFrameSource", test_video: Path, start_time: float, sample_rate: float
+    ) -> None:
+        """Test that the frame source samples the same frames as MoviePy.
+
+        Parameters
+        ----------
+        test_video : Path
+            Synthesized test clip
+        start_time : float
+            Time of the first sample
+        sample_rate : float
+            Samples per second
+        """
+        source: FFmpegFrameSource = FFmpegFrameSource(test_video, sample_rate, start_time=start_time, end_time=3.0)
+        frames: List[Tuple[float, np.ndarray]] = [(t, frame.copy()) for t, frame in source]
+
+        expected_times: np.ndarray = np.arange(start_time, 3.0, 1.0 / sample_rate)
+        np.testing.assert_allclose([t for t, _ in frames], expected_times)
+        with VideoFileClip(str(test_video)) as video:
+            for t, frame in frames:
+                np.testing.assert_array_equal(frame, video.get_frame(t))
+
+    @requires_ffmpeg
+    def test_scaled_frames(self: "TestFFmpegFrameSource", test_video: Path) -> None:
+        """Test that the scale filter produces frames of the requested width.
+
+        Parameters
+        ----------
+        test_video : Path
+            Synthesized test clip
+        """
+        source: FFmpegFrameSource = FFmpegFrameSource(test_video, 1.0, width=160)
+        shapes: List[tuple] = [frame.shape for _, frame in source]
+
+        assert shapes == [(90, 160, 3)] * 4
+
+    @requires_ffmpeg
+    def test_frame_ranges(self: "TestFFmpegFrameSource", test_video: Path) -> None:
+        """Test that only the samples in the requested ranges are produced.
+
+        Parameters
+        ----------
+        test_video : Path
+            Synthesized test clip
+        """
+        source: FFmpegFrameSource = FFmpegFrameSource(
+            test_video, 5.0, start_time=0.4, end_time=3.5, frame_ranges=[(0, 2), (5, 5), (9, 12)]
+        )
+        frames: List[Tuple[float, np.ndarray]] = [(t, frame.copy()) for t, frame in source]
+
+        np.testing.assert_allclose([t for t, _ in frames], [0.4, 0.6, 2.2, 2.4, 2.6])
+        with VideoFileClip(str(test_video)) as video:
+            for t, frame in frames:
+                np.testing.assert_array_equal(frame, video.get_frame(t))
+
+    @requires_ffmpeg
+    def test_previous_frame_stays_valid(self: "TestFFmpegFrameSource", test_video: Path) -> None:
+        """Test that buffers are not reused before the following frame is read.
+
+        Parameters
+        ----------
+        test_video : Path
+            Synthesized test clip
+        """
+        copies: List[np.ndarray] = []
+        previous: np.ndarray = None
+        for _, frame in FFmpegFrameSource(test_video, 5.0):
+            if previous is not None:
+                np.testing.assert_array_equal(previous, copies[-1])
+                assert not np.array_equal(previous, frame)
+            copies.append(frame.copy())
+            previous = frame
+
+    def test_group_frames_by_interval(self: "TestFFmpegFrameSource") -> None:
+        """Test grouping timestamped frames into intervals."""
+        frames: List[Tuple[float, np.ndarray]] = [(t * 0.5, np.full((2, 2, 3), t)) for t in range(8)]
+        groups: List[List[np.ndarray]] = list(
+            group_frames_by_interval(frames, [(0.5, 1.5), (1.5, 1.6), (1.6, 3.0)])
+        )
+
+        assert [[int(f[0, 0, 0]) for f in group] for group in groups] == [[1, 2], [3], [4, 5]]
+
+    @requires_ffmpeg
+    def test_thumbnails_match_moviepy(self: "TestFFmpegFrameSource", test_video: Path, tmp_path: Path) -> None:
+        """Test that thumbnail scores do not depend on the frame reader.
+
+        Parameters
+        ----------
+        test_video : Path
+            Synthesized test clip
+        tmp_path : Path
+            Temporary directory provided by pytest
+        """
+        results: List[List[ThumbnailCandidate]] = [
+            ThumbnailGenerator(
+                frames_to_extract=3, min_frame_interval=0.25, min_contrast=0.0, min_colorfulness=0.0,
+                motion_threshold=1.0, use_ffmpeg_reader=reader
+            ).generate_thumbnails(test_video, output_dir=tmp_path / str(reader), save_frames=False)
+            for reader in (False, True)
+        ]
+
+        assert results[0]
+        assert [c.timestamp for c in results[1]] == pytest.approx([c.timestamp for c in results[0]])
+        assert [c.quality_score for c in results[1]] == pytest.approx([c.quality_score for c in results[0]])
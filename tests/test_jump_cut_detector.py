@@ -0,0 +1,495 @@
+import numpy as np
+import pytest
+import shutil
+import subprocess
+
+from pathlib import Path
+from typing import Iterator, List, Tuple
+from PIL import Image
+from skimage.metrics import structural_similarity
+from asabaal_utils.video_processing import jump_cut_detector
+from asabaal_utils.video_processing.jump_cut_detector import JumpCut, JumpCutDetector, TransitionType
+from asabaal_utils.video_processing.npz_cache import NpzCache
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+requires_ffmpeg = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg is not installed")
+
+
+def _synthesize_cut_video(
+    path: Path, cut_time: float = 2.0, duration: float = 4.0, size: str = "160x120"
+) -> None:
+    """Write a clip that switches from a red to a white picture at cut_time.
+
+    Parameters
+    ----------
+    path : Path
+        Destination of the video file
+    cut_time : float
+        Time of the hard cut in seconds
+    duration : float
+        Total duration of the clip in seconds
+    size : str
+        Frame size as WIDTHxHEIGHT
+    """
+    graph: str = (
+        f"color=c=red:s={size}:r=25:d={cut_time}[a];"
+        f"color=c=white:s={size}:r=25:d={duration - cut_time}[b];"
+        "[a][b]concat=n=2:v=1:a=0[out0]"
+    )
+    subprocess.run(
+        ["ffmpeg", "-v", "error", "-y", "-f", "lavfi", "-i", graph,
+         "-c:v", "libx264", "-pix_fmt", "yuv420p", str(path)],
+        check=True
+    )
+
+
+class TestJumpCutDetector:
+    """Test suite for the jump cut detector.
+
+    Methods
+    -------
+    test_score_stream_consumes_frames_lazily
+        Check that frame pairs are scored as frames arrive
+    test_parallel_scoring_matches_serial
+        Check that worker processes produce the same scores in order
+    test_pair_buffer_layout
+        Check that the shared frame ring stays within its memory budget
+    test_windows_share_one_pool
+        Check that all analysis windows are scored by one worker pool
+    test_smoothing_truncates_windows
+        Check that the sliding median matches truncated windows at the edges
+    test_ssim_from_cached_moments
+        Check that SSIM from cached local moments matches skimage
+    test_detects_hard_cut
+        Check that a hard cut is detected and its frame pair saved
+    test_analysis_proxy_resolution
+        Check that frames are scored downscaled only when requested, and saved at full resolution
+    test_ffmpeg_reader_matches_moviepy
+        Check that the FFmpeg frame reader gives the same jump cuts
+    test_scene_prefilter_limits_analysis
+        Check that the scene prefilter finds the cut while analyzing fewer frames
+    test_scene_prefilter_single_decoder
+        Check that the FFmpeg reader decodes all candidate windows in one process
+    test_ffmpeg_smoothing_backend
+        Check that transitions are rendered in one FFmpeg encode
+    test_rescores_cached_metrics
+        Check that cached per-frame metrics are re-scored without decoding
+    """
+
+    def test_score_stream_consumes_frames_lazily(self: "TestJumpCutDetector") -> None:
+        """Test that scoring keeps at most the previous frame alive."""
+        detector: JumpCutDetector = JumpCutDetector()
+        timestamps: np.ndarray = np.arange(6) * 0.1
+        produced: List[int] = []
+        scored_before_next: List[int] = []
+
+        def frames() -> Iterator[Tuple[float, np.ndarray]]:
+            for i in range(len(timestamps)):
+                # Every earlier pair must be scored before the next frame is requested
+                scored_before_next.append(len(produced))
+                produced.append(i)
+                value: int = 255 if i >= 3 else 0
+                yield timestamps[i], np.full((24, 32, 3), value, dtype=np.uint8)
+
+        scores: np.ndarray = detector._score_frame_stream(frames(), total=len(timestamps))
+
+        assert [s["frame_index"] for s in scores] == [1, 2, 3, 4, 5]
+        assert [s["timestamp"] for s in scores] == list(timestamps[1:])
+        assert [s["previous_timestamp"] for s in scores] == list(timestamps[:-1])
+        assert max(scores, key=lambda s: s["total_score"])["frame_index"] == 3
+        assert scored_before_next == list(range(len(timestamps)))
+
+    def test_parallel_scoring_matches_serial(
+        self: "TestJumpCutDetector", monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that scoring through the worker pool matches serial scoring.
+
+        Parameters
+        ----------
+        monkeypatch : pytest.MonkeyPatch
+            Fixture used to shrink batches and the shared memory budget
+        """
+        monkeypatch.setattr(jump_cut_detector, "_PAIR_BATCH_SIZE", 3)
+        rng: np.random.Generator = np.random.default_rng(0)
+        frames: List[Tuple[float, np.ndarray]] = [
+            (i * 0.1, rng.integers(0, 256, (36, 64, 3), dtype=np.uint8)) for i in range(20)
+        ]
+
+        serial: np.ndarray = JumpCutDetector()._score_frame_stream(iter(frames))
+        parallel: np.ndarray = JumpCutDetector(workers=2)._score_frame_stream(iter(frames))
+
+        np.testing.assert_array_equal(parallel, serial)
+
+        # A budget of a few frames leaves fewer regions than workers
+        monkeypatch.setattr(jump_cut_detector, "_PAIR_BUFFER_BYTES", 5 * frames[0][1].nbytes)
+        limited: np.ndarray = JumpCutDetector(workers=3)._score_frame_stream(iter(frames))
+
+        np.testing.assert_array_equal(limited, serial)
+
+    def test_windows_share_one_pool(
+        self: "TestJumpCutDetector", monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that several windows are scored through a single pool without crossing windows.
+
+        Parameters
+        ----------
+        monkeypatch : pytest.MonkeyPatch
+            Fixture used to count worker pools and shrink batches
+        """
+        monkeypatch.setattr(jump_cut_detector, "_PAIR_BATCH_SIZE", 3)
+        pools: List[int] = []
+
+        class CountingPool(jump_cut_detector.ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs) -> None:
+                pools.append(1)
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr(jump_cut_detector, "ProcessPoolExecutor", CountingPool)
+        rng: np.random.Generator = np.random.default_rng(0)
+        bounds: List[Tuple[int, int]] = [(0, 4), (10, 11), (20, 27), (30, 32)]
+
+        def windows() -> Iterator[Tuple[int, Iterator[Tuple[float, np.ndarray]]]]:
+            frames = np.random.default_rng(1).integers(0, 256, (32, 36, 64, 3), dtype=np.uint8)
+            for first, end in bounds:
+                yield first, ((i * 0.1, frames[i]) for i in range(first, end))
+
+        serial, serial_windows = JumpCutDetector()._score_frame_windows(windows())
+        parallel, parallel_windows = JumpCutDetector(workers=2)._score_frame_windows(windows())
+
+        assert len(pools) == 1
+        np.testing.assert_array_equal(parallel, serial)
+        np.testing.assert_array_equal(parallel_windows, serial_windows)
+        assert list(serial["frame_index"]) == [1, 2, 3, 21, 22, 23, 24, 25, 26, 31]
+        assert list(serial_windows) == [0, 0, 0, 2, 2, 2, 2, 2, 2, 3]
+
+    @pytest.mark.parametrize("workers, width, height", [(2, 64, 36), (8, 1920, 1080), (8, 3840, 2160)])
+    def test_pair_buffer_layout(self: "TestJumpCutDetector", workers: int, width: int, height: int) -> None:
+        """Test shared memory sizing for small and full-resolution frames.
+
+        Parameters
+        ----------
+        workers : int
+            Number of worker processes
+        width : int
+            Frame width in pixels
+        height : int
+            Frame height in pixels
+        """
+        frame_nbytes: int = width * height * 3
+
+        regions, batch_size = jump_cut_detector._pair_buffer_layout(workers, frame_nbytes)
+
+        assert 2 <= regions <= 2 * workers and batch_size >= 1
+        assert regions * (batch_size + 1) * frame_nbytes <= jump_cut_detector._PAIR_BUFFER_BYTES
+        if width == 64:
+            assert (regions, batch_size) == (2 * workers, jump_cut_detector._PAIR_BATCH_SIZE)
+
+    @pytest.mark.parametrize("window", [2, 3, 5, 8])
+    def test_smoothing_truncates_windows(self: "TestJumpCutDetector", window: int) -> None:
+        """Test the vectorized median against a per-score reference.
+
+        Parameters
+        ----------
+        window : int
+            Smoothing window of the detector
+        """
+        scores: np.ndarray = np.random.default_rng(window).random(12).astype(np.float32)
+        half: int = window // 2
+        expected: List[float] = [
+            np.median(scores[max(0, i - half):i + half + 1]) for i in range(len(scores))
+        ]
+
+        smoothed: np.ndarray = JumpCutDetector(smoothing_window=window)._smooth_scores(scores)
+
+        np.testing.assert_allclose(smoothed, expected)
+
+    def test_ssim_from_cached_moments(self: "TestJumpCutDetector") -> None:
+        """Test single and batched SSIM against skimage's structural_similarity."""
+        rng: np.random.Generator = np.random.default_rng(1)
+        base: np.ndarray = rng.integers(0, 256, (36, 48), dtype=np.uint8)
+        noise: np.ndarray = rng.integers(-40, 40, (4, 36, 48))
+        grays: np.ndarray = np.clip(base + noise, 0, 255).astype(np.uint8)
+        expected: List[float] = [
+            structural_similarity(grays[j], grays[j + 1]) for j in range(len(grays) - 1)
+        ]
+
+        detector: JumpCutDetector = JumpCutDetector()
+        frames: np.ndarray = np.repeat(grays[..., None], 3, axis=3)
+        single: List[float] = [
+            detector._compare_analysis_frames(
+                detector._prepare_analysis_frame(frames[j]), detector._prepare_analysis_frame(frames[j + 1])
+            )[0]
+            for j in range(len(frames) - 1)
+        ]
+        means, variances = jump_cut_detector._ssim_moments(grays)
+        batched: np.ndarray = jump_cut_detector._ssim_from_moments(
+            grays[:-1], (means[:-1], variances[:-1]), grays[1:], (means[1:], variances[1:])
+        )
+
+        np.testing.assert_allclose(single, expected, rtol=1e-10)
+        np.testing.assert_allclose(batched, expected, rtol=1e-10)
+
+    @requires_ffmpeg
+    def test_detects_hard_cut(self: "TestJumpCutDetector", tmp_path: Path) -> None:
+        """Test detection of a synthesized hard cut.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        """
+        video_path: Path = tmp_path / "cut.mp4"
+        _synthesize_cut_video(video_path)
+
+        detector: JumpCutDetector = JumpCutDetector(
+            frame_sample_rate=5.0, skip_start_percent=0.0, skip_end_percent=0.0, smoothing_window=1
+        )
+        jump_cuts: List[JumpCut] = detector.detect_jump_cuts(
+            video_path, output_dir=tmp_path / "frames", metadata_file=tmp_path / "cuts.json"
+        )
+
+        assert len(jump_cuts) == 1
+        assert jump_cuts[0].timestamp == pytest.approx(2.0, abs=0.2)
+        assert (tmp_path / "cuts.json").exists()
+        assert Path(jump_cuts[0].frame_before_path).exists()
+        assert Path(jump_cuts[0].frame_after_path).exists()
+
+    @requires_ffmpeg
+    def test_analysis_proxy_resolution(
+        self: "TestJumpCutDetector", tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that scoring uses the analysis proxy and saving uses the source.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        monkeypatch : pytest.MonkeyPatch
+            Fixture used to record the shapes of scored frames
+        """
+        video_path: Path = tmp_path / "cut.mp4"
+        _synthesize_cut_video(video_path, cut_time=1.0, duration=2.0, size="640x360")
+
+        detector: JumpCutDetector = JumpCutDetector(
+            frame_sample_rate=5.0, smoothing_window=1, analysis_width=160, thumbnail_width=32
+        )
+        scored_shapes: List[tuple] = []
+        prepare = detector._prepare_analysis_frame
+
+        def record_prepare(frame: np.ndarray):
+            scored_shapes.append(frame.shape)
+            analysis = prepare(frame)
+            assert analysis[1].shape == (18, 32, 3)
+            return analysis
+
+        monkeypatch.setattr(detector, "_prepare_analysis_frame", record_prepare)
+        jump_cuts: List[JumpCut] = detector.detect_jump_cuts(video_path, output_dir=tmp_path / "frames")
+
+        assert set(scored_shapes) == {(90, 160, 3)}
+        assert len(jump_cuts) == 1
+        assert jump_cuts[0].timestamp == pytest.approx(1.0, abs=0.2)
+        with Image.open(jump_cuts[0].frame_after_path) as saved:
+            assert saved.size == (640, 360)
+
+        # Without opting in, frames are scored at the source resolution
+        default: JumpCutDetector = JumpCutDetector(frame_sample_rate=5.0, smoothing_window=1)
+        default_shapes: List[tuple] = []
+        default_prepare = default._prepare_analysis_frame
+
+        def record_default(frame: np.ndarray):
+            default_shapes.append(frame.shape)
+            analysis = default_prepare(frame)
+            assert analysis[1].shape == frame.shape
+            return analysis
+
+        monkeypatch.setattr(default, "_prepare_analysis_frame", record_default)
+        default.detect_jump_cuts(video_path, output_dir=tmp_path / "default")
+
+        assert set(default_shapes) == {(360, 640, 3)}
+
+    @requires_ffmpeg
+    def test_ffmpeg_reader_matches_moviepy(self: "TestJumpCutDetector", tmp_path: Path) -> None:
+        """Test that both frame readers produce the same jump cuts.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        """
+        video_path: Path = tmp_path / "cut.mp4"
+        _synthesize_cut_video(video_path, cut_time=1.3, duration=3.0, size="640x360")
+
+        results: List[List[JumpCut]] = [
+            JumpCutDetector(
+                frame_sample_rate=4.0, skip_start_percent=0.1, smoothing_window=1,
+                analysis_width=160, use_ffmpeg_reader=reader
+            ).detect_jump_cuts(video_path, output_dir=tmp_path / str(reader))
+            for reader in (False, True)
+        ]
+
+        assert len(results[0]) == 1
+        assert [(c.frame_index, c.timestamp) for c in results[1]] == \
+            [(c.frame_index, c.timestamp) for c in results[0]]
+        assert results[1][0].total_score == pytest.approx(results[0][0].total_score, abs=0.02)
+
+    @requires_ffmpeg
+    def test_scene_prefilter_limits_analysis(
+        self: "TestJumpCutDetector", tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that only frames around scene change candidates are scored.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        monkeypatch : pytest.MonkeyPatch
+            Fixture used to count analyzed frames
+        """
+        video_path: Path = tmp_path / "cut.mp4"
+        _synthesize_cut_video(video_path, cut_time=6.0, duration=10.0)
+
+        analyzed: List[int] = []
+        results: List[List[JumpCut]] = []
+        for prefilter in (False, True):
+            detector: JumpCutDetector = JumpCutDetector(
+                frame_sample_rate=5.0, smoothing_window=1, save_frames=False,
+                scene_prefilter=prefilter, scene_window=0.5
+            )
+            prepare = detector._prepare_analysis_frame
+            count: List[int] = [0]
+
+            def counting_prepare(frame: np.ndarray, prepare=prepare, count=count):
+                count[0] += 1
+                return prepare(frame)
+
+            monkeypatch.setattr(detector, "_prepare_analysis_frame", counting_prepare)
+            results.append(detector.detect_jump_cuts(video_path, output_dir=tmp_path))
+            analyzed.append(count[0])
+
+        assert analyzed[0] == 50
+        assert analyzed[1] <= 6
+        assert len(results[1]) == 1
+        assert (results[1][0].frame_index, results[1][0].timestamp) == \
+            (results[0][0].frame_index, results[0][0].timestamp)
+        assert results[1][0].total_score == pytest.approx(results[0][0].total_score)
+
+    @requires_ffmpeg
+    def test_scene_prefilter_single_decoder(
+        self: "TestJumpCutDetector", tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that separate candidate windows are read through one FFmpeg process.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        monkeypatch : pytest.MonkeyPatch
+            Fixture used to count frame sources
+        """
+        video_path: Path = tmp_path / "cuts.mp4"
+        graph: str = (
+            "color=c=red:s=160x120:r=25:d=3[a];color=c=white:s=160x120:r=25:d=3[b];"
+            "color=c=blue:s=160x120:r=25:d=3[c];[a][b][c]concat=n=3:v=1:a=0[out0]"
+        )
+        subprocess.run(
+            ["ffmpeg", "-v", "error", "-y", "-f", "lavfi", "-i", graph,
+             "-c:v", "libx264", "-pix_fmt", "yuv420p", str(video_path)],
+            check=True
+        )
+
+        sources: List[int] = []
+
+        class CountingSource(jump_cut_detector.FFmpegFrameSource):
+            def __init__(self, *args, **kwargs) -> None:
+                sources.append(1)
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr(jump_cut_detector, "FFmpegFrameSource", CountingSource)
+
+        results: List[List[JumpCut]] = [
+            JumpCutDetector(
+                frame_sample_rate=5.0, smoothing_window=1, save_frames=False, scene_prefilter=True,
+                scene_window=0.5, use_ffmpeg_reader=reader
+            ).detect_jump_cuts(video_path, output_dir=tmp_path)
+            for reader in (False, True)
+        ]
+
+        assert len(sources) == 1
+        assert len(results[0]) == 2
+        assert [(c.frame_index, c.timestamp) for c in results[1]] == \
+            [(c.frame_index, c.timestamp) for c in results[0]]
+
+    @requires_ffmpeg
+    def test_ffmpeg_smoothing_backend(self: "TestJumpCutDetector", tmp_path: Path) -> None:
+        """Test that xfade transitions overlap the segments around each cut.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        """
+        video_path: Path = tmp_path / "cuts.mp4"
+        subprocess.run(
+            ["ffmpeg", "-v", "error", "-y", "-f", "lavfi", "-i", "testsrc=s=160x120:r=25:d=6",
+             "-f", "lavfi", "-i", "sine=frequency=440:duration=6",
+             "-c:v", "libx264", "-pix_fmt", "yuv420p", "-c:a", "aac", "-shortest", str(video_path)],
+            check=True
+        )
+        metrics: dict = {"similarity_score": 0.0, "difference_score": 1.0, "motion_score": 0.0,
+                         "color_change_score": 1.0, "total_score": 1.0}
+        jump_cuts: List[JumpCut] = [
+            JumpCut(frame_index=0, timestamp=timestamp, confidence=1.0,
+                    suggested_transition=transition, transition_duration=0.5, **metrics)
+            for timestamp, transition in [
+                (2.0, TransitionType.FADE_BLACK), (3.0, TransitionType.NONE), (4.0, TransitionType.WIPE_LEFT)
+            ]
+        ]
+        output_path: Path = tmp_path / "smoothed.mp4"
+
+        JumpCutDetector().smooth_jump_cuts(
+            video_path, jump_cuts, output_path, backend="ffmpeg", threads=1
+        )
+
+        infos: dict = ffmpeg_parse_infos(str(output_path))
+        assert infos["duration"] == pytest.approx(5.0, abs=0.1)
+        assert infos["audio_found"]
+
+        with pytest.raises(ValueError):
+            JumpCutDetector().smooth_jump_cuts(video_path, jump_cuts, output_path, backend="gstreamer")
+
+    @requires_ffmpeg
+    def test_rescores_cached_metrics(
+        self: "TestJumpCutDetector", tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that changed scoring settings reuse the cached frame metrics.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        monkeypatch : pytest.MonkeyPatch
+            Fixture used to make frame analysis fail after the first run
+        """
+        video_path: Path = tmp_path / "cut.mp4"
+        _synthesize_cut_video(video_path, cut_time=6.0, duration=10.0)
+        cache: NpzCache = NpzCache("jump_cut_metrics", tmp_path / "cache")
+        settings: dict = {"frame_sample_rate": 5.0, "save_frames": False,
+                          "scene_prefilter": True, "scene_window": 0.5}
+        rescored: dict = {"sensitivity": 0.9, "motion_weight": 0.2, "smoothing_window": 1}
+
+        JumpCutDetector(cache=cache, **settings).detect_jump_cuts(video_path, output_dir=tmp_path)
+        expected: List[JumpCut] = JumpCutDetector(**settings, **rescored).detect_jump_cuts(
+            video_path, output_dir=tmp_path
+        )
+
+        def fail_analysis(*args, **kwargs):
+            raise AssertionError("frames were analyzed despite cached metrics")
+
+        monkeypatch.setattr(JumpCutDetector, "_analyze_frame_metrics", fail_analysis)
+        actual: List[JumpCut] = JumpCutDetector(cache=cache, **settings, **rescored).detect_jump_cuts(
+            video_path, output_dir=tmp_path
+        )
+
+        assert len(expected) == 1
+        assert [(c.frame_index, c.timestamp, c.total_score) for c in actual] == \
+            [(c.frame_index, c.timestamp, c.total_score) for c in expected]
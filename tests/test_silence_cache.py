@@ -0,0 +1,237 @@
+import os
+import numpy as np
+import pytest
+import soundfile
+
+from pathlib import Path
+from typing import Dict, List
+from asabaal_utils.video_processing import silence_detector
+from asabaal_utils.video_processing.npz_cache import NpzCache, default_cache_dir, fingerprint_file
+from asabaal_utils.video_processing.silence_detector import (
+    AudioSegment, SilenceDetector, _detect_silence_ffmpeg
+)
+
+
+def _write_signal(path: Path, sr: int) -> None:
+    """Write a short tone/silence test signal to a WAV file.
+
+    Parameters
+    ----------
+    path : Path
+        Destination of the WAV file
+    sr : int
+        Sample rate of the generated signal
+    """
+    t: np.ndarray = np.arange(sr) / sr
+    tone: np.ndarray = 0.3 * np.sin(2 * np.pi * 220 * t)
+    signal: np.ndarray = np.concatenate([tone, np.zeros(sr), tone[:sr // 2], np.zeros(sr // 3), tone])
+    soundfile.write(path, signal.astype(np.float32), sr, subtype="FLOAT")
+
+
+class TestNpzCache:
+    """Test suite for the persistent npz cache of silence maps and frame metrics.
+
+    Methods
+    -------
+    test_fingerprint_tracks_content
+        Check that the fingerprint changes with the file contents
+    test_namespace_directories
+        Check that every namespace gets its own directory under the shared root
+    test_keys_depend_on_parameters
+        Check that analysis parameters are part of the cache key
+    test_store_and_load
+        Check that stored arrays are loaded back unchanged
+    test_lru_eviction
+        Check that the least recently used entries are evicted first
+    test_detector_replans_from_envelope
+        Check that changed planning parameters reuse the cached envelope
+    test_refined_envelope_replay
+        Check that refined boundaries survive a cache round trip
+    test_ffmpeg_detection_uses_cache
+        Check that cached silencedetect results skip FFmpeg
+    """
+
+    sr: int = 16000
+
+    def test_fingerprint_tracks_content(self: "TestNpzCache", tmp_path: Path) -> None:
+        """Test that rewriting a file changes its fingerprint.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        """
+        path: Path = tmp_path / "media.bin"
+        path.write_bytes(b"a" * 3000)
+        first: str = fingerprint_file(path)
+        assert fingerprint_file(path) == first
+
+        path.write_bytes(b"a" * 1500 + b"b" + b"a" * 1499)
+        os.utime(path, ns=(0, 0))
+        assert fingerprint_file(path) != first
+
+    def test_namespace_directories(
+        self: "TestNpzCache", tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the default directories with and without ASABAAL_CACHE_DIR.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        monkeypatch : pytest.MonkeyPatch
+            Fixture used to set the cache root
+        """
+        monkeypatch.delenv("ASABAAL_CACHE_DIR", raising=False)
+        assert default_cache_dir("silence_maps") == Path.home() / ".cache" / "asabaal_utils" / "silence_maps"
+
+        monkeypatch.setenv("ASABAAL_CACHE_DIR", str(tmp_path))
+        assert NpzCache("silence_maps").cache_dir == tmp_path / "silence_maps"
+        assert NpzCache("jump_cut_metrics").cache_dir == tmp_path / "jump_cut_metrics"
+        assert NpzCache("jump_cut_metrics", tmp_path / "other").cache_dir == tmp_path / "other"
+
+    def test_keys_depend_on_parameters(self: "TestNpzCache", tmp_path: Path) -> None:
+        """Test that different parameters produce different keys.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        """
+        path: Path = tmp_path / "media.bin"
+        path.write_bytes(b"data")
+        cache: NpzCache = NpzCache("silence_maps", tmp_path / "cache")
+
+        key: str = cache.make_key(path, "chunk_envelope", threshold_db=-40.0, chunk_size=0.05)
+        assert key == cache.make_key(path, "chunk_envelope", chunk_size=0.05, threshold_db=-40.0)
+        assert key != cache.make_key(path, "chunk_envelope", threshold_db=-35.0, chunk_size=0.05)
+        assert key != cache.make_key(path, "silencedetect", threshold_db=-40.0, chunk_size=0.05)
+
+    def test_store_and_load(self: "TestNpzCache", tmp_path: Path) -> None:
+        """Test a round trip through the cache.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        """
+        cache: NpzCache = NpzCache("silence_maps", tmp_path)
+        assert cache.load("missing") is None
+
+        cache.store("entry", rms=np.arange(5, dtype=np.float32), sr=np.int64(16000))
+        loaded: Dict[str, np.ndarray] = cache.load("entry")
+
+        np.testing.assert_array_equal(loaded["rms"], np.arange(5, dtype=np.float32))
+        assert int(loaded["sr"]) == 16000
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_lru_eviction(self: "TestNpzCache", tmp_path: Path) -> None:
+        """Test that reading an entry protects it from eviction.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        """
+        cache: NpzCache = NpzCache("silence_maps", tmp_path)
+        payload: np.ndarray = np.random.default_rng(0).random(2000)
+
+        for age, name in enumerate(["old", "used", "new"]):
+            cache.store(name, data=payload)
+            os.utime(tmp_path / f"{name}.npz", ns=(age * 10 ** 9, age * 10 ** 9))
+
+        entry_size: int = (tmp_path / "old.npz").stat().st_size
+        cache.load("used")
+        cache.max_size_bytes = 2 * entry_size
+        cache.evict()
+
+        assert sorted(path.stem for path in tmp_path.glob("*.npz")) == ["new", "used"]
+
+    def test_detector_replans_from_envelope(
+        self: "TestNpzCache", tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a cache hit gives the same segments without decoding.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        monkeypatch : pytest.MonkeyPatch
+            Fixture used to make decoding fail after the first run
+        """
+        audio_path: Path = tmp_path / "speech.wav"
+        _write_signal(audio_path, self.sr)
+        cache: NpzCache = NpzCache("silence_maps", tmp_path / "cache")
+
+        SilenceDetector(cache=cache).detect_silence_segments(audio_path)
+        expected: List[AudioSegment] = SilenceDetector(
+            min_sound_duration=0.6, padding=0.3
+        ).detect_silence_segments(audio_path)
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("audio was decoded despite a cached envelope")
+
+        monkeypatch.setattr(silence_detector.librosa, "load", fail_load)
+        actual: List[AudioSegment] = SilenceDetector(
+            min_sound_duration=0.6, padding=0.3, cache=cache
+        ).detect_silence_segments(audio_path)
+
+        assert [(s.start, s.end, s.is_silence) for s in actual] == \
+            [(s.start, s.end, s.is_silence) for s in expected]
+        np.testing.assert_allclose([s.rms_power for s in actual], [s.rms_power for s in expected], rtol=1e-6)
+
+    def test_refined_envelope_replay(self: "TestNpzCache", tmp_path: Path) -> None:
+        """Test that replaying a refined envelope reproduces refined boundaries.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        """
+        audio_path: Path = tmp_path / "speech.wav"
+        _write_signal(audio_path, self.sr)
+        cache: NpzCache = NpzCache("silence_maps", tmp_path / "cache")
+        detector: SilenceDetector = SilenceDetector(chunk_size=0.3, refine_boundaries=True, cache=cache)
+
+        expected: List[AudioSegment] = detector.detect_silence_segments(audio_path)
+        actual: List[AudioSegment] = detector.detect_silence_segments(audio_path)
+
+        assert [(s.start, s.end) for s in actual] == [(s.start, s.end) for s in expected]
+        assert expected[1].start == pytest.approx(1.0, abs=0.002)
+
+    def test_ffmpeg_detection_uses_cache(
+        self: "TestNpzCache", tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a cached silence map is returned without running FFmpeg.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        monkeypatch : pytest.MonkeyPatch
+            Fixture used to make subprocess calls fail
+        """
+        media_path: Path = tmp_path / "video.mp4"
+        media_path.write_bytes(b"not really a video")
+        cache: NpzCache = NpzCache("silence_maps", tmp_path / "cache")
+        key: str = cache.make_key(
+            str(media_path), "silencedetect", threshold_db=-40.0, min_silence_duration=0.5
+        )
+        cache.store(
+            key,
+            original_duration=np.float64(12.5),
+            stream_types=np.array(["audio", "video"]),
+            silent_segments=np.array([[1.0, 2.5], [7.0, 9.0]]),
+        )
+
+        def fail_run(*args, **kwargs):
+            raise AssertionError("FFmpeg was run despite a cached silence map")
+
+        monkeypatch.setattr(silence_detector.subprocess, "run", fail_run)
+        duration, stream_types, silent_segments = _detect_silence_ffmpeg(
+            str(media_path), -40.0, 0.5, cache
+        )
+
+        assert duration == 12.5
+        assert stream_types == {"audio", "video"}
+        assert silent_segments == [(1.0, 2.5), (7.0, 9.0)]
@@ -0,0 +1,732 @@
+import io
+import librosa
+import numpy as np
+import pytest
+import shutil
+import soundfile
+import threading
+import time
+
+from pathlib import Path
+from typing import List
+from asabaal_utils.video_processing.silence_detector import (
+    AudioSegment, ChunkAnalyzer, SegmentFinalizer, SilenceDetector, _chunk_flatness, _iter_audio_blocks
+)
+
+requires_ffmpeg = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg is not installed")
+requires_ffprobe = pytest.mark.skipif(shutil.which("ffprobe") is None, reason="ffprobe is not installed")
+
+
+def _synthesize_speech_like(sr: int, layout: List[tuple], seed: int = 0) -> np.ndarray:
+    """Build a mono test signal from (duration, kind) pairs.
+
+    Parameters
+    ----------
+    sr : int
+        Sample rate of the generated signal
+    layout : List[tuple]
+        Sequence of (duration_seconds, kind) pairs where kind is one of
+        "tone", "noise" or "silence"
+    seed : int
+        Seed for the random noise generator
+
+    Returns
+    -------
+    np.ndarray
+        Generated float32 signal
+    """
+    rng: np.random.Generator = np.random.default_rng(seed)
+    parts: List[np.ndarray] = []
+    for duration, kind in layout:
+        n: int = int(duration * sr)
+        t: np.ndarray = np.arange(n) / sr
+        if kind == "tone":
+            parts.append(0.3 * np.sin(2 * np.pi * 220 * t))
+        elif kind == "noise":
+            parts.append(0.002 * rng.standard_normal(n))
+        else:
+            parts.append(np.zeros(n))
+    return np.concatenate(parts).astype(np.float32)
+
+
+def _assert_segments_match(expected: List[AudioSegment], actual: List[AudioSegment]) -> None:
+    """Assert that two segment lists describe the same silence layout.
+
+    Parameters
+    ----------
+    expected : List[AudioSegment]
+        Segments from the reference implementation
+    actual : List[AudioSegment]
+        Segments from the implementation under test
+    """
+    assert len(actual) == len(expected)
+    for ref, seg in zip(expected, actual):
+        assert seg.is_silence == ref.is_silence
+        assert seg.start == pytest.approx(ref.start)
+        assert seg.end == pytest.approx(ref.end)
+        assert seg.rms_power == pytest.approx(ref.rms_power, rel=1e-4, abs=1e-7)
+
+
+class TestSilenceDetector:
+    """Test suite for the SilenceDetector chunk analysis engines.
+
+    The vectorized engine must reproduce the reference chunk loop exactly,
+    so every test runs both engines over the same synthetic signal. Only the
+    spectral flatness gating of aggressive mode is framed differently, and is
+    checked against the reference loop's per-chunk analysis separately.
+
+    Methods
+    -------
+    test_vectorized_matches_loop
+        Compare raw and merged segments from both engines
+    test_vectorized_matches_loop_aggressive
+        Compare both engines with spectral flatness gating enabled
+    test_chunk_flatness_matches_reference
+        Compare batched chunk flatness decisions with per-chunk librosa analysis
+    test_leading_silence
+        Check the zero-length sound segment emitted for leading silence
+    test_empty_signal
+        Check handling of a signal without samples
+    test_block_feeding_matches_single_pass
+        Check that feeding arbitrary blocks gives the same raw segments
+    test_ffmpeg_blocks_match_librosa
+        Check the FFmpeg pipe decoder against librosa.load
+    test_streaming_detection_matches_in_memory
+        Check end-to-end streaming detection against in-memory detection
+    test_incremental_finalization_matches_batch
+        Check that early finalization yields the same merged segments
+    test_follow_growing_file
+        Check tail-following detection on a file that is still being written
+    test_refined_boundaries_are_sample_accurate
+        Check that refinement recovers boundaries between chunk steps
+    test_refined_block_feeding_matches_single_pass
+        Check that refinement is unaffected by block boundaries
+    """
+
+    sr: int = 16000
+    layout: List[tuple] = [
+        (1.23, "tone"), (0.8, "silence"), (0.17, "tone"), (1.1, "noise"),
+        (0.05, "silence"), (2.0, "tone"), (0.61, "silence"), (0.4, "tone"),
+    ]
+
+    @pytest.mark.parametrize("chunk_size", [0.05, 0.033, 0.1])
+    def test_vectorized_matches_loop(self: "TestSilenceDetector", chunk_size: float) -> None:
+        """Test that the vectorized engine matches the chunk loop.
+
+        Parameters
+        ----------
+        chunk_size : float
+            Chunk size in seconds; odd sizes leave a partial final chunk
+        """
+        y: np.ndarray = _synthesize_speech_like(self.sr, self.layout)
+        detector: SilenceDetector = SilenceDetector(chunk_size=chunk_size)
+
+        expected: List[AudioSegment] = detector._detect_segments_loop(y, self.sr)
+        actual: List[AudioSegment] = detector._detect_segments_vectorized(y, self.sr)
+        _assert_segments_match(expected, actual)
+
+        _assert_segments_match(
+            detector._finalize_segments(expected),
+            detector._finalize_segments(actual),
+        )
+
+    def test_vectorized_matches_loop_aggressive(self: "TestSilenceDetector") -> None:
+        """Test that both engines agree when aggressive rejection is enabled."""
+        y: np.ndarray = _synthesize_speech_like(self.sr, self.layout)
+        detector: SilenceDetector = SilenceDetector(
+            threshold_db=-30.0, aggressive_silence_rejection=True
+        )
+
+        _assert_segments_match(
+            detector._detect_segments_loop(y, self.sr),
+            detector._detect_segments_vectorized(y, self.sr),
+        )
+
+    @pytest.mark.parametrize("sr", [16000, 48000])
+    def test_chunk_flatness_matches_reference(self: "TestSilenceDetector", sr: int) -> None:
+        """Test that batched flatness makes the reference loop's decisions.
+
+        The last chunk ends in a tone that only the final samples of the
+        chunk contain, so it must be judged not flat.
+
+        Parameters
+        ----------
+        sr : int
+            Sample rate; 50 ms chunks are longer than 2048 samples at 48 kHz
+        """
+        chunk_samples: int = int(0.05 * sr)
+        y: np.ndarray = 0.002 * np.random.default_rng(0).standard_normal(200 * chunk_samples)
+        y[-400:] += 0.01 * np.sin(2 * np.pi * 1000 * np.arange(400) / sr)
+        y = y.astype(np.float32)
+
+        flat: np.ndarray = _chunk_flatness(y, chunk_samples) > 0.5
+        expected: np.ndarray = np.array([
+            np.mean(librosa.feature.spectral_flatness(y=chunk)) > 0.5
+            for chunk in y.reshape(-1, chunk_samples)
+        ])
+
+        assert not flat[-1] and not expected[-1]
+        assert np.mean(flat == expected) >= 0.99
+
+    def test_leading_silence(self: "TestSilenceDetector") -> None:
+        """Test that leading silence produces the same empty first segment."""
+        y: np.ndarray = _synthesize_speech_like(self.sr, [(0.7, "silence"), (1.0, "tone")])
+        detector: SilenceDetector = SilenceDetector()
+
+        segments: List[AudioSegment] = detector._detect_segments_vectorized(y, self.sr)
+        _assert_segments_match(detector._detect_segments_loop(y, self.sr), segments)
+        assert segments[0].duration == 0
+        assert not segments[0].is_silence
+
+    def test_empty_signal(self: "TestSilenceDetector") -> None:
+        """Test that an empty signal yields a single empty sound segment."""
+        detector: SilenceDetector = SilenceDetector()
+        y: np.ndarray = np.zeros(0, dtype=np.float32)
+
+        _assert_segments_match(
+            detector._detect_segments_loop(y, self.sr),
+            detector._detect_segments_vectorized(y, self.sr),
+        )
+
+    @pytest.mark.parametrize("block_samples", [1, 777, 16000, 10 ** 6])
+    def test_block_feeding_matches_single_pass(self: "TestSilenceDetector", block_samples: int) -> None:
+        """Test that block-wise feeding does not change the raw segments.
+
+        Parameters
+        ----------
+        block_samples : int
+            Number of samples fed per block, including sizes that split chunks
+        """
+        y: np.ndarray = _synthesize_speech_like(self.sr, self.layout)
+        detector: SilenceDetector = SilenceDetector(chunk_size=0.033)
+
+        analyzer: ChunkAnalyzer = ChunkAnalyzer(detector, self.sr)
+        if block_samples == 1:
+            # Feeding single samples is slow, so only cover the first second
+            y = y[:self.sr]
+        for start in range(0, len(y), block_samples):
+            analyzer.feed(y[start:start + block_samples])
+
+        _assert_segments_match(detector._detect_segments_vectorized(y, self.sr), analyzer.finish())
+
+    @requires_ffmpeg
+    def test_ffmpeg_blocks_match_librosa(self: "TestSilenceDetector", tmp_path: Path) -> None:
+        """Test that the FFmpeg pipe decodes the same mono signal as librosa.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        """
+        left: np.ndarray = _synthesize_speech_like(self.sr, self.layout, seed=1)
+        right: np.ndarray = _synthesize_speech_like(self.sr, self.layout[::-1], seed=2)
+        audio_path: Path = tmp_path / "stereo.wav"
+        soundfile.write(audio_path, np.stack([left, right], axis=1), self.sr, subtype="FLOAT")
+
+        expected, _ = librosa.load(audio_path, sr=None)
+        blocks: List[np.ndarray] = list(_iter_audio_blocks(str(audio_path), self.sr, 2, 5000))
+
+        assert all(len(block) == 5000 for block in blocks[:-1])
+        np.testing.assert_allclose(np.concatenate(blocks), expected, atol=1e-6)
+
+    @requires_ffmpeg
+    @requires_ffprobe
+    def test_streaming_detection_matches_in_memory(self: "TestSilenceDetector", tmp_path: Path) -> None:
+        """Test that streaming detection finds the same merged segments.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        """
+        audio_path: Path = tmp_path / "mono.wav"
+        soundfile.write(audio_path, _synthesize_speech_like(self.sr, self.layout), self.sr, subtype="FLOAT")
+
+        expected: List[AudioSegment] = SilenceDetector().detect_silence_segments(audio_path)
+        actual: List[AudioSegment] = SilenceDetector(
+            streaming=True, block_duration=0.5
+        ).detect_silence_segments(audio_path)
+
+        _assert_segments_match(expected, actual)
+
+
+    @pytest.mark.parametrize("block_samples", [800, 5000])
+    def test_incremental_finalization_matches_batch(self: "TestSilenceDetector", block_samples: int) -> None:
+        """Test that segments finalized while feeding match batch finalization.
+
+        Parameters
+        ----------
+        block_samples : int
+            Number of samples fed per block
+        """
+        y: np.ndarray = _synthesize_speech_like(self.sr, self.layout)
+        detector: SilenceDetector = SilenceDetector(min_silence_duration=0.3)
+        expected: List[AudioSegment] = detector._finalize_segments(
+            detector._detect_segments_vectorized(y, self.sr)
+        )
+
+        analyzer: ChunkAnalyzer = ChunkAnalyzer(detector, self.sr)
+        finalizer: SegmentFinalizer = SegmentFinalizer(detector)
+        actual: List[AudioSegment] = []
+        finalized_at: List[float] = []
+        for start in range(0, len(y), block_samples):
+            actual += finalizer.push(analyzer.feed(y[start:start + block_samples]))
+            actual += finalizer.settle(*analyzer.open_segment())
+            finalized_at += [(start + block_samples) / self.sr] * (len(actual) - len(finalized_at))
+        closed_count: int = len(analyzer.segments)
+        actual += finalizer.push(analyzer.finish()[closed_count:]) + finalizer.flush()
+
+        _assert_segments_match(expected, actual)
+        # Segments are emitted well before the end of the recording
+        assert finalized_at and finalized_at[0] < len(y) / self.sr / 2
+
+    @requires_ffmpeg
+    @requires_ffprobe
+    def test_follow_growing_file(self: "TestSilenceDetector", tmp_path: Path) -> None:
+        """Test that following a growing file finds the same segments.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        """
+        buffer: io.BytesIO = io.BytesIO()
+        soundfile.write(buffer, _synthesize_speech_like(self.sr, self.layout), self.sr,
+                        format="WAV", subtype="FLOAT")
+        data: bytes = buffer.getvalue()
+        audio_path: Path = tmp_path / "live.wav"
+        audio_path.write_bytes(data[:len(data) // 4])
+
+        def record() -> None:
+            with open(audio_path, "ab") as f:
+                for start in range(len(data) // 4, len(data), len(data) // 8):
+                    time.sleep(0.2)
+                    f.write(data[start:start + len(data) // 8])
+                    f.flush()
+
+        recorder: threading.Thread = threading.Thread(target=record)
+        recorder.start()
+        actual: List[AudioSegment] = list(SilenceDetector().follow_silence_segments(
+            audio_path, idle_timeout=1.0, block_duration=0.25
+        ))
+        recorder.join()
+
+        _assert_segments_match(SilenceDetector().detect_silence_segments(audio_path), actual)
+
+    @pytest.mark.parametrize("resolution", [1 / 16000, 0.001])
+    def test_refined_boundaries_are_sample_accurate(self: "TestSilenceDetector", resolution: float) -> None:
+        """Test that refined boundaries land within one refinement window.
+
+        Parameters
+        ----------
+        resolution : float
+            Refinement window in seconds
+        """
+        y: np.ndarray = _synthesize_speech_like(self.sr, self.layout)
+        truth: np.ndarray = np.cumsum([int(d * self.sr) for d, _ in self.layout]) / self.sr
+
+        def max_error(segments: List[AudioSegment]) -> float:
+            return max(np.min(np.abs(truth - s.end)) for s in segments[:-1])
+
+        coarse: List[AudioSegment] = SilenceDetector(chunk_size=0.1)._detect_segments_vectorized(y, self.sr)
+        refined: List[AudioSegment] = SilenceDetector(
+            chunk_size=0.1, refine_boundaries=True, refine_resolution=resolution
+        )._detect_segments_vectorized(y, self.sr)
+
+        assert [s.is_silence for s in refined] == [s.is_silence for s in coarse]
+        assert max_error(coarse) > 0.01
+        # The tone starts at phase zero, so allow a few samples to reach the threshold
+        assert max_error(refined) <= resolution + 3 / self.sr
+
+    def test_refined_block_feeding_matches_single_pass(self: "TestSilenceDetector") -> None:
+        """Test that refinement across block boundaries matches a single pass."""
+        y: np.ndarray = _synthesize_speech_like(self.sr, self.layout)
+        detector: SilenceDetector = SilenceDetector(chunk_size=0.1, refine_boundaries=True)
+
+        analyzer: ChunkAnalyzer = ChunkAnalyzer(detector, self.sr)
+        for start in range(0, len(y), 1600):
+            analyzer.feed(y[start:start + 1600])
+
+        _assert_segments_match(detector._detect_segments_vectorized(y, self.sr), analyzer.finish())
+
+
+class TestFFmpegRendering:
+    """Test suite for the single-pass FFmpeg silence removal renderers.
+
+    Methods
+    -------
+    test_trim_concat_graph
+        Check the structure of the generated filter graph
+    test_trim_concat_graph_audio_only
+        Check that video branches are omitted for audio-only inputs
+    test_snap_segments_to_keyframes
+        Check keyframe snapping and merging of overlapping segments
+    test_snap_segments_within_padding
+        Check that starts prefer a nearby keyframe over the preceding one
+    test_keyframe_copy_removes_silence
+        Check that stream-copy rendering drops the silences and reports the real duration
+    test_keyframe_copy_audio_only
+        Check that audio-only inputs are cut at the segment times
+    test_render_with_filter_graph
+        Render a synthetic clip in a single FFmpeg invocation
+    """
+
+    def test_trim_concat_graph(self: "TestFFmpegRendering") -> None:
+        """Test that every segment gets a trim and atrim branch feeding concat."""
+        from asabaal_utils.video_processing.silence_detector import _build_trim_concat_graph
+
+        graph: str = _build_trim_concat_graph([(0.5, 1.25), (3.0, 4.0)])
+
+        assert "[0:v]trim=start=0.500000:end=1.250000,setpts=PTS-STARTPTS[v0]" in graph
+        assert "[0:a]atrim=start=3.000000:end=4.000000,asetpts=PTS-STARTPTS[a1]" in graph
+        assert graph.endswith("[v0][a0][v1][a1]concat=n=2:v=1:a=1[outv][outa]")
+
+    def test_trim_concat_graph_audio_only(self: "TestFFmpegRendering") -> None:
+        """Test that audio-only inputs produce an audio-only graph."""
+        from asabaal_utils.video_processing.silence_detector import _build_trim_concat_graph
+
+        graph: str = _build_trim_concat_graph([(0.0, 1.0)], has_video=False)
+
+        assert "[0:v]" not in graph
+        assert graph.endswith("[a0]concat=n=1:v=0:a=1[outa]")
+
+    def test_snap_segments_to_keyframes(self: "TestFFmpegRendering") -> None:
+        """Test that starts move back to keyframes and overlaps are merged."""
+        from asabaal_utils.video_processing.silence_detector import _snap_segments_to_keyframes
+
+        keyframes: List[float] = [0.0, 2.0, 4.0, 6.0]
+        segments: List[tuple] = [(0.3, 1.5), (2.5, 3.1), (3.9, 5.0), (6.0, 7.0)]
+
+        assert _snap_segments_to_keyframes(segments, keyframes) == [
+            (0.0, 1.5), (2.0, 5.0), (6.0, 7.0)
+        ]
+        # Without keyframes (audio-only input) the segments stay as they are
+        assert _snap_segments_to_keyframes([(0, 1), (3, 4), (6, 7)], [], 0.1) == [(0, 1), (3, 4), (6, 7)]
+
+    def test_snap_segments_within_padding(self: "TestFFmpegRendering") -> None:
+        """Test that a keyframe within the padding wins over the preceding keyframe."""
+        from asabaal_utils.video_processing.silence_detector import _snap_segments_to_keyframes
+
+        keyframes: List[float] = [0.0, 2.0, 4.0, 6.0, 8.0, 10.0]
+        segments: List[tuple] = [(0.0, 2.1), (3.9, 7.1), (8.4, 12.0), (10.05, 10.5)]
+
+        assert _snap_segments_to_keyframes(segments, keyframes, padding=0.1) == [
+            (0.0, 2.1), (4.0, 7.1), (8.0, 12.0)
+        ]
+        assert _snap_segments_to_keyframes([(1.95, 3.0)], keyframes, padding=0.1) == [(2.0, 3.0)]
+        assert _snap_segments_to_keyframes([(1.9, 1.95)], keyframes, padding=0.1) == [(0.0, 1.95)]
+
+    @requires_ffmpeg
+    @requires_ffprobe
+    def test_keyframe_copy_removes_silence(self: "TestFFmpegRendering", tmp_path: Path) -> None:
+        """Test keyframe-copy rendering of a clip with a 2 second GOP.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        """
+        import json
+        import subprocess
+        from asabaal_utils.video_processing.silence_detector import _remove_silence_ffmpeg
+
+        input_path: Path = tmp_path / "input.mp4"
+        output_path: Path = tmp_path / "output.mp4"
+        subprocess.run([
+            "ffmpeg", "-v", "error", "-y",
+            "-f", "lavfi", "-i", "testsrc=size=160x120:rate=25:duration=12",
+            "-f", "lavfi", "-i", "sine=frequency=440:duration=12",
+            "-af", "volume=enable='between(t,2,4)+between(t,7,8.5)':volume=0",
+            "-c:v", "libx264", "-g", "50", "-keyint_min", "50", "-sc_threshold", "0",
+            "-c:a", "aac", "-shortest", str(input_path),
+        ], check=True)
+
+        original, output, saved = _remove_silence_ffmpeg(
+            str(input_path), str(output_path), render_mode="keyframe_copy"
+        )
+
+        probed: float = float(json.loads(subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "json", str(output_path)],
+            capture_output=True, text=True, check=True
+        ).stdout)["format"]["duration"])
+        assert output == pytest.approx(probed)
+        assert saved == pytest.approx(original - probed)
+        # The 2-4 s silence is cut at the keyframe at 4 s, the 7-8.5 s silence
+        # falls back to the keyframe at 8 s
+        assert saved > 2.0
+
+    @requires_ffmpeg
+    @requires_ffprobe
+    def test_keyframe_copy_audio_only(self: "TestFFmpegRendering", tmp_path: Path) -> None:
+        """Test that keyframe-copy rendering removes silence from an audio-only file.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        """
+        import subprocess
+        from asabaal_utils.video_processing.silence_detector import _remove_silence_ffmpeg
+
+        input_path: Path = tmp_path / "input.wav"
+        output_path: Path = tmp_path / "output.wav"
+        subprocess.run([
+            "ffmpeg", "-v", "error", "-y",
+            "-f", "lavfi", "-i", "sine=frequency=440:duration=10",
+            "-af", "volume=enable='between(t,2,4)+between(t,6,8)':volume=0",
+            str(input_path),
+        ], check=True)
+
+        original, output, saved = _remove_silence_ffmpeg(
+            str(input_path), str(output_path), render_mode="keyframe_copy"
+        )
+
+        assert original == pytest.approx(10.0, abs=0.05)
+        # Both silences are cut, apart from the padding around them
+        assert saved > 3.0
+        assert output == pytest.approx(original - saved)
+
+    @requires_ffmpeg
+    @requires_ffprobe
+    def test_render_with_filter_graph(self: "TestFFmpegRendering", tmp_path: Path) -> None:
+        """Test that the filter graph renderer keeps exactly the requested time.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        """
+        import subprocess
+        from asabaal_utils.video_processing.silence_detector import _render_with_filter_graph
+
+        input_path: Path = tmp_path / "input.mp4"
+        output_path: Path = tmp_path / "output.mp4"
+        subprocess.run([
+            "ffmpeg", "-v", "error", "-y",
+            "-f", "lavfi", "-i", "testsrc=size=160x120:rate=25:duration=4",
+            "-f", "lavfi", "-i", "sine=frequency=440:duration=4",
+            "-c:v", "libx264", "-c:a", "aac", "-shortest", str(input_path),
+        ], check=True)
+
+        duration: float = _render_with_filter_graph(
+            str(input_path), str(output_path), [(0.5, 1.5), (2.0, 2.6)], str(tmp_path)
+        )
+
+        assert duration == pytest.approx(1.6, abs=0.05)
+        info: str = subprocess.run(
+            ["ffmpeg", "-i", str(output_path)], capture_output=True, text=True
+        ).stderr
+        assert "Duration: 00:00:01.6" in info
+
+
+class TestSegmentWorkerPool:
+    """Test suite for the bounded FFmpeg worker pool used for segment extraction.
+
+    Plain Python subprocesses stand in for FFmpeg so the pool behaviour can be
+    tested without media files.
+
+    Methods
+    -------
+    test_runs_all_commands
+        Check that every command runs when all succeed
+    test_fails_fast
+        Check that a failure cancels queued work and kills running processes
+    """
+
+    def test_runs_all_commands(self: "TestSegmentWorkerPool", tmp_path: Path) -> None:
+        """Test that the pool runs every command.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        """
+        import sys
+        from asabaal_utils.video_processing.silence_detector import _run_ffmpeg_pool
+
+        commands: List[List[str]] = [
+            [sys.executable, "-c", f"open(r'{tmp_path / f'out_{i}'}', 'w').close()"]
+            for i in range(6)
+        ]
+        _run_ffmpeg_pool(commands, max_workers=3)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [f"out_{i}" for i in range(6)]
+
+    def test_fails_fast(self: "TestSegmentWorkerPool") -> None:
+        """Test that the first failure stops the pool without waiting for slow commands."""
+        import subprocess
+        import sys
+        import time
+        from asabaal_utils.video_processing.silence_detector import _run_ffmpeg_pool
+
+        slow: List[str] = [sys.executable, "-c", "import time; time.sleep(30)"]
+        failing: List[str] = [sys.executable, "-c", "import sys; sys.exit(3)"]
+
+        started: float = time.monotonic()
+        with pytest.raises(subprocess.CalledProcessError) as error:
+            _run_ffmpeg_pool([slow, failing] + [slow] * 10, max_workers=2)
+
+        assert error.value.returncode == 3
+        assert time.monotonic() - started < 15
+
+
+class TestBatchRemoval:
+    """Test suite for batch silence removal.
+
+    Methods
+    -------
+    test_collect_from_directory
+        Check that video files in a directory get suffixed outputs
+    test_collect_from_manifest
+        Check text and JSON manifests with optional explicit outputs
+    test_collect_rejects_output_collisions
+        Check that inputs mapping to one output are rejected
+    test_skips_up_to_date_outputs
+        Check skipping, failure reporting and the JSON report
+    test_process_pool_batch
+        Run a real batch across worker processes
+    """
+
+    def test_collect_from_directory(self: "TestBatchRemoval", tmp_path: Path) -> None:
+        """Test that only video files are collected from a directory.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        """
+        from asabaal_utils.video_processing.silence_detector import collect_batch_inputs
+
+        for name in ["b.mov", "a.mp4", "notes.txt"]:
+            (tmp_path / name).write_bytes(b"")
+
+        pairs: List[tuple] = collect_batch_inputs(tmp_path, "/out")
+
+        assert pairs == [
+            (str(tmp_path / "a.mp4"), "/out/a_nosilence.mp4"),
+            (str(tmp_path / "b.mov"), "/out/b_nosilence.mov"),
+        ]
+        assert collect_batch_inputs(str(tmp_path / "*.mp4"), "/out", suffix="") == [
+            (str(tmp_path / "a.mp4"), "/out/a.mp4")
+        ]
+
+    def test_collect_from_manifest(self: "TestBatchRemoval", tmp_path: Path) -> None:
+        """Test that manifest paths resolve relative to the manifest.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        """
+        import json
+        from asabaal_utils.video_processing.silence_detector import collect_batch_inputs
+
+        text_manifest: Path = tmp_path / "files.txt"
+        text_manifest.write_text("# talks\nday1.mp4\n\nday2.mp4\tdone/day2.mp4\n")
+        json_manifest: Path = tmp_path / "files.json"
+        json_manifest.write_text(json.dumps(["day1.mp4", {"input": "day2.mp4", "output": "/x/2.mp4"}]))
+
+        assert collect_batch_inputs(text_manifest, "/out") == [
+            (str(tmp_path / "day1.mp4"), "/out/day1_nosilence.mp4"),
+            (str(tmp_path / "day2.mp4"), str(tmp_path / "done" / "day2.mp4")),
+        ]
+        assert collect_batch_inputs(json_manifest, "/out")[1] == (str(tmp_path / "day2.mp4"), "/x/2.mp4")
+
+    def test_collect_rejects_output_collisions(self: "TestBatchRemoval", tmp_path: Path) -> None:
+        """Test that two inputs with the same name are rejected.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        """
+        from asabaal_utils.video_processing.silence_detector import collect_batch_inputs
+
+        for folder in ["cam1", "cam2"]:
+            (tmp_path / folder).mkdir()
+            (tmp_path / folder / "take.mp4").write_bytes(b"")
+
+        with pytest.raises(ValueError):
+            collect_batch_inputs(str(tmp_path / "*" / "take.mp4"), "/out")
+        with pytest.raises(ValueError):
+            collect_batch_inputs(str(tmp_path / "*.mkv"), "/out")
+
+    def test_skips_up_to_date_outputs(
+        self: "TestBatchRemoval", tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that fresh outputs are skipped and failures are reported.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        monkeypatch : pytest.MonkeyPatch
+            Fixture used to replace the per-file silence removal
+        """
+        import json
+        import os
+        from asabaal_utils.video_processing import silence_detector
+
+        source: Path = tmp_path / "in"
+        output_dir: Path = tmp_path / "out"
+        source.mkdir()
+        output_dir.mkdir()
+        for name in ["fresh.mp4", "stale.mp4", "broken.mp4"]:
+            (source / name).write_bytes(b"")
+        (output_dir / "fresh_nosilence.mp4").write_bytes(b"")
+        (output_dir / "stale_nosilence.mp4").write_bytes(b"")
+        os.utime(output_dir / "stale_nosilence.mp4", (0, 0))
+
+        def fake_remove_silence(input_file: str, output_file: str, **options) -> tuple:
+            if "broken" in input_file:
+                Path(output_file).write_bytes(b"partial")
+                raise RuntimeError("corrupt input")
+            Path(output_file).write_bytes(b"video")
+            return 10.0, 7.5, 2.5
+
+        monkeypatch.setattr(silence_detector, "remove_silence", fake_remove_silence)
+        report_file: Path = tmp_path / "report.json"
+        report: dict = silence_detector.remove_silence_batch(
+            source, output_dir, jobs=1, report_file=report_file
+        )
+
+        statuses: dict = {Path(e["input_file"]).name: e["status"] for e in report["files"]}
+        assert statuses == {"broken.mp4": "failed", "fresh.mp4": "skipped", "stale.mp4": "success"}
+        assert (output_dir / "stale_nosilence.mp4").read_bytes() == b"video"
+        assert not (output_dir / "broken_nosilence.mp4").exists()
+        assert not list(output_dir.glob("*.partial.*"))
+        assert report["summary"]["time_saved"] == 2.5
+        assert json.loads(report_file.read_text())["summary"]["failed"] == 1
+
+    @requires_ffmpeg
+    @requires_ffprobe
+    def test_process_pool_batch(self: "TestBatchRemoval", tmp_path: Path) -> None:
+        """Test a batch of synthetic clips processed by two worker processes.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Temporary directory provided by pytest
+        """
+        import subprocess
+        from asabaal_utils.video_processing.silence_detector import remove_silence_batch
+
+        source: Path = tmp_path / "in"
+        source.mkdir()
+        for index in range(3):
+            subprocess.run([
+                "ffmpeg", "-v", "error", "-y",
+                "-f", "lavfi", "-i", "testsrc=size=160x120:rate=25:duration=6",
+                "-f", "lavfi", "-i", "sine=frequency=440:duration=6",
+                "-af", "volume=enable='between(t,2,4)':volume=0",
+                "-c:v", "libx264", "-c:a", "aac", "-shortest", str(source / f"clip{index}.mp4"),
+            ], check=True)
+
+        report: dict = remove_silence_batch(source, tmp_path / "out", jobs=2, render_mode="filter")
+
+        assert report["summary"]["processed"] == 3
+        for entry in report["files"]:
+            assert entry["time_saved"] == pytest.approx(1.8, abs=0.3)
+
+        rerun: dict = remove_silence_batch(source, tmp_path / "out", jobs=2)
+        assert rerun["summary"]["skipped"] == 3